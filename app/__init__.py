@@ -1,27 +1,105 @@
 """Flask application factory."""
 
 import os
-from flask import Flask
 from flask_cors import CORS
+from temporalio.common import WorkflowIDReusePolicy
 
+from app.admission import create_admission_controller
+from app.async_bridge import BridgedFlask, create_bridge
+from app.client_manager import ClientManager
 from app.config import Config
+from app.metrics import init_metrics
+from app.readiness import create_readiness_probe
+from app.result_cache import create_result_cache
+from app.tracing import init_tracing
+from app.visibility import RunVisibility
+from temporal.shared.converter import create_data_converter
+from temporal.shared.tracing import configure_tracing
 
 
-def create_app(config_class=Config):
+def create_app(config_class=Config, bridge=None):
     """Create and configure the Flask application.
 
     Args:
         config_class: Configuration class to use
+        bridge: AsyncBridge to run views on (defaults to a new background
+            loop; the ASGI entry point passes one attached to its own loop)
 
     Returns:
         Flask application instance
     """
-    app = Flask(__name__)
+    app = BridgedFlask(__name__)
     app.config.from_object(config_class)
 
+    if app.config['WORKFLOW_ID_MODE'] not in ('unique', 'params'):
+        raise ValueError(
+            f"WORKFLOW_ID_MODE must be 'unique' or 'params', "
+            f"not {app.config['WORKFLOW_ID_MODE']!r}"
+        )
+    if app.config['WORKFLOW_ID_REUSE_POLICY'] not in WorkflowIDReusePolicy.__members__:
+        raise ValueError(
+            f"Unknown WORKFLOW_ID_REUSE_POLICY "
+            f"{app.config['WORKFLOW_ID_REUSE_POLICY']!r}, expected one of "
+            f"{', '.join(WorkflowIDReusePolicy.__members__)}"
+        )
+
     # Enable CORS
     CORS(app)
 
+    # Request latency histograms and GET /metrics
+    if app.config['METRICS_ENABLED']:
+        init_metrics(app)
+
+    # Trace requests through workflow starts (TEMPORAL_TRACING_EXPORTER)
+    interceptors = configure_tracing('temporal-api')
+    if interceptors:
+        init_tracing(app)
+
+    # Persistent event loop that sync views submit coroutines to
+    if bridge is None:
+        bridge = create_bridge('temporal-bridge')
+    app.extensions['async_bridge'] = bridge
+
+    # One long-lived Temporal client per process, shared by all routes
+    clients = ClientManager(
+        app.config['TEMPORAL_ADDRESS'],
+        default_namespace=app.config['TEMPORAL_NAMESPACE'],
+        backoff_initial=app.config['TEMPORAL_CONNECT_BACKOFF_INITIAL'],
+        backoff_max=app.config['TEMPORAL_CONNECT_BACKOFF_MAX'],
+        interceptors=interceptors,
+        data_converter=create_data_converter(),
+    )
+    app.extensions['temporal_clients'] = clients
+    if app.config['TEMPORAL_WARM_CLIENT'] and bridge.is_running:
+        bridge.submit(clients.warm())
+
+    # Search attributes of started runs and the GET /api/runs page cache
+    visibility = RunVisibility(
+        app.config['TEMPORAL_NAMESPACE'],
+        cache_ttl=app.config['RUNS_CACHE_TTL'],
+        cache_size=app.config['RUNS_CACHE_SIZE'],
+    )
+    app.extensions['run_visibility'] = visibility
+
+    # Results of completed runs, which never change
+    app.extensions['result_cache'] = create_result_cache(app.config)
+
+    # Rate limits and wait cap of workflow launches
+    app.extensions['admission'] = create_admission_controller(app.config)
+
+    # Import workflows to ensure metadata is registered
+    import temporal.workflows  # noqa: F401
+
+    # Background checks of the server and worker pollers for GET /api/ready
+    readiness = create_readiness_probe(app.config)
+    app.extensions['readiness'] = readiness
+    if app.config['READY_ENABLED'] and bridge.is_running:
+        bridge.submit(readiness.run(clients))
+
+    # Register the search attributes of the catalog once, not per request
+    if app.config['RUN_SEARCH_ATTRIBUTES'] and bridge.is_running:
+        bridge.submit(visibility.register_search_attributes(clients))
+
     # Register blueprints
     from app.routes import main, api
     app.register_blueprint(main.bp)
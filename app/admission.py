@@ -0,0 +1,386 @@
+"""Admission control for workflow launches.
+
+Launches are rate limited with token buckets per workflow ID and per
+caller, and the number of requests waiting for a result is capped per
+process. Rejected requests get a 429 with ``Retry-After`` instead of
+piling up blocked requests and flooding the task queue; a batch larger
+than a bucket's burst gets a 413. Optionally the
+rates shrink while the workflow task backlog of the target task queue
+(read with ``DescribeTaskQueue``) is above a threshold.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from temporalio.api.enums.v1 import TaskQueueType
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueRequest
+
+from app.metrics import ADMISSION_REJECTIONS
+
+
+class AdmissionRejectedError(Exception):
+    """A launch was refused by admission control."""
+
+    def __init__(self, message: str, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            message: Error message for the client
+            retry_after: Seconds after which a retry may be admitted
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """``Retry-After`` value: whole seconds, at least 1."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class BatchTooLargeError(AdmissionRejectedError):
+    """A batch costs more tokens than a bucket holds; retrying won't help."""
+
+    def __init__(self, message: str):
+        """Initialize the error.
+
+        Args:
+            message: Error message for the client
+        """
+        super().__init__(message, retry_after=0.0)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated_at')
+
+    def __init__(self, rate: float, burst: float, now: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            now: Current ``time.monotonic()``
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = now
+
+    def refill(self, now: float, scale: float = 1.0) -> None:
+        """Add the tokens accrued since the last update.
+
+        Args:
+            now: Current ``time.monotonic()``
+            scale: Factor applied to the rate (backlog adaptation)
+        """
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate * scale)
+        self.updated_at = now
+
+    def wait_time(self, cost: float, scale: float = 1.0) -> float:
+        """Seconds until ``cost`` tokens are available (0 if they are now)."""
+        missing = cost - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / (self.rate * scale)
+
+
+class BacklogMonitor:
+    """Workflow task backlog of task queues, refreshed in the background.
+
+    Lookups never wait on Temporal: they return the factor computed from
+    the last known backlog and schedule a refresh on the running loop
+    when it is older than ``interval``.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        threshold: int,
+        interval: float = 5.0,
+        min_factor: float = 0.1,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            namespace: Namespace of the task queues
+            threshold: Backlog above which rates are scaled down
+            interval: Seconds between backlog refreshes per task queue
+            min_factor: Lowest factor applied to the rates
+        """
+        self.namespace = namespace
+        self.threshold = threshold
+        self.interval = interval
+        self.min_factor = min_factor
+        self._backlogs: Dict[str, int] = {}
+        self._refresh_at: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def backlog(self, task_queue: str) -> Optional[int]:
+        """Last known backlog of a task queue, or None if never read."""
+        return self._backlogs.get(task_queue)
+
+    def factor(self, clients, task_queue: str) -> float:
+        """Rate factor for a task queue, refreshing its backlog if stale.
+
+        Args:
+            clients: Client manager used for the refresh
+            task_queue: Task queue the launch goes to
+
+        Returns:
+            1.0 up to the threshold, ``threshold / backlog`` above it
+            (never below ``min_factor``)
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = now >= self._refresh_at.get(task_queue, 0.0)
+            if stale:
+                self._refresh_at[task_queue] = now + self.interval
+        if stale:
+            try:
+                task = asyncio.get_running_loop().create_task(
+                    self._refresh(clients, task_queue)
+                )
+            except RuntimeError:
+                pass
+            else:
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        backlog = self._backlogs.get(task_queue, 0)
+        if backlog <= self.threshold:
+            return 1.0
+        return max(self.min_factor, self.threshold / backlog)
+
+    async def _refresh(self, clients, task_queue: str) -> None:
+        """Read the approximate backlog of a task queue."""
+        try:
+            client = await clients.get_client(self.namespace)
+            response = await client.workflow_service.describe_task_queue(
+                DescribeTaskQueueRequest(
+                    namespace=self.namespace,
+                    task_queue=TaskQueue(name=task_queue),
+                    task_queue_type=TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW,
+                    include_task_queue_status=True,
+                )
+            )
+        except Exception as e:
+            # Keep the last value; the next refresh is already scheduled
+            clients.report_error(e, self.namespace)
+            return
+        self._backlogs[task_queue] = response.task_queue_status.backlog_count_hint
+
+
+class AdmissionController:
+    """Token-bucket rate limits and an in-flight wait cap for launches.
+
+    A rate of 0 disables that limit, as does a ``max_waits`` of 0. Buckets
+    are kept for the ``max_buckets`` most recently seen keys.
+    """
+
+    def __init__(
+        self,
+        workflow_rate: float = 0.0,
+        workflow_burst: float = 0.0,
+        caller_rate: float = 0.0,
+        caller_burst: float = 0.0,
+        max_waits: int = 0,
+        max_buckets: int = 10_000,
+        backlog: Optional[BacklogMonitor] = None,
+    ):
+        """Initialize the controller.
+
+        Args:
+            workflow_rate: Launches per second per workflow ID
+            workflow_burst: Launches per workflow ID allowed at once
+                (default: one second's worth)
+            caller_rate: Launches per second per caller
+            caller_burst: Launches per caller allowed at once
+            max_waits: Requests waiting for a result at once per process
+            max_buckets: Rate limit buckets kept in memory
+            backlog: Scale the rates down with the task queue backlog
+        """
+        self.workflow_rate = workflow_rate
+        self.workflow_burst = workflow_burst or max(workflow_rate, 1.0)
+        self.caller_rate = caller_rate
+        self.caller_burst = caller_burst or max(caller_rate, 1.0)
+        self.max_waits = max_waits
+        self.max_buckets = max_buckets
+        self.backlog = backlog
+        self._buckets: 'OrderedDict[Tuple[str, str], TokenBucket]' = OrderedDict()
+        self._waits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def waits_in_flight(self) -> int:
+        """Requests of this process currently waiting for a result."""
+        return self._waits
+
+    def admit(
+        self,
+        workflow_id: str,
+        caller: str,
+        cost: int = 1,
+        wait: bool = False,
+        task_queue: Optional[str] = None,
+        clients=None,
+    ):
+        """Admit a launch or refuse it.
+
+        Tokens are only taken when every limit admits the launch. A batch
+        pays one token per run; one larger than a bucket's burst can never
+        be admitted and is refused outright.
+
+        Args:
+            workflow_id: Workflow ID from the catalog
+            caller: Caller identity
+            cost: Number of runs launched (batches)
+            wait: The request waits for the result and needs a wait slot
+            task_queue: Task queue of the workflow, for backlog adaptation
+            clients: Client manager, for backlog adaptation
+
+        Returns:
+            Context manager holding the wait slot until exited (a no-op
+            when ``wait`` is false)
+
+        Raises:
+            BatchTooLargeError: If ``cost`` exceeds a burst
+            AdmissionRejectedError: If a limit is exceeded
+        """
+        scale = 1.0
+        if self.backlog is not None and task_queue and clients is not None:
+            scale = self.backlog.factor(clients, task_queue)
+
+        now = time.monotonic()
+        with self._lock:
+            if wait and self.max_waits and self._waits >= self.max_waits:
+                ADMISSION_REJECTIONS.labels(workflow_id, 'waits').inc()
+                raise AdmissionRejectedError(
+                    f'Too many requests waiting for results '
+                    f'({self.max_waits}); retry later or pass wait=false',
+                    retry_after=1.0,
+                )
+
+            limits = []
+            if self.workflow_rate > 0:
+                limits.append((
+                    'workflow',
+                    f'workflow "{workflow_id}"',
+                    self._bucket('workflow', workflow_id, self.workflow_rate,
+                                 self.workflow_burst, now),
+                ))
+            if self.caller_rate > 0:
+                limits.append((
+                    'caller',
+                    f'caller "{caller}"',
+                    self._bucket('caller', caller, self.caller_rate,
+                                 self.caller_burst, now),
+                ))
+            for kind, subject, bucket in limits:
+                if cost > bucket.burst:
+                    ADMISSION_REJECTIONS.labels(
+                        workflow_id, f'{kind}_burst'
+                    ).inc()
+                    raise BatchTooLargeError(
+                        f'{cost} launches exceed the burst of '
+                        f'{bucket.burst:g} for {subject}; split the batch'
+                    )
+                bucket.refill(now, scale)
+                retry_after = bucket.wait_time(cost, scale)
+                if retry_after > 0:
+                    ADMISSION_REJECTIONS.labels(
+                        workflow_id, f'{kind}_rate'
+                    ).inc()
+                    raise AdmissionRejectedError(
+                        f'Rate limit exceeded for {subject}',
+                        retry_after=retry_after,
+                    )
+            for _, _, bucket in limits:
+                bucket.tokens -= cost
+
+            if wait and self.max_waits:
+                self._waits += 1
+                return self._wait_slot()
+        return _no_slot()
+
+    @contextmanager
+    def _wait_slot(self) -> Iterator[None]:
+        """Release the wait slot taken by ``admit`` on exit."""
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._waits -= 1
+
+    def _bucket(
+        self, kind: str, key: str, rate: float, burst: float, now: float
+    ) -> TokenBucket:
+        """Get or create a bucket, evicting the least recently used."""
+        bucket_key = (kind, key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = TokenBucket(rate, burst, now)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(bucket_key)
+        return bucket
+
+
+@contextmanager
+def _no_slot() -> Iterator[None]:
+    """Stand-in for a wait slot when none is needed."""
+    yield
+
+
+def create_admission_controller(app_config) -> Optional[AdmissionController]:
+    """Create the admission controller configured in the Flask config.
+
+    Args:
+        app_config: Flask ``app.config``
+
+    Returns:
+        AdmissionController, or None when every limit is disabled
+    """
+    if not (
+        app_config['ADMISSION_WORKFLOW_RATE'] > 0
+        or app_config['ADMISSION_CALLER_RATE'] > 0
+        or app_config['ADMISSION_MAX_WAITS'] > 0
+    ):
+        return None
+    backlog = None
+    if app_config['ADMISSION_BACKLOG_THRESHOLD'] > 0:
+        backlog = BacklogMonitor(
+            app_config['TEMPORAL_NAMESPACE'],
+            threshold=app_config['ADMISSION_BACKLOG_THRESHOLD'],
+            interval=app_config['ADMISSION_BACKLOG_INTERVAL'],
+            min_factor=app_config['ADMISSION_BACKLOG_MIN_FACTOR'],
+        )
+    return AdmissionController(
+        workflow_rate=app_config['ADMISSION_WORKFLOW_RATE'],
+        workflow_burst=app_config['ADMISSION_WORKFLOW_BURST'],
+        caller_rate=app_config['ADMISSION_CALLER_RATE'],
+        caller_burst=app_config['ADMISSION_CALLER_BURST'],
+        max_waits=app_config['ADMISSION_MAX_WAITS'],
+        max_buckets=app_config['ADMISSION_MAX_BUCKETS'],
+        backlog=backlog,
+    )
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Get the admission controller of the current Flask app.
+
+    Returns:
+        AdmissionController, or None when disabled
+    """
+    from flask import current_app
+
+    return current_app.extensions.get('admission')
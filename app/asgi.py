@@ -0,0 +1,241 @@
+"""ASGI adapter that serves the Flask app's coroutine views natively."""
+
+import asyncio
+import sys
+from inspect import iscoroutinefunction
+from io import BytesIO
+from typing import List, Tuple
+
+from werkzeug.exceptions import HTTPException
+
+from app.async_bridge import AsyncBridge
+
+
+class AsgiApp:
+    """Serve a Flask app created by ``create_app`` over ASGI.
+
+    Requests that route to an ``async def`` view are dispatched on the
+    server's event loop inside a normal Flask request context, so views,
+    before/after request hooks and error handlers are shared with the WSGI
+    mode. Everything else (sync views, static files, routing errors) is
+    handed to the WSGI app in a worker thread and its response buffered.
+    """
+
+    def __init__(self, flask_app, bridge: AsyncBridge):
+        """Initialize the adapter.
+
+        Args:
+            flask_app: Flask application to serve
+            bridge: Unstarted AsyncBridge the app was created with; it is
+                attached to the server loop on startup
+        """
+        self.flask_app = flask_app
+        self.bridge = bridge
+
+    async def __call__(self, scope, receive, send):
+        """ASGI entry point."""
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise RuntimeError(f'Unsupported ASGI scope type: {scope["type"]}')
+
+        self._ensure_attached()
+        body = await self._read_body(receive)
+        environ = self._build_environ(scope, body)
+
+        view = self._match_async_view(environ)
+        if view is None:
+            loop = asyncio.get_running_loop()
+            status, headers, chunks = await loop.run_in_executor(
+                None, self._call_wsgi, environ
+            )
+            await send({
+                'type': 'http.response.start',
+                'status': status,
+                'headers': headers,
+            })
+            await send({'type': 'http.response.body', 'body': b''.join(chunks)})
+            return
+
+        await self._dispatch_async(environ, view, send)
+
+    def _ensure_attached(self) -> None:
+        """Attach the bridge to the running loop if lifespan did not."""
+        if not self.bridge.is_running:
+            self.bridge.attach(asyncio.get_running_loop())
+
+    async def _lifespan(self, receive, send) -> None:
+        """Handle ASGI lifespan startup and shutdown events."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._ensure_attached()
+                clients = self.flask_app.extensions['temporal_clients']
+                if self.flask_app.config['TEMPORAL_WARM_CLIENT']:
+                    asyncio.ensure_future(clients.warm())
+                if self.flask_app.config['RUN_SEARCH_ATTRIBUTES']:
+                    visibility = self.flask_app.extensions['run_visibility']
+                    asyncio.ensure_future(
+                        visibility.register_search_attributes(clients)
+                    )
+                if self.flask_app.config['READY_ENABLED']:
+                    self.flask_app.extensions['readiness'].ensure_running(clients)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.flask_app.extensions['readiness'].stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        """Read the complete request body."""
+        body = bytearray()
+        while True:
+            message = await receive()
+            body.extend(message.get('body', b''))
+            if not message.get('more_body', False):
+                return bytes(body)
+
+    @staticmethod
+    def _build_environ(scope, body: bytes) -> dict:
+        """Translate an ASGI HTTP scope into a WSGI environ."""
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        raw_path = scope.get('raw_path')
+        path = (
+            raw_path.split(b'?', 1)[0].decode('latin-1')
+            if raw_path else scope['path'].encode('utf-8').decode('latin-1')
+        )
+        root_path = scope.get('root_path', '')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+            'PATH_INFO': path,
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f'HTTP/{scope.get("http_version", "1.1")}',
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+
+        for raw_name, raw_value in scope.get('headers', []):
+            name = raw_name.decode('latin-1').upper().replace('-', '_')
+            value = raw_value.decode('latin-1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+                continue
+            if name == 'CONTENT_LENGTH':
+                continue
+            key = f'HTTP_{name}'
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+
+        return environ
+
+    def _match_async_view(self, environ: dict):
+        """Return the coroutine view the request routes to, if any."""
+        adapter = self.flask_app.url_map.bind_to_environ(
+            environ, server_name=self.flask_app.config['SERVER_NAME']
+        )
+        try:
+            endpoint, _ = adapter.match()
+        except HTTPException:
+            return None
+
+        view = self.flask_app.view_functions.get(endpoint)
+        return view if iscoroutinefunction(view) else None
+
+    async def _dispatch_async(self, environ: dict, view, send) -> None:
+        """Run a coroutine view on this loop and send its response."""
+        app = self.flask_app
+        ctx = app.request_context(environ)
+        ctx.push()
+        try:
+            try:
+                rv = app.preprocess_request()
+                if rv is None:
+                    rv = await view(**ctx.request.view_args)
+                response = app.finalize_request(rv)
+            except Exception as e:
+                try:
+                    response = app.finalize_request(app.handle_user_exception(e))
+                except Exception as unhandled:
+                    response = app.handle_exception(unhandled)
+
+            await send({
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': [
+                    (name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in response.headers.items()
+                ],
+            })
+
+            if hasattr(response.response, '__aiter__'):
+                async for chunk in response.response:
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode('utf-8')
+                    await send({
+                        'type': 'http.response.body',
+                        'body': chunk,
+                        'more_body': True,
+                    })
+            else:
+                for chunk in response.iter_encoded():
+                    await send({
+                        'type': 'http.response.body',
+                        'body': chunk,
+                        'more_body': True,
+                    })
+            await send({'type': 'http.response.body', 'body': b''})
+            response.close()
+        finally:
+            ctx.pop()
+
+    def _call_wsgi(self, environ: dict) -> Tuple[int, List, List[bytes]]:
+        """Run the WSGI app synchronously and buffer its response."""
+        response_start = {}
+
+        def start_response(status, headers, exc_info=None):
+            response_start['status'] = int(status.split(' ', 1)[0])
+            response_start['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+
+        result = self.flask_app.wsgi_app(environ, start_response)
+        try:
+            chunks = list(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+        return response_start['status'], response_start['headers'], chunks
+
+
+def create_asgi_app(config_class):
+    """Create the Flask app and wrap it for ASGI serving.
+
+    Args:
+        config_class: Configuration class to use
+
+    Returns:
+        ASGI application
+    """
+    from app import create_app
+
+    bridge = AsyncBridge('asgi')
+    flask_app = create_app(config_class, bridge=bridge)
+    return AsgiApp(flask_app, bridge)
@@ -0,0 +1,227 @@
+"""Bridge between sync Flask views and a persistent asyncio event loop."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional
+
+from flask import Flask, Response
+
+
+class AsyncBridge:
+    """Run coroutines on one long-lived event loop in a background thread.
+
+    Flask views are synchronous, so instead of building a fresh loop with
+    ``asyncio.run`` on every request they submit coroutines here and wait on
+    the result. Async resources such as Temporal clients and handles stay
+    bound to this loop and can be reused across requests.
+
+    Under an ASGI server the bridge is attached to the server's loop instead
+    of owning a thread, so the same resources live on that loop.
+    """
+
+    def __init__(self, name: str = 'async-bridge'):
+        """Initialize the bridge.
+
+        Args:
+            name: Name of the background thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop used by the bridge, started on first access."""
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the bridge has a loop to run coroutines on."""
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> None:
+        """Start the background loop thread if it is not running."""
+        with self._lock:
+            if self._loop is not None and self._thread is None:
+                # Attached to an externally owned loop
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run_loop, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Use an already running loop (e.g. an ASGI server's) for all work.
+
+        Args:
+            loop: Running event loop owned by the caller
+        """
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError('Bridge already owns a background loop')
+            self._loop = loop
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future resolved with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before giving up (None waits forever)
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            TimeoutError: If the coroutine did not finish in time
+            RuntimeError: If called from the bridge's own loop
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is self._loop:
+            coro.close()
+            raise RuntimeError('AsyncBridge.run() would block its own loop')
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f'Operation did not complete within {timeout}s'
+            ) from None
+
+    def iterate(
+        self, agen: AsyncIterator, timeout: Optional[float] = None
+    ) -> Iterator:
+        """Consume an async generator on the loop from sync code.
+
+        Args:
+            agen: Async generator to consume
+            timeout: Seconds to wait for each item
+
+        Yields:
+            Items produced by the async generator
+        """
+        async def _next():
+            return await agen.__anext__()
+
+        async def _close():
+            await agen.aclose()
+
+        finished = False
+        try:
+            while True:
+                try:
+                    yield self.run(_next(), timeout)
+                except StopAsyncIteration:
+                    finished = True
+                    return
+        finally:
+            # Consumer stopped early, e.g. a client disconnect
+            if not finished:
+                self.submit(_close())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and join the background thread.
+
+        An attached external loop is only detached, never stopped.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+class BridgedFlask(Flask):
+    """Flask app that runs ``async def`` views on the app's AsyncBridge.
+
+    Views are written as coroutines once and shared by both serving modes:
+    under WSGI they are executed here on the bridge loop, under ASGI
+    (see ``app.asgi``) they are awaited directly on the server loop.
+    """
+
+    def ensure_sync(self, func):
+        """Wrap coroutine functions so they run on the bridge loop."""
+        if not iscoroutinefunction(func):
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bridge = self.extensions['async_bridge']
+            timeout = self.config['ASYNC_BRIDGE_TIMEOUT']
+            rv = bridge.run(func(*args, **kwargs), timeout=timeout)
+
+            # Stream async bodies by pulling each chunk through the bridge
+            if isinstance(rv, Response) and hasattr(rv.response, '__anext__'):
+                rv.response = bridge.iterate(rv.response, timeout=timeout)
+            return rv
+
+        return wrapper
+
+
+def create_bridge(name: str = 'async-bridge') -> AsyncBridge:
+    """Create and start a bridge that is stopped at interpreter exit.
+
+    Args:
+        name: Name of the background thread
+
+    Returns:
+        Running AsyncBridge
+    """
+    bridge = AsyncBridge(name)
+    bridge.start()
+    atexit.register(bridge.stop)
+    return bridge
+
+
+def get_bridge() -> AsyncBridge:
+    """Get the async bridge of the current Flask app.
+
+    Returns:
+        AsyncBridge created by the application factory
+    """
+    from flask import current_app
+
+    return current_app.extensions['async_bridge']
@@ -0,0 +1,183 @@
+"""Shared Temporal client management for the Flask app."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from temporalio.client import Client
+from temporalio.converter import DataConverter
+from temporalio.service import RPCError, RPCStatusCode
+
+from app.metrics import CLIENT_CONNECT_LATENCY
+from temporal.shared.tracing import span
+
+
+class TemporalUnavailableError(ConnectionError):
+    """Raised while the Temporal server is unreachable and in backoff."""
+
+
+class ClientManager:
+    """Keep one long-lived Temporal client per namespace.
+
+    Clients are connected lazily on first use and then reused by every
+    request. When a connection attempt fails, further attempts are refused
+    with exponential backoff so a dead server is not hammered by each
+    incoming request. Clients are meant to be used from a single event
+    loop, normally the one owned by ``AsyncBridge``.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        default_namespace: str = 'default',
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30.0,
+        interceptors: Sequence = (),
+        data_converter: Optional[DataConverter] = None,
+    ):
+        """Initialize the client manager.
+
+        Args:
+            address: Temporal frontend address (host:port)
+            default_namespace: Namespace used when none is given
+            backoff_initial: First reconnect delay in seconds
+            backoff_max: Upper bound for the reconnect delay in seconds
+            interceptors: Client interceptors (e.g. tracing)
+            data_converter: Data converter shared with the worker
+                (default: temporalio's default converter)
+        """
+        self.address = address
+        self.default_namespace = default_namespace
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.interceptors = list(interceptors)
+        self.data_converter = data_converter or DataConverter.default
+
+        self._lock = threading.Lock()
+        self._clients: Dict[str, Client] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+
+    async def get_client(self, namespace: Optional[str] = None) -> Client:
+        """Get the shared client for a namespace, connecting if needed.
+
+        Args:
+            namespace: Namespace to connect to (defaults to the manager's)
+
+        Returns:
+            Connected Temporal client
+
+        Raises:
+            TemporalUnavailableError: If the server is in reconnect backoff
+            RPCError: If the connection attempt fails
+        """
+        namespace = namespace or self.default_namespace
+
+        client = self._clients.get(namespace)
+        if client is not None:
+            return client
+
+        # Concurrent requests on the loop wait for one connect attempt
+        lock = self._connect_locks.setdefault(namespace, asyncio.Lock())
+        async with lock:
+            with self._lock:
+                client = self._clients.get(namespace)
+                if client is not None:
+                    return client
+                retry_at = self._retry_at.get(namespace, 0.0)
+
+            remaining = retry_at - time.monotonic()
+            if remaining > 0:
+                raise TemporalUnavailableError(
+                    f'Temporal server at {self.address} is unavailable, '
+                    f'retrying in {remaining:.1f}s'
+                )
+
+            started_at = time.perf_counter()
+            try:
+                with span('temporal.connect', namespace=namespace):
+                    client = await Client.connect(
+                        self.address,
+                        namespace=namespace,
+                        interceptors=self.interceptors,
+                        data_converter=self.data_converter,
+                    )
+            except Exception:
+                CLIENT_CONNECT_LATENCY.labels(namespace, 'failure').observe(
+                    time.perf_counter() - started_at
+                )
+                self._record_failure(namespace)
+                raise
+            CLIENT_CONNECT_LATENCY.labels(namespace, 'success').observe(
+                time.perf_counter() - started_at
+            )
+
+            with self._lock:
+                self._clients[namespace] = client
+                self._failures.pop(namespace, None)
+                self._retry_at.pop(namespace, None)
+            return client
+
+    async def warm(self, namespace: Optional[str] = None) -> bool:
+        """Connect ahead of the first request, ignoring failures.
+
+        Args:
+            namespace: Namespace to connect to
+
+        Returns:
+            True if a client is connected
+        """
+        try:
+            await self.get_client(namespace)
+        except Exception:
+            return False
+        return True
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop the cached client so the next request reconnects.
+
+        Args:
+            namespace: Namespace whose client should be dropped
+        """
+        namespace = namespace or self.default_namespace
+        with self._lock:
+            self._clients.pop(namespace, None)
+
+    def report_error(
+        self, error: BaseException, namespace: Optional[str] = None
+    ) -> None:
+        """Invalidate the client if an error means the server went away.
+
+        Args:
+            error: Exception raised while using a client
+            namespace: Namespace the client belongs to
+        """
+        if isinstance(error, RPCError) and error.status in (
+            RPCStatusCode.UNAVAILABLE,
+            RPCStatusCode.UNKNOWN,
+        ):
+            self.invalidate(namespace)
+
+    def _record_failure(self, namespace: str) -> None:
+        """Schedule the next allowed connection attempt."""
+        with self._lock:
+            failures = self._failures.get(namespace, 0) + 1
+            self._failures[namespace] = failures
+            delay = min(
+                self.backoff_initial * (2 ** (failures - 1)),
+                self.backoff_max,
+            )
+            self._retry_at[namespace] = time.monotonic() + delay
+
+
+def get_client_manager() -> ClientManager:
+    """Get the client manager of the current Flask app.
+
+    Returns:
+        ClientManager created by the application factory
+    """
+    from flask import current_app
+
+    return current_app.extensions['temporal_clients']
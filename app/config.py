@@ -17,6 +17,111 @@ class Config:
     # Temporal configuration
     TEMPORAL_ADDRESS = os.environ.get('TEMPORAL_ADDRESS', 'localhost:7233')
     TEMPORAL_TASK_QUEUE = os.environ.get('TEMPORAL_TASK_QUEUE', 'test-task-queue')
+    TEMPORAL_NAMESPACE = os.environ.get('TEMPORAL_NAMESPACE', 'default')
+
+    # Shared client reconnect backoff (seconds)
+    TEMPORAL_CONNECT_BACKOFF_INITIAL = float(
+        os.environ.get('TEMPORAL_CONNECT_BACKOFF_INITIAL', 0.5)
+    )
+    TEMPORAL_CONNECT_BACKOFF_MAX = float(
+        os.environ.get('TEMPORAL_CONNECT_BACKOFF_MAX', 30)
+    )
+    TEMPORAL_WARM_CLIENT = (
+        os.environ.get('TEMPORAL_WARM_CLIENT', 'True').lower() == 'true'
+    )
+
+    # Serve Prometheus metrics on GET /metrics
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+
+    # Seconds a sync view waits on a coroutine run on the async bridge
+    ASYNC_BRIDGE_TIMEOUT = float(os.environ.get('ASYNC_BRIDGE_TIMEOUT', 330))
+
+    # Upper bound (seconds) for long-polling GET /api/runs/<id>/result
+    RESULT_LONG_POLL_MAX = float(os.environ.get('RESULT_LONG_POLL_MAX', 30))
+
+    # Completed results served by GET /api/runs/<id>/result without
+    # fetching history: in-memory LRU bounded by entries and bytes, plus an
+    # optional SQLite file shared by the API processes of a host
+    RESULT_CACHE_ENABLED = (
+        os.environ.get('RESULT_CACHE_ENABLED', 'True').lower() == 'true'
+    )
+    RESULT_CACHE_MAX_ENTRIES = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 10000))
+    RESULT_CACHE_MAX_BYTES = int(
+        os.environ.get('RESULT_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+    )
+    RESULT_CACHE_DISK_PATH = os.environ.get('RESULT_CACHE_DISK_PATH', '')
+    RESULT_CACHE_DISK_MAX_ENTRIES = int(
+        os.environ.get('RESULT_CACHE_DISK_MAX_ENTRIES', 100000)
+    )
+    RESULT_CACHE_DISK_TTL = float(
+        os.environ.get('RESULT_CACHE_DISK_TTL', 7 * 24 * 3600)
+    )
+
+    # Workflow IDs of started runs: 'unique' (timestamp plus random suffix)
+    # or 'params' (hash of the parameters, so repeated requests with the
+    # same parameters attach to one run). An Idempotency-Key header always
+    # takes precedence.
+    WORKFLOW_ID_MODE = os.environ.get('WORKFLOW_ID_MODE', 'unique').lower()
+
+    # temporalio WorkflowIDReusePolicy applied to idempotent starts
+    WORKFLOW_ID_REUSE_POLICY = os.environ.get(
+        'WORKFLOW_ID_REUSE_POLICY', 'ALLOW_DUPLICATE_FAILED_ONLY'
+    ).upper()
+
+    # GET /api/runs: default and maximum page size, and seconds a page is
+    # cached (0 disables the cache) for up to RUNS_CACHE_SIZE pages
+    RUNS_PAGE_SIZE = int(os.environ.get('RUNS_PAGE_SIZE', 50))
+    RUNS_PAGE_SIZE_MAX = int(os.environ.get('RUNS_PAGE_SIZE_MAX', 500))
+    RUNS_CACHE_TTL = float(os.environ.get('RUNS_CACHE_TTL', 5))
+    RUNS_CACHE_SIZE = int(os.environ.get('RUNS_CACHE_SIZE', 256))
+
+    # Register search attributes (catalog workflow ID, parameters declared
+    # "searchable": true) at startup and set them on started runs so
+    # GET /api/runs can filter on them
+    RUN_SEARCH_ATTRIBUTES = (
+        os.environ.get('RUN_SEARCH_ATTRIBUTES', 'False').lower() == 'true'
+    )
+
+    # Admission control of launches (POST /api/workflows/<id>/run and
+    # run-batch): token buckets per workflow ID and per caller (launches per
+    # second, 0 disables; burst defaults to one second's worth) and a cap on
+    # requests waiting for a result per process. Refused launches get a 429
+    # with Retry-After. Callers are identified by the client address, or by
+    # ADMISSION_CALLER_HEADER when set; only set it when a trusted proxy
+    # overwrites that header, since clients can send any value.
+    ADMISSION_WORKFLOW_RATE = float(os.environ.get('ADMISSION_WORKFLOW_RATE', 0))
+    ADMISSION_WORKFLOW_BURST = float(os.environ.get('ADMISSION_WORKFLOW_BURST', 0))
+    ADMISSION_CALLER_RATE = float(os.environ.get('ADMISSION_CALLER_RATE', 0))
+    ADMISSION_CALLER_BURST = float(os.environ.get('ADMISSION_CALLER_BURST', 0))
+    ADMISSION_CALLER_HEADER = os.environ.get('ADMISSION_CALLER_HEADER', '')
+    ADMISSION_MAX_WAITS = int(os.environ.get('ADMISSION_MAX_WAITS', 512))
+    ADMISSION_MAX_BUCKETS = int(os.environ.get('ADMISSION_MAX_BUCKETS', 10000))
+
+    # Scale the rates down while the workflow task backlog of the target
+    # task queue exceeds ADMISSION_BACKLOG_THRESHOLD (0 disables), to
+    # threshold/backlog but not below ADMISSION_BACKLOG_MIN_FACTOR. The
+    # backlog is refreshed every ADMISSION_BACKLOG_INTERVAL seconds.
+    ADMISSION_BACKLOG_THRESHOLD = int(os.environ.get('ADMISSION_BACKLOG_THRESHOLD', 0))
+    ADMISSION_BACKLOG_INTERVAL = float(os.environ.get('ADMISSION_BACKLOG_INTERVAL', 5))
+    ADMISSION_BACKLOG_MIN_FACTOR = float(
+        os.environ.get('ADMISSION_BACKLOG_MIN_FACTOR', 0.1)
+    )
+
+    # GET /api/ready: whether the background checks run (when off the
+    # endpoint answers 503), seconds between checks of the server and
+    # the pollers of READY_TASK_QUEUES (comma separated names or queue
+    # classes; default: the task queues of the workflow catalog), the
+    # timeout of each check and how recently a poller must have polled
+    # to count
+    READY_ENABLED = os.environ.get('READY_ENABLED', 'True').lower() == 'true'
+    READY_TASK_QUEUES = os.environ.get('READY_TASK_QUEUES', '')
+    READY_CHECK_INTERVAL = float(os.environ.get('READY_CHECK_INTERVAL', 5))
+    READY_CHECK_TIMEOUT = float(os.environ.get('READY_CHECK_TIMEOUT', 2))
+    READY_POLLER_MAX_AGE = float(os.environ.get('READY_POLLER_MAX_AGE', 90))
+
+    # POST /api/workflows/<id>/run-batch limits
+    BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', 1000))
+    BATCH_MAX_CONCURRENCY = int(os.environ.get('BATCH_MAX_CONCURRENCY', 50))
 
 
 class DevelopmentConfig(Config):
@@ -0,0 +1,126 @@
+"""Prometheus metrics of the Flask API."""
+
+import os
+import time
+
+from flask import Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+REQUEST_LATENCY = Histogram(
+    'api_request_duration_seconds',
+    'Time to produce a response, per route and workflow',
+    ['method', 'route', 'workflow'],
+)
+REQUESTS = Counter(
+    'api_requests_total',
+    'Responses sent, per route, workflow and status code',
+    ['method', 'route', 'workflow', 'status'],
+)
+WORKFLOW_STARTS = Counter(
+    'api_workflow_starts_total',
+    'Workflow starts; outcome is "started" or "deduplicated"',
+    ['workflow', 'outcome'],
+)
+WORKFLOW_FAILURES = Counter(
+    'api_workflow_failures_total',
+    'Failed workflow starts and result waits, by exception type',
+    ['workflow', 'stage', 'error'],
+)
+RESULT_WAITS_IN_FLIGHT = Gauge(
+    'api_workflow_result_waits_in_flight',
+    'Requests currently waiting for a workflow result',
+    ['workflow'],
+    multiprocess_mode='livesum',
+)
+RESULT_CACHE_LOOKUPS = Counter(
+    'api_result_cache_lookups_total',
+    'Completed-result cache lookups; outcome is "memory_hit", "disk_hit" or "miss"',
+    ['outcome'],
+)
+ADMISSION_REJECTIONS = Counter(
+    'api_admission_rejections_total',
+    'Launches refused with 429 or 413; reason is "workflow_rate", '
+    '"caller_rate", "waits", "workflow_burst" or "caller_burst"',
+    ['workflow', 'reason'],
+)
+CLIENT_CONNECT_LATENCY = Histogram(
+    'temporal_client_connect_seconds',
+    'Time to connect the shared Temporal client',
+    ['namespace', 'outcome'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+def record_failure(workflow: str, stage: str, error: BaseException) -> None:
+    """Count a failed workflow start or result wait.
+
+    Args:
+        workflow: Workflow ID from the catalog
+        stage: ``start`` or ``result``
+        error: Exception that was raised
+    """
+    WORKFLOW_FAILURES.labels(workflow, stage, type(error).__name__).inc()
+
+
+def _request_labels():
+    """Route template and workflow ID labels of the current request.
+
+    Only catalog workflow IDs become labels; any other ID in the URL is
+    reported as ``unknown``, so requests cannot grow the label set.
+    """
+    from temporal.workflow_metadata import get_workflow_metadata
+
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    workflow = (request.view_args or {}).get('workflow_id', '')
+    if workflow and get_workflow_metadata(workflow) is None:
+        workflow = 'unknown'
+    return request.method, route, workflow
+
+
+def _start_timer():
+    """Remember when the request started."""
+    g.metrics_started_at = time.perf_counter()
+
+
+def _observe_request(response):
+    """Record the latency and status of a finished request."""
+    started_at = g.pop('metrics_started_at', None)
+    if started_at is not None:
+        labels = _request_labels()
+        REQUEST_LATENCY.labels(*labels).observe(time.perf_counter() - started_at)
+        REQUESTS.labels(*labels, str(response.status_code)).inc()
+    return response
+
+
+def metrics_view():
+    """Expose the metrics in the Prometheus text format.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set (several server processes), the
+    samples of all processes are aggregated.
+    """
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app) -> None:
+    """Instrument the app's requests and serve ``GET /metrics``.
+
+    Args:
+        app: Flask application
+    """
+    app.before_request(_start_timer)
+    app.after_request(_observe_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
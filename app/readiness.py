@@ -0,0 +1,215 @@
+"""Readiness checks of the Temporal server and the worker pollers.
+
+``GET /api/ready`` answers from the last result of a background loop, so
+load balancer probes never wait on (or add load to) Temporal. The loop
+checks that the server answers health checks over the shared client and
+that workers recently polled each task queue the API launches on.
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Sequence
+
+from temporalio.api.enums.v1 import TaskQueueType
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueRequest
+
+
+class ReadinessProbe:
+    """Periodically check Temporal and cache whether the API is ready.
+
+    The API is ready when the server is reachable and every checked task
+    queue has at least one workflow poller seen within ``poller_max_age``.
+    A result older than three intervals (the loop stopped) is not ready.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        task_queues: Sequence[str],
+        interval: float = 5.0,
+        timeout: float = 2.0,
+        poller_max_age: float = 90.0,
+    ):
+        """Initialize the probe.
+
+        Args:
+            namespace: Namespace of the task queues
+            task_queues: Task queues that must have pollers
+            interval: Seconds between checks
+            timeout: Seconds each Temporal call may take
+            poller_max_age: Seconds since a poller's last poll for it to
+                count; idle workers re-poll about once a minute
+        """
+        self.namespace = namespace
+        self.task_queues = list(task_queues)
+        self.interval = interval
+        self.timeout = timeout
+        self.poller_max_age = poller_max_age
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def ensure_running(self, clients) -> None:
+        """Start the background loop on the running event loop if needed.
+
+        Args:
+            clients: Client manager whose shared client is checked
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self.run(clients)
+            )
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def run(self, clients) -> None:
+        """Check every ``interval`` seconds until cancelled.
+
+        Args:
+            clients: Client manager whose shared client is checked
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.current_task()
+        while True:
+            await self.check(clients)
+            await asyncio.sleep(self.interval)
+
+    async def check(self, clients) -> Dict[str, Any]:
+        """Run the checks once and cache the result.
+
+        Args:
+            clients: Client manager whose shared client is checked
+
+        Returns:
+            Result as served by ``GET /api/ready``
+        """
+        server = await self._check_server(clients)
+        task_queues = {}
+        if server['ok']:
+            task_queues = dict(zip(
+                self.task_queues,
+                await asyncio.gather(*(
+                    self._check_task_queue(clients, queue)
+                    for queue in self.task_queues
+                )),
+            ))
+        ready = server['ok'] and all(
+            queue['ok'] for queue in task_queues.values()
+        )
+        self._result = {
+            'ready': ready,
+            'checked_at': datetime.now(timezone.utc).isoformat(),
+            'checks': {'server': server, 'task_queues': task_queues},
+        }
+        self._checked_at = time.monotonic()
+        return self._result
+
+    def status(self) -> Dict[str, Any]:
+        """Get the cached result without calling Temporal.
+
+        Returns:
+            Last result, or a not-ready result before the first check or
+            once the last one is stale
+        """
+        if self._result is None:
+            return {'ready': False, 'reason': 'Readiness not checked yet'}
+        age = time.monotonic() - self._checked_at
+        if age > 3 * self.interval:
+            return {
+                **self._result,
+                'ready': False,
+                'reason': f'Last readiness check is {age:.1f}s old',
+            }
+        return self._result
+
+    async def _check_server(self, clients) -> Dict[str, Any]:
+        """Check that the server answers a health check."""
+        started_at = time.perf_counter()
+        try:
+            client = await clients.get_client(self.namespace)
+            healthy = await client.service_client.check_health(
+                timeout=timedelta(seconds=self.timeout)
+            )
+        except Exception as e:
+            clients.report_error(e, self.namespace)
+            return {'ok': False, 'error': str(e)}
+        return {
+            'ok': bool(healthy),
+            'latency_ms': round((time.perf_counter() - started_at) * 1000, 1),
+        }
+
+    async def _check_task_queue(self, clients, task_queue: str) -> Dict[str, Any]:
+        """Count the workflow pollers recently seen on a task queue."""
+        try:
+            client = await clients.get_client(self.namespace)
+            response = await client.workflow_service.describe_task_queue(
+                DescribeTaskQueueRequest(
+                    namespace=self.namespace,
+                    task_queue=TaskQueue(name=task_queue),
+                    task_queue_type=TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW,
+                ),
+                timeout=timedelta(seconds=self.timeout),
+            )
+        except Exception as e:
+            clients.report_error(e, self.namespace)
+            return {'ok': False, 'error': str(e)}
+
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            seconds=self.poller_max_age
+        )
+        pollers = [
+            poller for poller in response.pollers
+            if not poller.HasField('last_access_time')
+            or poller.last_access_time.ToDatetime(timezone.utc) >= cutoff
+        ]
+        return {'ok': bool(pollers), 'pollers': len(pollers)}
+
+
+def create_readiness_probe(app_config) -> ReadinessProbe:
+    """Create the readiness probe configured in the Flask config.
+
+    Args:
+        app_config: Flask ``app.config``
+
+    Returns:
+        ReadinessProbe checking ``READY_TASK_QUEUES`` (default: the task
+        queues of the workflow catalog)
+    """
+    from temporal.config import config
+    from temporal.workflow_metadata import get_catalog
+
+    task_queues = [
+        config.resolve_task_queue(queue.strip())
+        for queue in app_config['READY_TASK_QUEUES'].split(',')
+        if queue.strip()
+    ] or sorted({
+        workflow.task_queue for workflow in get_catalog().workflows
+    }) or [config.DEFAULT_TASK_QUEUE]
+    return ReadinessProbe(
+        app_config['TEMPORAL_NAMESPACE'],
+        task_queues,
+        interval=app_config['READY_CHECK_INTERVAL'],
+        timeout=app_config['READY_CHECK_TIMEOUT'],
+        poller_max_age=app_config['READY_POLLER_MAX_AGE'],
+    )
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Get the readiness probe of the current Flask app.
+
+    Returns:
+        ReadinessProbe created by the application factory
+    """
+    from flask import current_app
+
+    return current_app.extensions['readiness']
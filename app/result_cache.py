@@ -0,0 +1,175 @@
+"""Cache of completed workflow results in the API process.
+
+A run's result never changes once it completed, so it is served from
+memory (and optionally from a host-wide SQLite file) instead of fetching
+the workflow history again. Entries are keyed by workflow ID *and* run
+ID, so a workflow ID reused by a later run (any reuse policy but
+``REJECT_DUPLICATE`` allows that) never gets an older run's result.
+The disk tier stores results as JSON; results JSON cannot represent
+(e.g. bytes) are only kept in memory.
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.metrics import RESULT_CACHE_LOOKUPS
+from temporal.shared.activity_cache import DiskCache
+
+
+def _dumps_json(value: Any) -> bytes:
+    """Serialize a result for the disk tier, rejecting non-JSON values."""
+    return json.dumps(value, allow_nan=False, separators=(',', ':')).encode()
+
+
+def _result_size(value: Any) -> int:
+    """Approximate memory footprint of a result: its JSON length."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class ResultCache:
+    """LRU of completed results bounded by entries and total bytes.
+
+    A miss in memory falls through to the optional disk tier, whose hits
+    are promoted back into memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk: Optional[DiskCache] = None,
+        disk_ttl: float = 7 * 24 * 3600,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Results kept in memory at most
+            max_bytes: Total size of the results kept in memory; larger
+                single results are only written to disk
+            disk: Optional disk tier shared by the API processes of a host
+            disk_ttl: Seconds results stay in the disk tier
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.disk_ttl = disk_ttl
+        self._entries: 'OrderedDict[str, Tuple[int, Any]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Bytes of results currently held in memory."""
+        return self._bytes
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a result.
+
+        Args:
+            key: Cache key of the run
+
+        Returns:
+            ``(True, result)`` on a hit, ``(False, None)`` otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            RESULT_CACHE_LOOKUPS.labels('memory_hit').inc()
+            return True, entry[1]
+
+        if self.disk is not None:
+            found, value = await asyncio.to_thread(self.disk.get, key)
+            if found:
+                RESULT_CACHE_LOOKUPS.labels('disk_hit').inc()
+                self._remember(key, value)
+                return True, value
+
+        RESULT_CACHE_LOOKUPS.labels('miss').inc()
+        return False, None
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store the result of a completed run.
+
+        Args:
+            key: Cache key of the run
+            value: Workflow result
+        """
+        self._remember(key, value)
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(
+                    self.disk.set, key, value, self.disk_ttl
+                )
+            except (TypeError, ValueError):
+                # Not representable as JSON; served from memory only
+                pass
+
+    def clear(self) -> None:
+        """Drop the results held in memory."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Put a result in the memory tier, evicting the least recently used."""
+        size = _result_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[0]
+            self._entries[key] = (size, value)
+            self._bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self._bytes > self.max_bytes
+            ):
+                _, (evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+
+def create_result_cache(app_config) -> Optional[ResultCache]:
+    """Create the result cache configured in the Flask config.
+
+    Args:
+        app_config: Flask ``app.config``
+
+    Returns:
+        ResultCache, or None when ``RESULT_CACHE_ENABLED`` is off
+    """
+    if not app_config['RESULT_CACHE_ENABLED']:
+        return None
+    disk = None
+    if app_config['RESULT_CACHE_DISK_PATH']:
+        disk = DiskCache(
+            app_config['RESULT_CACHE_DISK_PATH'],
+            maxsize=app_config['RESULT_CACHE_DISK_MAX_ENTRIES'],
+            dumps=_dumps_json,
+            loads=json.loads,
+        )
+    return ResultCache(
+        max_entries=app_config['RESULT_CACHE_MAX_ENTRIES'],
+        max_bytes=app_config['RESULT_CACHE_MAX_BYTES'],
+        disk=disk,
+        disk_ttl=app_config['RESULT_CACHE_DISK_TTL'],
+    )
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Get the result cache of the current Flask app.
+
+    Returns:
+        ResultCache, or None when disabled
+    """
+    from flask import current_app
+
+    return current_app.extensions.get('result_cache')
@@ -1,147 +1,787 @@
 """API routes blueprint."""
 
 import asyncio
+import contextlib
+import hashlib
+import json
+import secrets
 import time
-from flask import Blueprint, jsonify, request
-from temporalio.client import Client
-from temporalio.service import RPCError
-from temporal.config import config
+from typing import Optional
+from flask import Blueprint, Response, current_app, jsonify, request, url_for
+from temporalio.client import WorkflowExecutionStatus, WorkflowFailureError
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
+from app.admission import (
+    AdmissionRejectedError,
+    BatchTooLargeError,
+    get_admission_controller,
+)
+from app.client_manager import TemporalUnavailableError, get_client_manager
+from app.metrics import (
+    RESULT_WAITS_IN_FLIGHT,
+    WORKFLOW_STARTS,
+    record_failure,
+)
+from app.readiness import get_readiness_probe
+from app.result_cache import get_result_cache
+from app.visibility import (
+    build_query,
+    decode_cursor,
+    fetch_runs_page,
+    get_run_visibility,
+    parse_statuses,
+    parse_time,
+    start_search_attributes,
+)
 from temporal.workflow_metadata import (
-    get_all_workflow_metadata,
+    ParameterError,
+    get_catalog,
     get_workflow_metadata,
 )
 
 
 bp = Blueprint('api', __name__)
 
+# Memo key recording the parameters an idempotent run was started with
+REQUEST_HASH_MEMO = 'request_hash'
+
+
+class IdempotencyConflictError(Exception):
+    """An Idempotency-Key was reused with different parameters."""
+
+
+@bp.errorhandler(TimeoutError)
+def handle_timeout(error):
+    """Answer 504 when a view did not finish within ASYNC_BRIDGE_TIMEOUT."""
+    return _error(str(error), 504)
+
 
 @bp.route('/workflows', methods=['GET'])
-def list_workflows():
-    """Get list of all available workflows."""
+async def list_workflows():
+    """Get list of all available workflows.
+
+    Served from the pre-serialized catalog snapshot with a strong ETag, so
+    polling clients sending ``If-None-Match`` get an empty 304.
+    """
+    catalog = get_catalog()
+    response = Response(catalog.body, mimetype='application/json')
+    response.set_etag(catalog.etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _error(message: str, status: int, headers=None):
+    """Build a JSON error response.
+
+    Args:
+        message: Error message for the client
+        status: HTTP status code
+        headers: Extra response headers
+    """
+    return jsonify({
+        'success': False,
+        'error': message,
+    }), status, headers or {}
+
+
+def _temporal_error(clients, error: Exception):
+    """Map an exception raised while talking to Temporal to a response.
+
+    Args:
+        clients: Client manager that owns the failing client
+        error: Exception raised by the Temporal call
+    """
+    if isinstance(error, TimeoutError):
+        return _error(str(error), 504)
+    if isinstance(error, BatchTooLargeError):
+        return _error(str(error), 413)
+    if isinstance(error, AdmissionRejectedError):
+        return _error(
+            str(error), 429, {'Retry-After': error.retry_after_header}
+        )
+    if isinstance(error, TemporalUnavailableError):
+        return _error(str(error), 503)
+    if isinstance(error, IdempotencyConflictError):
+        return _error(str(error), 422)
+    if isinstance(error, WorkflowAlreadyStartedError):
+        return _error(f'Workflow {error.workflow_id} is already running', 409)
+    if isinstance(error, RPCError):
+        if error.status == RPCStatusCode.NOT_FOUND:
+            return _error(str(error), 404)
+        if error.status == RPCStatusCode.INVALID_ARGUMENT:
+            return _error(str(error), 400)
+        clients.report_error(error)
+        return _error(f'Failed to connect to Temporal server: {error}', 500)
+    return _error(str(error), 500)
+
+
+def _is_truthy(value: Optional[str], default: bool = True) -> bool:
+    """Interpret a query string flag such as ``?wait=false``."""
+    if value is None:
+        return default
+    return value.lower() not in ('false', '0', 'no', 'off')
+
+
+def _request_hash(workflow_args) -> str:
+    """Hash bound workflow arguments into a stable hex digest."""
+    encoded = json.dumps(workflow_args, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _workflow_run_id(workflow_id: str, workflow_args, idempotency_key=None):
+    """Build the workflow ID of a new run.
+
+    Args:
+        workflow_id: ID of the workflow being started
+        workflow_args: Bound workflow arguments
+        idempotency_key: Value of the ``Idempotency-Key`` header, if any
+
+    Returns:
+        Tuple of the workflow ID and the request hash to de-duplicate on
+        (None when the ID is unique and duplicates cannot occur)
+    """
+    request_hash = _request_hash(workflow_args)
+    if idempotency_key:
+        key_hash = hashlib.sha256(idempotency_key.encode('utf-8')).hexdigest()
+        return f"{workflow_id}-{key_hash[:32]}", request_hash
+    if current_app.config['WORKFLOW_ID_MODE'] == 'params':
+        return f"{workflow_id}-{request_hash[:32]}", request_hash
+    return (
+        f"{workflow_id}-{int(time.time() * 1000)}-{secrets.token_hex(4)}",
+        None,
+    )
+
+
+def _admit(workflow_meta, clients, cost: int = 1, wait: bool = False):
+    """Pass a launch through admission control.
+
+    Args:
+        workflow_meta: Metadata of the workflow being launched
+        clients: Client manager, for backlog-adaptive limits
+        cost: Number of runs launched
+        wait: The request waits for the result
+
+    Returns:
+        Context manager holding the wait slot, if any, until exited
+
+    Raises:
+        AdmissionRejectedError: If a limit is exceeded
+    """
+    admission = get_admission_controller()
+    if admission is None:
+        return contextlib.nullcontext()
+    header = current_app.config['ADMISSION_CALLER_HEADER']
+    caller = (
+        (header and request.headers.get(header)) or request.remote_addr or ''
+    )
+    return admission.admit(
+        workflow_meta.id,
+        caller,
+        cost=cost,
+        wait=wait,
+        task_queue=workflow_meta.task_queue,
+        clients=clients,
+    )
+
+
+def _result_cache_key(clients, workflow_run_id: str, run_id: str) -> str:
+    """Result cache key of one run of a workflow ID.
+
+    The run ID is part of the key, so a workflow ID reused by a later run
+    never gets the result of an earlier one.
+    """
+    return f'{clients.default_namespace}/{workflow_run_id}/{run_id}'
+
+
+def _start_visibility():
+    """Run visibility used to set search attributes on starts, if enabled.
+
+    Read in the view: starts of a batch run after the app context is gone.
+    """
+    if not current_app.config['RUN_SEARCH_ATTRIBUTES']:
+        return None
+    return get_run_visibility()
+
+
+def _id_reuse_policy() -> WorkflowIDReusePolicy:
+    """Workflow ID reuse policy configured for idempotent starts."""
+    return WorkflowIDReusePolicy[current_app.config['WORKFLOW_ID_REUSE_POLICY']]
+
+
+async def _start_workflow(
+    clients,
+    workflow_meta,
+    workflow_args,
+    workflow_run_id,
+    request_hash=None,
+    id_reuse_policy=WorkflowIDReusePolicy.ALLOW_DUPLICATE,
+    visibility=None,
+):
+    """Start a workflow on the shared client.
+
+    With a ``request_hash`` the start is idempotent: when the server
+    rejects the ID because a run with it is still open (or closed, as far
+    as ``id_reuse_policy`` forbids reuse), the existing run is attached
+    instead of starting another one. With ``visibility`` the run gets
+    the search attributes of its workflow and parameters.
+
+    Returns:
+        Tuple of the workflow handle and whether an existing run was attached
+
+    Raises:
+        IdempotencyConflictError: If the existing run was started with
+            different parameters
+    """
     try:
-        workflows = get_all_workflow_metadata()
-        workflows_data = []
-
-        for workflow in workflows:
-            workflows_data.append({
-                'id': workflow.id,
-                'name': workflow.name,
-                'description': workflow.description,
-                'category': workflow.category,
-                'parameters': workflow.parameters,
-            })
-        
-            return jsonify({
-                'success': True,
-                'workflows': workflows_data,
-            })
+        handle, deduplicated = await _start_or_attach(
+            clients, workflow_meta, workflow_args, workflow_run_id,
+            request_hash, id_reuse_policy, visibility,
+        )
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        record_failure(workflow_meta.id, 'start', e)
+        raise
+
+    WORKFLOW_STARTS.labels(
+        workflow_meta.id, 'deduplicated' if deduplicated else 'started'
+    ).inc()
+    return handle, deduplicated
+
+
+async def _start_or_attach(
+    clients,
+    workflow_meta,
+    workflow_args,
+    workflow_run_id,
+    request_hash,
+    id_reuse_policy,
+    visibility,
+):
+    """Start a workflow, or attach to the run already holding its ID."""
+    client = await clients.get_client()
+
+    search_attributes = None
+    if visibility is not None:
+        available = await visibility.search_attributes.available(client)
+        search_attributes = start_search_attributes(
+            workflow_meta, workflow_args, available
+        )
+
+    # Note: workflow arguments are passed as positional args
+    try:
+        handle = await client.start_workflow(
+            workflow_meta.workflow_class.run,
+            *workflow_args,
+            id=workflow_run_id,
+            task_queue=workflow_meta.task_queue,
+            id_reuse_policy=id_reuse_policy,
+            memo={REQUEST_HASH_MEMO: request_hash} if request_hash else None,
+            search_attributes=search_attributes,
+        )
+    except WorkflowAlreadyStartedError as e:
+        if request_hash is None:
+            raise
+        handle = client.get_workflow_handle(workflow_run_id, run_id=e.run_id)
+        memo = await (await handle.describe()).memo()
+        if memo.get(REQUEST_HASH_MEMO, request_hash) != request_hash:
+            raise IdempotencyConflictError(
+                f'Workflow {workflow_run_id} was started with different '
+                f'parameters'
+            ) from e
+        return handle, True
+
+    return handle, False
+
+
+async def _execute_workflow(
+    clients,
+    workflow_meta,
+    workflow_args,
+    workflow_run_id,
+    request_hash=None,
+    id_reuse_policy=WorkflowIDReusePolicy.ALLOW_DUPLICATE,
+    visibility=None,
+):
+    """Start (or attach to) a workflow and wait for its result.
+
+    Returns:
+        Tuple of the workflow result and whether an existing run was attached
+    """
+    handle, deduplicated = await _start_workflow(
+        clients, workflow_meta, workflow_args, workflow_run_id,
+        request_hash, id_reuse_policy, visibility,
+    )
+
+    cache = get_result_cache() if handle.run_id else None
+    if cache is not None:
+        cache_key = _result_cache_key(clients, workflow_run_id, handle.run_id)
+    if deduplicated and cache is not None:
+        found, result = await cache.get(cache_key)
+        if found:
+            return result, deduplicated
+
+    with RESULT_WAITS_IN_FLIGHT.labels(workflow_meta.id).track_inprogress():
+        try:
+            result = await handle.result()
+        except Exception as e:
+            record_failure(workflow_meta.id, 'result', e)
+            raise
+    if cache is not None:
+        await cache.set(cache_key, result)
+    return result, deduplicated
+
+
+async def _start_batch(
+    clients, workflow_meta, batch, concurrency, id_reuse_policy, visibility=None
+):
+    """Start many runs of a workflow concurrently.
+
+    Runs while the response streams, outside the app context, so
+    everything it needs from the app is passed in.
+
+    Args:
+        clients: Client manager
+        workflow_meta: Metadata of the workflow being started
+        batch: List of ``(index, workflow_args, workflow_run_id,
+            request_hash)`` to start
+        concurrency: Maximum number of starts in flight
+        id_reuse_policy: Reuse policy of idempotent starts
+        visibility: Run visibility for search attributes, or None
+
+    Yields:
+        One result dict per item, in completion order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _start_one(index, workflow_args, workflow_run_id, request_hash):
+        async with semaphore:
+            try:
+                handle, deduplicated = await _start_workflow(
+                    clients, workflow_meta, workflow_args, workflow_run_id,
+                    request_hash, id_reuse_policy, visibility,
+                )
+            except Exception as e:
+                clients.report_error(e)
+                return {'index': index, 'success': False, 'error': str(e)}
+
+        return {
+            'index': index,
+            'success': True,
+            'workflow_id': workflow_run_id,
+            'run_id': handle.first_execution_run_id or handle.run_id,
+            'deduplicated': deduplicated,
+        }
+
+    tasks = [
+        asyncio.ensure_future(_start_one(*item)) for item in batch
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _describe_run(clients, run_id: str) -> dict:
+    """Describe a workflow run.
+
+    Args:
+        clients: Client manager
+        run_id: Workflow ID returned when the run was started
+
+    Returns:
+        Status information for the run
+    """
+    client = await clients.get_client()
+    desc = await client.get_workflow_handle(run_id).describe()
+
+    return {
+        'workflow_id': desc.id,
+        'run_id': desc.run_id,
+        'workflow_type': desc.workflow_type,
+        'task_queue': desc.task_queue,
+        'status': desc.status.name if desc.status else None,
+        'start_time': desc.start_time.isoformat() if desc.start_time else None,
+        'close_time': desc.close_time.isoformat() if desc.close_time else None,
+    }
+
+
+async def _run_result(clients, run_id: str, desc, wait: float) -> dict:
+    """Fetch the result of a run, long-polling for at most ``wait`` seconds.
+
+    Args:
+        clients: Client manager
+        run_id: Workflow ID returned when the run was started
+        desc: Description of the run, whose run ID the handle is pinned to
+        wait: Seconds to wait for a running workflow to finish
+
+    Returns:
+        ``{'status': ..., 'result': ...}``; result is only set once
+        completed, runs that closed otherwise (failed, terminated, canceled,
+        timed out) get ``error`` with the failure message instead
+    """
+    client = await clients.get_client()
+    handle = client.get_workflow_handle(run_id, run_id=desc.run_id)
+
+    if wait <= 0 and desc.status == WorkflowExecutionStatus.RUNNING:
+        return {'status': desc.status.name}
+
+    try:
+        result = await asyncio.wait_for(handle.result(), timeout=wait or None)
+    except asyncio.TimeoutError:
+        return {'status': WorkflowExecutionStatus.RUNNING.name}
+    except WorkflowFailureError as e:
+        if desc.status == WorkflowExecutionStatus.RUNNING:
+            # It closed while we waited
+            desc = await handle.describe()
+        return {'status': desc.status.name, 'error': str(e.cause or e)}
+
+    return {'status': WorkflowExecutionStatus.COMPLETED.name, 'result': result}
 
 
 @bp.route('/workflows/<workflow_id>/run', methods=['POST'])
-def run_workflow(workflow_id: str):
+async def run_workflow(workflow_id: str):
     """Run a specific workflow.
 
+    Requests carrying an ``Idempotency-Key`` header (or any request when
+    ``WORKFLOW_ID_MODE`` is ``params``) get a deterministic workflow ID, so
+    a retried request attaches to the run the first one started and
+    returns its result instead of doing the work again.
+
     Args:
         workflow_id: ID of the workflow to run
     """
-    async def _run_workflow():
+    workflow_meta = get_workflow_metadata(workflow_id)
+    if not workflow_meta:
+        return _error(f'Workflow "{workflow_id}" not found', 404)
+
+    # Parameters are passed as positional args to workflow function
+    data = request.get_json(silent=True) or {}
+    try:
+        workflow_args = workflow_meta.bind_arguments(data)
+    except ParameterError as e:
+        return _error(str(e), 400)
+
+    workflow_run_id, request_hash = _workflow_run_id(
+        workflow_id, workflow_args, request.headers.get('Idempotency-Key')
+    )
+    id_reuse_policy = _id_reuse_policy()
+
+    clients = get_client_manager()
+
+    # ?wait=false returns as soon as the workflow has been started
+    if not _is_truthy(request.args.get('wait')):
         try:
-            # Get workflow metadata
-            workflow_meta = get_workflow_metadata(workflow_id)
-            if not workflow_meta:
-                return jsonify({
-                    'success': False,
-                    'error': f'Workflow "{workflow_id}" not found'
-                }), 404
-
-            # Get parameters from request
-            data = request.get_json() or {}
-
-            # Build workflow arguments from parameters
-            # Parameters are passed as positional args to workflow function
-            workflow_args = []
-
-            # Extract parameters based on metadata
-            # Sort parameters to maintain consistent order
-            sorted_params = sorted(
-                workflow_meta.parameters,
-                key=lambda p: (p.get('required', False), p['name'])
+            _admit(workflow_meta, clients)
+            handle, deduplicated = await _start_workflow(
+                clients, workflow_meta, workflow_args, workflow_run_id,
+                request_hash, id_reuse_policy, _start_visibility(),
             )
+        except Exception as e:
+            return _temporal_error(clients, e)
 
-            for param in sorted_params:
-                param_name = param['name']
-                param_value = data.get(param_name)
-
-                # Use default if value not provided
-                if param_value is None or param_value == '':
-                    param_value = param.get('default')
-
-                if param.get('required', False) and param_value is None:
-                    return jsonify({
-                        'success': False,
-                        'error': (
-                            f'Required parameter "{param_name}" is missing'
-                        )
-                    }), 400
-
-                # Add parameter value to args list (only if not None)
-                if param_value is not None:
-                    workflow_args.append(param_value)
-
-            # Connect to Temporal server
-            client = await Client.connect(
-                config.ADDRESS,
-                namespace=config.NAMESPACE
+        status_url = url_for('api.get_run', run_id=workflow_run_id)
+        return jsonify({
+            'success': True,
+            'workflow_id': workflow_run_id,
+            'run_id': handle.first_execution_run_id or handle.run_id,
+            'workflow_name': workflow_meta.name,
+            'deduplicated': deduplicated,
+            'status_url': status_url,
+            'result_url': url_for('api.get_run_result', run_id=workflow_run_id),
+        }), 202, {'Location': status_url}
+
+    try:
+        with _admit(workflow_meta, clients, wait=True):
+            result, deduplicated = await _execute_workflow(
+                clients, workflow_meta, workflow_args, workflow_run_id,
+                request_hash, id_reuse_policy, _start_visibility(),
             )
+    except Exception as e:
+        return _temporal_error(clients, e)
 
-            # Generate unique workflow ID
-            workflow_run_id = f"{workflow_id}-{int(time.time() * 1000)}"
+    return jsonify({
+        'success': True,
+        'result': result,
+        'workflow_id': workflow_run_id,
+        'workflow_name': workflow_meta.name,
+        'deduplicated': deduplicated,
+    })
 
-            # Start the workflow
-            # Note: workflow arguments are passed as positional args
-            handle = await client.start_workflow(
-                workflow_meta.workflow_class.run,
-                *workflow_args,
-                id=workflow_run_id,
-                task_queue=config.DEFAULT_TASK_QUEUE,
-            )
 
-            # Wait for the result
-            result = await handle.result()
+@bp.route('/workflows/<workflow_id>/run-batch', methods=['POST'])
+async def run_workflow_batch(workflow_id: str):
+    """Start many runs of a workflow with different parameters.
 
-            return jsonify({
-                'success': True,
-                'result': result,
-                'workflow_id': workflow_run_id,
-                'workflow_name': workflow_meta.name,
-            })
-        except RPCError as e:
-            return jsonify({
+    The request body is a JSON array of parameter objects. All items are
+    validated first, then the valid ones are started concurrently over the
+    shared client. One JSON line per item is streamed back (NDJSON) as each
+    start completes; invalid items are reported without being started.
+
+    Query parameters:
+        concurrency: Maximum starts in flight, capped at
+            ``BATCH_MAX_CONCURRENCY``
+
+    With an ``Idempotency-Key`` header, item ``i`` is started under the
+    key ``<key>-<i>``, so retrying the whole batch attaches to the runs
+    already started.
+
+    Args:
+        workflow_id: ID of the workflow to run
+    """
+    workflow_meta = get_workflow_metadata(workflow_id)
+    if not workflow_meta:
+        return _error(f'Workflow "{workflow_id}" not found', 404)
+
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return _error('Request body must be a JSON array of parameters', 400)
+
+    max_items = current_app.config['BATCH_MAX_ITEMS']
+    if len(items) > max_items:
+        return _error(f'Batch exceeds the limit of {max_items} items', 413)
+
+    max_concurrency = current_app.config['BATCH_MAX_CONCURRENCY']
+    try:
+        concurrency = int(request.args.get('concurrency', max_concurrency))
+    except ValueError:
+        return _error('Query parameter "concurrency" must be an integer', 400)
+    concurrency = min(max(concurrency, 1), max_concurrency)
+
+    # Validate everything before starting anything
+    idempotency_key = request.headers.get('Idempotency-Key')
+    id_reuse_policy = _id_reuse_policy()
+    visibility = _start_visibility()
+    batch = []
+    invalid = []
+    for index, data in enumerate(items):
+        if not isinstance(data, dict):
+            invalid.append({
+                'index': index,
                 'success': False,
-                'error': f'Failed to connect to Temporal server: {e}'
-            }), 500
+                'error': 'Item must be a JSON object',
+            })
+            continue
+        try:
+            workflow_args = workflow_meta.bind_arguments(data)
+        except ParameterError as e:
+            invalid.append({'index': index, 'success': False, 'error': str(e)})
+            continue
+        workflow_run_id, request_hash = _workflow_run_id(
+            workflow_id,
+            workflow_args,
+            f'{idempotency_key}-{index}' if idempotency_key else None,
+        )
+        batch.append((index, workflow_args, workflow_run_id, request_hash))
+
+    clients = get_client_manager()
+    if batch:
+        # Fail the whole request early if it is over the rate limits or
+        # the server is unreachable
+        try:
+            _admit(workflow_meta, clients, cost=len(batch))
+            await clients.get_client()
         except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': str(e)
-            }), 500
+            return _temporal_error(clients, e)
 
-    return asyncio.run(_run_workflow())
+    async def _generate():
+        for line in invalid:
+            yield json.dumps(line) + '\n'
+        if batch:
+            results = _start_batch(
+                clients, workflow_meta, batch, concurrency, id_reuse_policy,
+                visibility,
+            )
+            async for line in results:
+                yield json.dumps(line, default=str) + '\n'
+
+    return Response(_generate(), mimetype='application/x-ndjson')
+
+
+@bp.route('/runs', methods=['GET'])
+async def list_runs():
+    """List runs from Temporal visibility.
+
+    Query parameters:
+        workflow: Catalog workflow ID the runs belong to
+        status: Comma separated statuses, e.g. ``RUNNING,FAILED``
+        started_after, started_before: ISO-8601 start time range
+        param.<name>: Value a searchable parameter was started with
+            (needs ``workflow``)
+        page_size: Runs per page, capped at ``RUNS_PAGE_SIZE_MAX``
+        cursor: ``next_cursor`` of the previous page
+
+    Pages are cached for ``RUNS_CACHE_TTL`` seconds, so a run may show up
+    (or change status) that much later.
+    """
+    config = current_app.config
+    args = request.args
+
+    workflow_meta = None
+    if args.get('workflow'):
+        workflow_meta = get_workflow_metadata(args['workflow'])
+        if not workflow_meta:
+            return _error(f'Workflow "{args["workflow"]}" not found', 404)
+
+    try:
+        page_size = int(args.get('page_size', config['RUNS_PAGE_SIZE']))
+    except ValueError:
+        return _error('Query parameter "page_size" must be an integer', 400)
+    page_size = min(max(page_size, 1), config['RUNS_PAGE_SIZE_MAX'])
+
+    try:
+        token = decode_cursor(args.get('cursor'))
+        statuses = parse_statuses(args.get('status', ''))
+        started_after = (
+            parse_time('started_after', args['started_after'])
+            if args.get('started_after') else None
+        )
+        started_before = (
+            parse_time('started_before', args['started_before'])
+            if args.get('started_before') else None
+        )
+    except ValueError as e:
+        return _error(str(e), 400)
+    parameters = {
+        key[len('param.'):]: value
+        for key, value in args.items() if key.startswith('param.')
+    }
+
+    clients = get_client_manager()
+    visibility = get_run_visibility()
+    try:
+        client = await clients.get_client()
+        available = frozenset()
+        if config['RUN_SEARCH_ATTRIBUTES']:
+            available = await visibility.search_attributes.available(client)
+        try:
+            query = build_query(
+                available, workflow_meta, statuses, started_after,
+                started_before, parameters,
+            )
+        except ValueError as e:
+            return _error(str(e), 400)
+
+        page, cached = await visibility.pages.get(
+            (clients.default_namespace, query, page_size, token),
+            lambda: fetch_runs_page(client, query, page_size, token),
+        )
+    except Exception as e:
+        return _temporal_error(clients, e)
+
+    response = jsonify({
+        'success': True,
+        'query': query,
+        'page_size': page_size,
+        **page,
+    })
+    response.headers['X-Cache'] = 'HIT' if cached else 'MISS'
+    return response
+
+
+@bp.route('/runs/<run_id>', methods=['GET'])
+async def get_run(run_id: str):
+    """Get the status of a workflow run.
+
+    Args:
+        run_id: Workflow ID returned when the run was started
+    """
+    clients = get_client_manager()
+    try:
+        run = await _describe_run(clients, run_id)
+    except Exception as e:
+        return _temporal_error(clients, e)
+
+    return jsonify({
+        'success': True,
+        **run,
+    })
+
+
+@bp.route('/runs/<run_id>/result', methods=['GET'])
+async def get_run_result(run_id: str):
+    """Get the result of a workflow run.
+
+    Query parameters:
+        wait: Seconds to long-poll for a running workflow, capped at
+            ``RESULT_LONG_POLL_MAX`` (default: 0, return immediately)
+
+    Responds with 202 while the run is still in progress. A run that
+    closed without completing is reported with its status and ``error``.
+
+    Args:
+        run_id: Workflow ID returned when the run was started
+    """
+    try:
+        wait = float(request.args.get('wait', 0))
+    except ValueError:
+        return _error('Query parameter "wait" must be a number', 400)
+    wait = min(max(wait, 0.0), current_app.config['RESULT_LONG_POLL_MAX'])
+
+    clients = get_client_manager()
+    cache = get_result_cache()
+    cached = False
+    try:
+        # Describing first pins the run, so a reused workflow ID is a miss
+        client = await clients.get_client()
+        desc = await client.get_workflow_handle(run_id).describe()
+        cache_key = _result_cache_key(clients, run_id, desc.run_id)
+        if (
+            cache is not None
+            and desc.status == WorkflowExecutionStatus.COMPLETED
+        ):
+            cached, result = await cache.get(cache_key)
+        if cached:
+            run = {
+                'status': WorkflowExecutionStatus.COMPLETED.name,
+                'result': result,
+            }
+        else:
+            run = await _run_result(clients, run_id, desc, wait)
+            if cache is not None and 'result' in run:
+                await cache.set(cache_key, run['result'])
+    except Exception as e:
+        return _temporal_error(clients, e)
+
+    running = run['status'] == WorkflowExecutionStatus.RUNNING.name
+    status = 202 if running else 200
+    response = jsonify({
+        'success': True,
+        'workflow_id': run_id,
+        **run,
+    })
+    response.headers['X-Cache'] = 'HIT' if cached else 'MISS'
+    return response, status
 
 
 # Keep the old endpoint for backward compatibility
 @bp.route('/run-test', methods=['POST'])
-def run_test():
+async def run_test():
     """API endpoint to run the test workflow (backward compatibility)."""
-    return run_workflow('test')
+    return await run_workflow('test')
 
 
 @bp.route('/health', methods=['GET'])
-def health():
+async def health():
     """Health check endpoint."""
     return jsonify({'status': 'healthy'})
+
+
+@bp.route('/ready', methods=['GET'])
+async def ready():
+    """Readiness check endpoint.
+
+    Served from the result of the background readiness checks: 200 when
+    the Temporal server is reachable and workers poll the task queues, 503
+    otherwise (always 503 with ``READY_ENABLED`` off). Never calls Temporal
+    itself.
+    """
+    probe = get_readiness_probe()
+    if current_app.config['READY_ENABLED']:
+        probe.ensure_running(get_client_manager())
+    status = probe.status()
+    return jsonify({
+        'status': 'ready' if status['ready'] else 'not_ready',
+        **status,
+    }), 200 if status['ready'] else 503
@@ -1,42 +1,50 @@
 """Main routes blueprint."""
 
-from flask import Blueprint, render_template
+from flask import Blueprint, current_app, make_response, render_template, request
+from temporal.workflow_metadata import get_catalog
 
 bp = Blueprint('main', __name__)
 
+# Rendered index page keyed by catalog ETag
+_index_pages = {}
 
-@bp.route('/')
-def index():
-    """Render the main page with all available workflows."""
-    # Import workflows to ensure metadata is registered
-    from temporal.workflows import WORKFLOWS  # noqa: F401
-    
-    # Get all workflow metadata
-    from temporal.workflow_metadata import get_all_workflow_metadata
-
-    workflows = get_all_workflow_metadata()
-    
-    # Group workflows by category
-    workflows_by_category = {}
-    for workflow in workflows:
-        category = workflow.category or "general"
-        if category not in workflows_by_category:
-            workflows_by_category[category] = []
-        workflows_by_category[category].append(workflow)
 
+@bp.route('/')
+async def index():
+    """Render the main page with all available workflows.
+
+    The page only depends on the workflow catalog, so outside debug mode it
+    is rendered once per catalog snapshot and revalidated with an ETag.
+    """
+    catalog = get_catalog()
+    if current_app.debug:
+        return _render_index(catalog)
+
+    etag = f'{catalog.etag}-index'
+    html = _index_pages.get(etag)
+    if html is None:
+        html = _render_index(catalog)
+        _index_pages.clear()
+        _index_pages[etag] = html
+
+    response = make_response(html)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _render_index(catalog) -> str:
+    """Render the index template for a catalog snapshot."""
     return render_template(
         'index.html',
-        workflows=workflows,
-        workflows_by_category=workflows_by_category,
+        workflows=catalog.workflows,
+        workflows_by_category=catalog.by_category,
     )
 
 
 @bp.route('/workflows/test')
-def test_workflow():
+async def test_workflow():
     """Render the test workflow page."""
-    # Import workflows to ensure metadata is registered
-    from temporal.workflows import WORKFLOWS  # noqa: F401
-    
     # Get test workflow metadata
     from temporal.workflow_metadata import get_workflow_metadata
     
@@ -0,0 +1,107 @@
+"""OpenTelemetry spans for Flask requests."""
+
+from flask import g, request
+
+
+def _start_span():
+    """Open a server span for the request and make it current.
+
+    The span continues a trace passed in ``traceparent``. Views run on the
+    async bridge or the ASGI loop inherit it through contextvars, so the
+    workflow starts they make become child spans.
+    """
+    from opentelemetry import context, propagate, trace
+
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    attributes = {
+        'http.method': request.method,
+        'http.route': route,
+        'http.target': request.full_path.rstrip('?'),
+    }
+    workflow_id = (request.view_args or {}).get('workflow_id')
+    if workflow_id:
+        attributes['workflow.id'] = workflow_id
+
+    span = trace.get_tracer('temporal.api').start_span(
+        f'{request.method} {route}',
+        context=propagate.extract(request.headers),
+        kind=trace.SpanKind.SERVER,
+        attributes=attributes,
+    )
+    g.tracing_span = span
+    g.tracing_token = context.attach(trace.set_span_in_context(span))
+
+
+def _record_status(response):
+    """Record the response status on the request span.
+
+    Streamed bodies are produced after the request context is torn down
+    under WSGI, so the span is handed to the body and ends with it. Async
+    bodies served over ASGI are consumed before teardown and need nothing.
+    """
+    span = g.get('tracing_span')
+    if span is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.set_attribute('http.status_code', response.status_code)
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+        if response.is_streamed and not hasattr(response.response, '__aiter__'):
+            response.response = _traced_body(response.response, span)
+            g.tracing_streamed = True
+    return response
+
+
+def _traced_body(body, span):
+    """Yield a streamed body with the request span current, then end it."""
+    from opentelemetry import context, trace
+    from opentelemetry.trace import Status, StatusCode
+
+    span_context = trace.set_span_in_context(span)
+    chunks = iter(body)
+    try:
+        while True:
+            token = context.attach(span_context)
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR))
+                raise
+            finally:
+                context.detach(token)
+            yield chunk
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+        span.end()
+
+
+def _end_span(error=None):
+    """End the request span once the response is complete."""
+    span = g.pop('tracing_span', None)
+    if span is None:
+        return
+
+    from opentelemetry import context
+
+    if error is not None:
+        span.record_exception(error)
+    if not g.pop('tracing_streamed', False):
+        span.end()
+    context.detach(g.pop('tracing_token'))
+
+
+def init_tracing(app) -> None:
+    """Trace every request of the app.
+
+    Call after ``configure_tracing`` installed the tracer provider.
+
+    Args:
+        app: Flask application
+    """
+    app.before_request(_start_span)
+    app.after_request(_record_status)
+    app.teardown_request(_end_span)
@@ -0,0 +1,581 @@
+"""Run listing over Temporal visibility for ``GET /api/runs``.
+
+With ``RUN_SEARCH_ATTRIBUTES`` on, runs started by the API carry custom
+search attributes: the catalog workflow ID and one attribute per parameter
+declared ``"searchable": true``. They are registered with the server when
+the API starts, never on the request path, so listings filter in the store
+instead of scanning.
+
+Pages are fetched with the server's page tokens and kept in a short TTL
+cache; concurrent requests for the same page share one visibility call.
+"""
+
+import asyncio
+import base64
+import binascii
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+
+from temporalio.api.operatorservice.v1 import (
+    AddSearchAttributesRequest,
+    ListSearchAttributesRequest,
+)
+from temporalio.client import Client, WorkflowExecutionStatus
+from temporalio.common import (
+    SearchAttributeIndexedValueType,
+    SearchAttributeKey,
+    SearchAttributePair,
+    TypedSearchAttributes,
+)
+
+from temporal.workflow_metadata import ParameterError, WorkflowMetadata
+
+logger = logging.getLogger(__name__)
+
+# Search attribute holding the catalog ID of the workflow a run belongs to
+CATALOG_ID_ATTRIBUTE = 'CatalogWorkflowId'
+
+# Search attribute factories by parameter "type" of parameters declared
+# with "searchable": true; other types are not indexed
+PARAMETER_ATTRIBUTE_TYPES: Dict[str, Callable[[str], SearchAttributeKey]] = {
+    'string': SearchAttributeKey.for_keyword,
+    'email': SearchAttributeKey.for_keyword,
+    'url': SearchAttributeKey.for_keyword,
+    'integer': SearchAttributeKey.for_int,
+    'number': SearchAttributeKey.for_float,
+    'boolean': SearchAttributeKey.for_bool,
+}
+
+# Visibility query values of WorkflowExecutionStatus
+_STATUS_VALUES = {
+    WorkflowExecutionStatus.RUNNING: 'Running',
+    WorkflowExecutionStatus.COMPLETED: 'Completed',
+    WorkflowExecutionStatus.FAILED: 'Failed',
+    WorkflowExecutionStatus.CANCELED: 'Canceled',
+    WorkflowExecutionStatus.TERMINATED: 'Terminated',
+    WorkflowExecutionStatus.CONTINUED_AS_NEW: 'ContinuedAsNew',
+    WorkflowExecutionStatus.TIMED_OUT: 'TimedOut',
+}
+
+_ATTRIBUTE_NAME_RE = re.compile(r'[^A-Za-z0-9_]')
+
+# Longest Keyword value set on a run, in UTF-8 bytes; the server rejects
+# the whole start when a value exceeds its size limit (2 KiB by default)
+MAX_KEYWORD_BYTES = 2048
+
+# Search attribute names to their indexed value types, as the server knows them
+AvailableAttributes = Mapping[str, SearchAttributeIndexedValueType]
+
+
+def parameter_attribute(name: str) -> str:
+    """Search attribute name of a workflow parameter."""
+    return 'Param_' + _ATTRIBUTE_NAME_RE.sub('_', name)
+
+
+def _is_available(key: SearchAttributeKey, available: AvailableAttributes) -> bool:
+    """Whether the server knows an attribute with the key's name and type."""
+    return available.get(key.name) == key.indexed_value_type
+
+
+def search_attribute_keys(
+    workflow_meta: WorkflowMetadata,
+) -> Dict[str, SearchAttributeKey]:
+    """Search attributes derived from a workflow's parameter definitions.
+
+    Args:
+        workflow_meta: Workflow metadata
+
+    Returns:
+        Search attribute keys by parameter name
+    """
+    keys = {}
+    for param in workflow_meta.parameters:
+        factory = PARAMETER_ATTRIBUTE_TYPES.get(param.get('type'))
+        if factory is not None and param.get('searchable') is True:
+            keys[param['name']] = factory(parameter_attribute(param['name']))
+    return keys
+
+
+class SearchAttributeRegistry:
+    """Register the run search attributes and remember which exist.
+
+    ``register`` adds the missing attributes and runs once when the API
+    starts. ``available`` only lists what the server knows, so requests
+    never change the server's schema. Attributes the server rejects (e.g.
+    when the SQL visibility store has no free slot of a type) are skipped;
+    runs and filters just go without them. A failed lookup is retried
+    after ``retry_interval`` seconds.
+    """
+
+    def __init__(self, namespace: str, retry_interval: float = 60.0):
+        """Initialize the registry.
+
+        Args:
+            namespace: Namespace the attributes are registered in
+            retry_interval: Seconds before a failed lookup is retried
+        """
+        self.namespace = namespace
+        self.retry_interval = retry_interval
+        self._available: AvailableAttributes = {}
+        self._checked_at: Optional[float] = None
+        self._ok = False
+        self._lock = asyncio.Lock()
+
+    def wanted(self) -> Dict[str, SearchAttributeKey]:
+        """Search attributes of every workflow in the catalog.
+
+        Raises:
+            ValueError: If workflows declare the same searchable parameter
+                with different attribute types
+        """
+        from temporal.workflow_metadata import get_all_workflow_metadata
+
+        wanted = {
+            CATALOG_ID_ATTRIBUTE: SearchAttributeKey.for_keyword(
+                CATALOG_ID_ATTRIBUTE
+            ),
+        }
+        for workflow_meta in get_all_workflow_metadata():
+            for key in search_attribute_keys(workflow_meta).values():
+                existing = wanted.setdefault(key.name, key)
+                if existing.indexed_value_type != key.indexed_value_type:
+                    raise ValueError(
+                        f'Search attribute {key.name} of workflow '
+                        f'"{workflow_meta.id}" is '
+                        f'{key.indexed_value_type.name}, but another '
+                        f'workflow declares it '
+                        f'{existing.indexed_value_type.name}; rename one of '
+                        f'the parameters'
+                    )
+        return wanted
+
+    async def register(self, client: Client) -> AvailableAttributes:
+        """Add the wanted attributes the server does not know yet.
+
+        Args:
+            client: Connected client
+
+        Returns:
+            Attributes usable in starts and queries
+        """
+        async with self._lock:
+            try:
+                wanted = self.wanted()
+                known = await self._list(client)
+                for name, key in wanted.items():
+                    if name in known:
+                        if known[name] != key.indexed_value_type:
+                            logger.warning(
+                                'Search attribute %s exists as %s, not %s',
+                                name, known[name].name,
+                                key.indexed_value_type.name,
+                            )
+                        continue
+                    try:
+                        await client.operator_service.add_search_attributes(
+                            AddSearchAttributesRequest(
+                                namespace=self.namespace,
+                                search_attributes={
+                                    name: int(key.indexed_value_type),
+                                },
+                            )
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            'Search attribute %s not registered: %s', name, e
+                        )
+                        continue
+                    known[name] = key.indexed_value_type
+            except Exception as e:
+                logger.warning('Search attributes not registered: %s', e)
+                self._set(None)
+            else:
+                self._set(known)
+        return self._available
+
+    async def available(self, client: Client) -> AvailableAttributes:
+        """Run search attributes the server knows, without changing them.
+
+        Args:
+            client: Connected client
+
+        Returns:
+            Attributes usable in starts and queries
+        """
+        if self._is_fresh():
+            return self._available
+        async with self._lock:
+            if not self._is_fresh():
+                try:
+                    self._set(await self._list(client))
+                except Exception as e:
+                    logger.warning('Search attributes unavailable: %s', e)
+                    self._set(None)
+        return self._available
+
+    def _is_fresh(self) -> bool:
+        """Whether the last lookup is still valid."""
+        if self._checked_at is None:
+            return False
+        if self._ok:
+            return True
+        return time.monotonic() - self._checked_at < self.retry_interval
+
+    def _set(self, known: Optional[AvailableAttributes]) -> None:
+        """Remember the wanted attributes among ``known`` (None: failed)."""
+        if known is None:
+            self._available, self._ok = {}, False
+        else:
+            wanted = self.wanted()
+            self._available = {
+                name: value_type for name, value_type in known.items()
+                if name in wanted
+            }
+            self._ok = True
+        self._checked_at = time.monotonic()
+
+    async def _list(self, client: Client) -> Dict[str, SearchAttributeIndexedValueType]:
+        """Search attributes of the namespace by name."""
+        response = await client.operator_service.list_search_attributes(
+            ListSearchAttributesRequest(namespace=self.namespace)
+        )
+        known = {
+            **response.system_attributes, **response.custom_attributes
+        }
+        return {
+            name: SearchAttributeIndexedValueType(value_type)
+            for name, value_type in known.items()
+        }
+
+
+def start_search_attributes(
+    workflow_meta: WorkflowMetadata,
+    workflow_args: List[Any],
+    available: AvailableAttributes,
+) -> Optional[TypedSearchAttributes]:
+    """Search attributes of a run being started.
+
+    Attributes the server does not know with the same type, and Keyword
+    values longer than ``MAX_KEYWORD_BYTES``, are left out rather than
+    failing the start.
+
+    Args:
+        workflow_meta: Metadata of the workflow being started
+        workflow_args: Bound positional workflow arguments
+        available: Attributes the server knows
+
+    Returns:
+        TypedSearchAttributes, or None if none are available
+    """
+    pairs = []
+    catalog_key = SearchAttributeKey.for_keyword(CATALOG_ID_ATTRIBUTE)
+    if _is_available(catalog_key, available):
+        pairs.append(SearchAttributePair(catalog_key, workflow_meta.id))
+
+    keys = search_attribute_keys(workflow_meta)
+    for binding, value in zip(workflow_meta.binding.bindings, workflow_args):
+        key = keys.get(binding.name)
+        if key is None or value is None or not _is_available(key, available):
+            continue
+        if key.indexed_value_type == SearchAttributeIndexedValueType.DOUBLE:
+            value = float(value)
+        elif (
+            key.indexed_value_type == SearchAttributeIndexedValueType.KEYWORD
+            and len(str(value).encode('utf-8')) > MAX_KEYWORD_BYTES
+        ):
+            continue
+        pairs.append(SearchAttributePair(key, value))
+    return TypedSearchAttributes(pairs) if pairs else None
+
+
+def _quote(value: Any) -> str:
+    """Format a value as a visibility query literal."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    escaped = str(value).replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def parse_time(name: str, value: str) -> datetime:
+    """Parse an ISO-8601 time from a query parameter (UTC if naive).
+
+    Raises:
+        ValueError: If the value is not an ISO-8601 time
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f'Query parameter "{name}" must be an ISO-8601 time')
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_statuses(value: str) -> List[WorkflowExecutionStatus]:
+    """Parse a comma separated list of run statuses.
+
+    Raises:
+        ValueError: If a status is unknown
+    """
+    statuses = []
+    for name in value.split(','):
+        name = name.strip().upper()
+        if not name:
+            continue
+        try:
+            statuses.append(WorkflowExecutionStatus[name])
+        except KeyError:
+            raise ValueError(
+                f'Unknown status "{name}", expected one of '
+                f'{", ".join(status.name for status in _STATUS_VALUES)}'
+            )
+    return statuses
+
+
+def build_query(
+    available: AvailableAttributes,
+    workflow_meta: Optional[WorkflowMetadata] = None,
+    statuses: Optional[List[WorkflowExecutionStatus]] = None,
+    started_after: Optional[datetime] = None,
+    started_before: Optional[datetime] = None,
+    parameters: Optional[Dict[str, str]] = None,
+) -> str:
+    """Build a visibility list filter.
+
+    Args:
+        available: Search attributes the server knows
+        workflow_meta: Only runs of this catalog workflow
+        statuses: Only runs in one of these statuses
+        started_after: Only runs started at or after this time
+        started_before: Only runs started before this time
+        parameters: Raw parameter values runs must have been started with
+            (requires ``workflow_meta``)
+
+    Returns:
+        Query string (empty for all runs)
+
+    Raises:
+        ValueError: If a parameter filter cannot be applied
+    """
+    clauses = []
+    if workflow_meta is not None:
+        catalog_key = SearchAttributeKey.for_keyword(CATALOG_ID_ATTRIBUTE)
+        if _is_available(catalog_key, available):
+            clauses.append(
+                f'{CATALOG_ID_ATTRIBUTE} = {_quote(workflow_meta.id)}'
+            )
+        else:
+            clauses.append(f'WorkflowType = {_quote(workflow_meta.workflow_type)}')
+
+    if statuses:
+        clauses.append('(' + ' OR '.join(
+            f'ExecutionStatus = {_quote(_STATUS_VALUES[status])}'
+            for status in statuses
+        ) + ')')
+
+    if started_after is not None:
+        clauses.append(f"StartTime >= {_quote(started_after.isoformat())}")
+    if started_before is not None:
+        clauses.append(f"StartTime < {_quote(started_before.isoformat())}")
+
+    if parameters:
+        if workflow_meta is None:
+            raise ValueError('Parameter filters need a "workflow" filter')
+        keys = search_attribute_keys(workflow_meta)
+        bindings = {b.name: b for b in workflow_meta.binding.bindings}
+        for name, raw in sorted(parameters.items()):
+            key = keys.get(name)
+            if key is None or not _is_available(key, available):
+                raise ValueError(f'Parameter "{name}" is not searchable')
+            try:
+                value = bindings[name].coerce(name, raw)
+            except ParameterError as e:
+                raise ValueError(str(e))
+            clauses.append(f'{key.name} = {_quote(value)}')
+
+    return ' AND '.join(clauses)
+
+
+def encode_cursor(token: Optional[bytes]) -> Optional[str]:
+    """Turn a visibility page token into an opaque URL-safe cursor."""
+    if not token:
+        return None
+    return base64.urlsafe_b64encode(token).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[bytes]:
+    """Turn a cursor from ``encode_cursor`` back into a page token.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        return base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError('Query parameter "cursor" is invalid')
+
+
+def _run_summary(execution) -> Dict[str, Any]:
+    """JSON view of a listed run."""
+    catalog_id = None
+    for pair in execution.typed_search_attributes:
+        if pair.key.name == CATALOG_ID_ATTRIBUTE:
+            catalog_id = pair.value
+    return {
+        'workflow_id': execution.id,
+        'run_id': execution.run_id,
+        'workflow_type': execution.workflow_type,
+        'catalog_id': catalog_id,
+        'task_queue': execution.task_queue,
+        'status': execution.status.name if execution.status else None,
+        'start_time': (
+            execution.start_time.isoformat() if execution.start_time else None
+        ),
+        'close_time': (
+            execution.close_time.isoformat() if execution.close_time else None
+        ),
+        'history_length': execution.history_length,
+    }
+
+
+async def fetch_runs_page(
+    client: Client, query: str, page_size: int, token: Optional[bytes]
+) -> Dict[str, Any]:
+    """Fetch one page of runs from visibility.
+
+    Args:
+        client: Connected client
+        query: Visibility list filter
+        page_size: Runs per page
+        token: Page token of the page to fetch (None for the first)
+
+    Returns:
+        ``{'runs': [...], 'next_cursor': ...}``
+    """
+    iterator = client.list_workflows(
+        query or None, page_size=page_size, next_page_token=token
+    )
+    await iterator.fetch_next_page()
+    return {
+        'runs': [_run_summary(e) for e in iterator.current_page or ()],
+        'next_cursor': encode_cursor(iterator.next_page_token),
+    }
+
+
+class PageCache:
+    """Small TTL cache of listing pages with request coalescing.
+
+    Meant to be used from a single event loop (the async bridge).
+    """
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 256):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a page is served from the cache (0 disables it)
+            maxsize: Pages kept at most
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._pages: 'OrderedDict[Any, tuple]' = OrderedDict()
+        self._pending: Dict[Any, asyncio.Future] = {}
+
+    async def get(self, key, fetch: Callable[[], Awaitable[Any]]):
+        """Return a cached page or fetch it once for all waiting requests.
+
+        Args:
+            key: Hashable page key
+            fetch: Coroutine function loading the page
+
+        Returns:
+            Tuple of the page and whether it came from the cache
+        """
+        entry = self._pages.get(key)
+        if entry is not None:
+            expires_at, page = entry
+            if time.monotonic() < expires_at:
+                self._pages.move_to_end(key)
+                return page, True
+            del self._pages[key]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending), True
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request fetching the page went away; fetch it here
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            page = await fetch()
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting; don't log "exception never retrieved"
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._pending.pop(key, None)
+        future.set_result(page)
+
+        if self.ttl > 0:
+            self._pages[key] = (time.monotonic() + self.ttl, page)
+            while len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+        return page, False
+
+
+class RunVisibility:
+    """Search attributes and listing cache of the API process."""
+
+    def __init__(self, namespace: str, cache_ttl: float = 5.0, cache_size: int = 256):
+        """Initialize run visibility.
+
+        Args:
+            namespace: Namespace runs are listed in
+            cache_ttl: Seconds listing pages are cached
+            cache_size: Listing pages cached at most
+        """
+        self.search_attributes = SearchAttributeRegistry(namespace)
+        self.pages = PageCache(cache_ttl, cache_size)
+
+    async def register_search_attributes(self, clients) -> bool:
+        """Register the run search attributes at startup.
+
+        Args:
+            clients: Client manager of the app
+
+        Returns:
+            True if the server could be asked
+        """
+        try:
+            client = await clients.get_client()
+        except Exception as e:
+            logger.warning('Search attributes not registered: %s', e)
+            return False
+        await self.search_attributes.register(client)
+        return True
+
+
+def get_run_visibility() -> RunVisibility:
+    """Get the run visibility helper of the current Flask app.
+
+    Returns:
+        RunVisibility created by the application factory
+    """
+    from flask import current_app
+
+    return current_app.extensions['run_visibility']
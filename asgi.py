@@ -0,0 +1,29 @@
+"""ASGI application entry point.
+
+Serves the same routes as ``app.py`` with coroutine views awaited on the
+server's event loop, so waiting on workflow results costs a coroutine
+instead of an OS thread:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+"""
+
+import os
+from app.asgi import create_asgi_app
+from app.config import config
+
+# Get environment or default to development
+env = os.environ.get('FLASK_ENV', 'development')
+app = create_asgi_app(config.get(env, config['default']))
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    flask_app = app.flask_app
+    print(f'🌐 ASGI app starting on http://localhost:{flask_app.config["PORT"]}')
+    print(f'📊 Environment: {env}')
+    uvicorn.run(
+        app,
+        host=flask_app.config['HOST'],
+        port=flask_app.config['PORT'],
+    )
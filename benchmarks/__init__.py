@@ -0,0 +1,4 @@
+"""Benchmarks of the launch path and the worker.
+
+Run with ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,111 @@
+"""Run the benchmarks and write the results as JSON.
+
+Usage:
+    python -m benchmarks all                     # against a local dev server
+    python -m benchmarks api --concurrency 1,16,64 --requests 1000
+    python -m benchmarks worker --env existing --address localhost:7233
+"""
+
+import argparse
+import asyncio
+
+from benchmarks import bench_api, bench_client, bench_worker
+from benchmarks.common import parse_int_list, temporal_environment, write_results
+
+BENCHMARKS = ('api', 'client', 'worker')
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmark', choices=BENCHMARKS + ('all',))
+    parser.add_argument(
+        '--env',
+        choices=('local', 'time-skipping', 'existing'),
+        default='local',
+        help='temporalio.testing dev server, test server, or --address',
+    )
+    parser.add_argument('--address', help='Server address for --env existing')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/)')
+    parser.add_argument(
+        '--concurrency',
+        type=parse_int_list,
+        default=[1, 8, 32],
+        help='In-flight requests/starts for api and client (default: 1,8,32)',
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=200,
+        help='Requests or starts per measurement (default: 200)',
+    )
+    parser.add_argument(
+        '--workflow',
+        default='benchmark',
+        help='Workflow ID launched by the api benchmark (default: benchmark)',
+    )
+    parser.add_argument(
+        '--no-wait',
+        action='store_true',
+        help='api benchmark: return after the start (?wait=false)',
+    )
+    parser.add_argument(
+        '--worker-concurrency',
+        type=parse_int_list,
+        default=[10, 100],
+        help='Worker slot limits to compare (default: 10,100)',
+    )
+    parser.add_argument(
+        '--workflows',
+        type=int,
+        default=500,
+        help='Workflows drained per worker measurement (default: 500)',
+    )
+    parser.add_argument(
+        '--activities',
+        type=int,
+        default=1,
+        help='No-op activities per benchmark workflow (default: 1)',
+    )
+    return parser.parse_args(argv)
+
+
+async def main(args) -> None:
+    """Run the selected benchmarks."""
+    selected = BENCHMARKS if args.benchmark == 'all' else (args.benchmark,)
+
+    async with temporal_environment(args.env, args.address) as env:
+        print(f"🚀 Benchmarking against {env.kind} server at {env.address}")
+        results = {}
+        if 'api' in selected:
+            results['api'] = await bench_api.run(
+                env,
+                workflow=args.workflow,
+                concurrency_levels=args.concurrency,
+                requests=args.requests,
+                wait=not args.no_wait,
+                params=(
+                    {'activities': args.activities}
+                    if args.workflow == 'benchmark' else None
+                ),
+            )
+        if 'client' in selected:
+            results['client'] = await bench_client.run(
+                env,
+                concurrency_levels=args.concurrency,
+                starts=args.requests,
+            )
+        if 'worker' in selected:
+            results['worker'] = await bench_worker.run(
+                env,
+                concurrency_levels=args.worker_concurrency,
+                workflows=args.workflows,
+                activities=args.activities,
+            )
+
+        path = write_results(results, env, args.output)
+    print(f"✅ Results written to {path}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main(parse_args()))
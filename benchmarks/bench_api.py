@@ -0,0 +1,122 @@
+"""Requests per second and latency of ``POST /api/workflows/<id>/run``."""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from werkzeug.serving import make_server
+
+from benchmarks.common import BenchmarkEnvironment, running_worker, summarize
+
+
+def _create_server(env: BenchmarkEnvironment):
+    """Serve the Flask app, pointed at the benchmark server, on a free port."""
+    from app import create_app
+    from app.config import Config
+
+    class BenchmarkConfig(Config):
+        TEMPORAL_ADDRESS = env.address
+        TEMPORAL_NAMESPACE = env.namespace
+        DEBUG = False
+
+    server = make_server(
+        '127.0.0.1', 0, create_app(BenchmarkConfig), threaded=True
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _post(url: str, body: bytes) -> float:
+    """POST one launch request and return its latency in seconds."""
+    request = urllib.request.Request(
+        url, data=body, headers={'Content-Type': 'application/json'}
+    )
+    started = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=300) as response:
+        response.read()
+        if response.status >= 300:
+            raise urllib.error.HTTPError(
+                url, response.status, 'unexpected status', response.headers, None
+            )
+    return time.perf_counter() - started
+
+
+def _load(url: str, body: bytes, concurrency: int, requests: int) -> Dict[str, Any]:
+    """Send ``requests`` launches with ``concurrency`` in flight."""
+    latencies: List[float] = []
+    errors = 0
+
+    def _one(_):
+        try:
+            return _post(url, body)
+        except Exception:
+            return None
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        for latency in pool.map(_one, range(requests)):
+            if latency is None:
+                errors += 1
+            else:
+                latencies.append(latency)
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run(env: BenchmarkEnvironment, workflow: str = 'benchmark',
+              concurrency_levels=(1, 8, 32), requests: int = 200,
+              wait: bool = True, params=None) -> List[Dict[str, Any]]:
+    """Benchmark the launch endpoint at each concurrency level.
+
+    The API runs in-process on the threaded Werkzeug server and the worker
+    on this event loop, so the load generator runs in a thread.
+
+    Args:
+        env: Benchmark environment
+        workflow: Workflow ID from the catalog to launch
+        concurrency_levels: Requests in flight per measurement
+        requests: Requests per measurement
+        wait: Wait for the result (``?wait=false`` returns after the start)
+        params: JSON parameters of each launch
+
+    Returns:
+        One result per concurrency level
+    """
+    import benchmarks.workloads  # noqa: F401  (registers the workload)
+
+    server = _create_server(env)
+    url = f'http://127.0.0.1:{server.server_port}/api/workflows/{workflow}/run'
+    if not wait:
+        url += '?wait=false'
+    body = json.dumps(params or {}).encode('utf-8')
+
+    results = []
+    try:
+        async with running_worker(env.client):
+            # Warm up the shared client and the worker
+            await asyncio.to_thread(_load, url, body, 1, 3)
+            for concurrency in concurrency_levels:
+                result = await asyncio.to_thread(
+                    _load, url, body, concurrency, requests
+                )
+                results.append({
+                    'workflow': workflow,
+                    'wait': wait,
+                    'concurrency': concurrency,
+                    **result,
+                })
+                print(
+                    f"   api  concurrency={concurrency:<4} "
+                    f"{result['per_second']:>8} req/s  "
+                    f"p50={result['latency_ms']['p50']}ms "
+                    f"p99={result['latency_ms']['p99']}ms "
+                    f"errors={result['errors']}",
+                    flush=True,
+                )
+    finally:
+        server.shutdown()
+    return results
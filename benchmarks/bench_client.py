@@ -0,0 +1,89 @@
+"""Start throughput of the client path in ``temporal_client.py``."""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List
+
+from benchmarks.common import BenchmarkEnvironment, running_worker, summarize
+
+
+async def _measure(operation, concurrency: int, count: int) -> Dict[str, Any]:
+    """Run ``operation`` ``count`` times with ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def _one(index):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await operation(index)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one(index) for index in range(count)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run(env: BenchmarkEnvironment, concurrency_levels=(1, 8, 32),
+              starts: int = 200, helper_starts: int = 20) -> List[Dict[str, Any]]:
+    """Benchmark workflow starts through the client.
+
+    Two modes are measured per concurrency level:
+
+    - ``start_test_workflow``: the helper in ``temporal_client.py``, which
+      connects, starts ``TestWorkflow`` and waits for its result (bounded
+      by the 1 second sleep of ``test_activity``)
+    - ``start_workflow``: starts only, over one shared client
+
+    Args:
+        env: Benchmark environment
+        concurrency_levels: Starts in flight per measurement
+        starts: Starts per ``start_workflow`` measurement
+        helper_starts: Calls per ``start_test_workflow`` measurement
+
+    Returns:
+        One result per mode and concurrency level
+    """
+    import temporal_client
+    from benchmarks.workloads import BenchmarkWorkflow
+    from temporal.config import config
+
+    # temporal_client reads the server address from the temporal config
+    config.ADDRESS, config.NAMESPACE = env.address, env.namespace
+    run_id = uuid.uuid4().hex[:8]
+
+    async def _helper(index):
+        await temporal_client.start_test_workflow(f'bench-{index}')
+
+    async def _start_only(index):
+        await env.client.start_workflow(
+            BenchmarkWorkflow.run,
+            args=['', 0],
+            id=f'bench-client-{run_id}-{index}-{time.monotonic_ns()}',
+            task_queue=config.DEFAULT_TASK_QUEUE,
+        )
+
+    results = []
+    async with running_worker(env.client):
+        for mode, operation, count in (
+            ('start_test_workflow', _helper, helper_starts),
+            ('start_workflow', _start_only, starts),
+        ):
+            for concurrency in concurrency_levels:
+                result = await _measure(operation, concurrency, count)
+                results.append({'mode': mode, 'concurrency': concurrency, **result})
+                print(
+                    f"   client {mode:<20} concurrency={concurrency:<4} "
+                    f"{result['per_second']:>8} /s  "
+                    f"p50={result['latency_ms']['p50']}ms "
+                    f"p99={result['latency_ms']['p99']}ms "
+                    f"errors={result['errors']}",
+                    flush=True,
+                )
+    return results
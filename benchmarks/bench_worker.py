@@ -0,0 +1,76 @@
+"""Workflow and activity completions per second of the worker."""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List
+
+from benchmarks.common import BenchmarkEnvironment, running_worker
+
+
+async def run(env: BenchmarkEnvironment, concurrency_levels=(10, 100),
+              workflows: int = 500, activities: int = 1) -> List[Dict[str, Any]]:
+    """Drain a backlog of benchmark workflows at each worker concurrency.
+
+    For every level the workflows are started on a fresh task queue before
+    the worker exists, then a worker from ``temporal_worker.create_worker``
+    with ``max_concurrent_activities`` and ``max_concurrent_workflow_tasks``
+    set to the level drains them. The time to the last result gives the
+    completion rates.
+
+    Args:
+        env: Benchmark environment
+        concurrency_levels: Worker slot limits to compare
+        workflows: Workflows per measurement
+        activities: No-op activities per workflow
+
+    Returns:
+        One result per concurrency level
+    """
+    from benchmarks.workloads import BenchmarkWorkflow
+
+    results = []
+    for concurrency in concurrency_levels:
+        task_queue = f'benchmark-worker-{uuid.uuid4().hex[:8]}'
+        handles = await asyncio.gather(*(
+            env.client.start_workflow(
+                BenchmarkWorkflow.run,
+                args=['', activities],
+                id=f'{task_queue}-{index}',
+                task_queue=task_queue,
+            )
+            for index in range(workflows)
+        ))
+
+        options = {
+            'max_concurrent_activities': concurrency,
+            'max_concurrent_workflow_tasks': concurrency,
+        }
+        async with running_worker(env.client, task_queue, options):
+            started = time.perf_counter()
+            outcomes = await asyncio.gather(
+                *(handle.result() for handle in handles),
+                return_exceptions=True,
+            )
+            elapsed = time.perf_counter() - started
+        errors = sum(isinstance(outcome, BaseException) for outcome in outcomes)
+
+        completed = workflows - errors
+        result = {
+            'concurrency': concurrency,
+            'workflows': workflows,
+            'activities_per_workflow': activities,
+            'errors': errors,
+            'elapsed_s': round(elapsed, 4),
+            'workflows_per_second': round(completed / elapsed, 2),
+            'activities_per_second': round(completed * activities / elapsed, 2),
+        }
+        results.append(result)
+        print(
+            f"   worker concurrency={concurrency:<4} "
+            f"{result['workflows_per_second']:>8} workflows/s  "
+            f"{result['activities_per_second']:>8} activities/s  "
+            f"errors={errors}",
+            flush=True,
+        )
+    return results
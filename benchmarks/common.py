@@ -0,0 +1,214 @@
+"""Helpers shared by the benchmarks."""
+
+import json
+import os
+import platform
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import temporalio
+from temporalio.client import Client
+from temporalio.testing import WorkflowEnvironment
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+@dataclass
+class BenchmarkEnvironment:
+    """Temporal server a benchmark runs against."""
+
+    kind: str
+    client: Client
+    address: str
+    namespace: str
+
+
+@asynccontextmanager
+async def temporal_environment(kind: str = 'local', address: Optional[str] = None):
+    """Start (or connect to) the Temporal server for a benchmark run.
+
+    Args:
+        kind: ``local`` (temporalio dev server), ``time-skipping`` (test
+            server) or ``existing`` (connect to ``address``)
+        address: Server address for ``existing``
+
+    Yields:
+        BenchmarkEnvironment
+    """
+    from temporal.shared.converter import create_data_converter
+
+    # The API under test connects with the shared converter; the worker
+    # must decode what it writes
+    data_converter = create_data_converter()
+
+    if kind == 'existing':
+        from temporal.config import config
+
+        address = address or config.ADDRESS
+        client = await Client.connect(
+            address, namespace=config.NAMESPACE, data_converter=data_converter
+        )
+        yield BenchmarkEnvironment(kind, client, address, config.NAMESPACE)
+        return
+
+    if kind == 'local':
+        env = await WorkflowEnvironment.start_local(
+            data_converter=data_converter
+        )
+    elif kind == 'time-skipping':
+        env = await WorkflowEnvironment.start_time_skipping(
+            data_converter=data_converter
+        )
+    else:
+        raise ValueError(f'Unknown environment {kind!r}')
+
+    try:
+        yield BenchmarkEnvironment(
+            kind,
+            env.client,
+            env.client.service_client.config.target_host,
+            env.client.namespace,
+        )
+    finally:
+        await env.shutdown()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: Iterable[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """Throughput and latency percentiles of one measurement.
+
+    Args:
+        latencies: Seconds each successful operation took
+        elapsed: Wall time of the whole measurement in seconds
+        errors: Number of failed operations
+
+    Returns:
+        Dict with count, errors, per-second rate and latencies in ms
+    """
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        'count': count,
+        'errors': errors,
+        'elapsed_s': round(elapsed, 4),
+        'per_second': round(count / elapsed, 2) if elapsed else 0.0,
+        'latency_ms': {
+            'mean': round(sum(values) / count * 1000, 3) if count else 0.0,
+            'p50': round(percentile(values, 50) * 1000, 3),
+            'p95': round(percentile(values, 95) * 1000, 3),
+            'p99': round(percentile(values, 99) * 1000, 3),
+            'max': round(values[-1] * 1000, 3) if count else 0.0,
+        },
+    }
+
+
+def parse_int_list(value: str) -> List[int]:
+    """Parse a comma separated list of integers such as ``1,8,32``."""
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def _git_commit() -> Optional[str]:
+    """Commit the benchmarks ran on, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(results: Dict[str, Any], env: BenchmarkEnvironment,
+                  path: Optional[str] = None) -> str:
+    """Write benchmark results with run metadata as JSON.
+
+    Args:
+        results: Results keyed by benchmark name
+        env: Environment the benchmarks ran against
+        path: Output file (default: ``benchmarks/results/<time>-<commit>.json``)
+
+    Returns:
+        Path of the written file
+    """
+    commit = _git_commit()
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(
+            RESULTS_DIR,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{commit or 'nogit'}.json",
+        )
+
+    document = {
+        'metadata': {
+            'commit': commit,
+            'timestamp': time.time(),
+            'environment': env.kind,
+            'python': platform.python_version(),
+            'temporalio': temporalio.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+@asynccontextmanager
+async def running_worker(client: Client, task_queue: Optional[str] = None,
+                         worker_options: Optional[Dict[str, Any]] = None):
+    """Run a worker built by ``temporal_worker.create_worker`` in the background.
+
+    It serves the registered workflows and activities plus the benchmark
+    workloads, with ``worker_options`` applied as per-queue overrides.
+
+    Args:
+        client: Client of the benchmark environment
+        task_queue: Task queue to poll (default: ``TEMPORAL_TASK_QUEUE``)
+        worker_options: Worker tuning options, e.g.
+            ``{'max_concurrent_activities': 10}``
+
+    Yields:
+        The running Worker
+    """
+    import temporal.activities  # noqa: F401
+    import temporal.workflows  # noqa: F401
+    from benchmarks.workloads import ACTIVITIES, WORKFLOWS
+    from temporal.config import config
+    from temporal.registry import get_all_activities, get_all_workflows
+    from temporal_worker import create_worker
+
+    task_queue = task_queue or config.DEFAULT_TASK_QUEUE
+    previous = config.WORKER_QUEUE_OVERRIDES.get(task_queue)
+    config.WORKER_QUEUE_OVERRIDES[task_queue] = worker_options or {}
+    try:
+        worker, _, _, cleanups = create_worker(
+            client,
+            task_queue,
+            get_all_workflows() + WORKFLOWS,
+            get_all_activities() + ACTIVITIES,
+        )
+    finally:
+        if previous is None:
+            config.WORKER_QUEUE_OVERRIDES.pop(task_queue, None)
+        else:
+            config.WORKER_QUEUE_OVERRIDES[task_queue] = previous
+
+    try:
+        async with worker:
+            yield worker
+    finally:
+        for cleanup in cleanups:
+            cleanup()
@@ -0,0 +1,68 @@
+"""Workflow and activity with no work of their own.
+
+They measure the overhead of the launch path and the worker rather than
+the 1 second sleep of ``test_activity``.
+"""
+
+from datetime import timedelta
+
+from temporalio import activity, workflow
+
+from temporal.workflow_metadata import register_workflow_metadata
+
+
+@activity.defn(name='benchmark_noop_activity')
+async def noop_activity(payload: str) -> str:
+    """Return the payload unchanged."""
+    return payload
+
+
+@workflow.defn(name='BenchmarkWorkflow', sandboxed=False)
+class BenchmarkWorkflow:
+    """Run ``activities`` no-op activities in sequence."""
+
+    @workflow.run
+    async def run(self, payload: str = '', activities: int = 1) -> str:
+        """Run the benchmark workflow.
+
+        Args:
+            payload: String passed through every activity
+            activities: Number of activities to run
+
+        Returns:
+            The payload
+        """
+        for _ in range(activities):
+            payload = await workflow.execute_activity(
+                noop_activity,
+                payload,
+                start_to_close_timeout=timedelta(seconds=30),
+            )
+        return payload
+
+
+register_workflow_metadata(
+    workflow_id='benchmark',
+    name='Benchmark Workflow',
+    description='Runs no-op activities to measure framework overhead',
+    workflow_class=BenchmarkWorkflow,
+    parameters=[
+        {
+            'name': 'payload',
+            'type': 'string',
+            'default': '',
+            'required': False,
+        },
+        {
+            'name': 'activities',
+            'type': 'integer',
+            'default': 1,
+            'min': 0,
+            'required': False,
+        },
+    ],
+    category='benchmark',
+)
+
+WORKFLOWS = [BenchmarkWorkflow]
+ACTIVITIES = [noop_activity]
@@ -15,3 +15,13 @@ ACTIVITIES = [
     test_activity,
 ]
 
+# Sync (non-async) activities run in the worker's thread pool. Register
+# CPU-bound ones for the process pool instead, which also pins them to the
+# "cpu" task queue class:
+# from temporal.registry import register_activity
+# register_activity(render_report, executor="process")
+
+# Short activities (lookups, validation) can run as local activities in
+# the worker of the calling workflow; call them with
+# temporal.shared.execute_activity:
+# register_activity(validate_input, local=True)
@@ -1,7 +1,37 @@
 """Temporal configuration."""
 
+import json
 import os
-from typing import Optional
+import tempfile
+from typing import Any, Dict, List, Optional
+
+
+def _env_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    """Read an optional integer from the environment."""
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def _env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    """Read an optional float from the environment."""
+    value = os.environ.get(name)
+    return float(value) if value not in (None, '') else default
+
+
+# Worker options that can be tuned globally and per task queue, mapped to
+# the TemporalConfig attribute holding the global value
+WORKER_OPTIONS = {
+    'max_concurrent_activities': 'WORKER_MAX_CONCURRENT_ACTIVITIES',
+    'max_concurrent_workflow_tasks': 'WORKER_MAX_CONCURRENT_WORKFLOW_TASKS',
+    'max_concurrent_local_activities': 'WORKER_MAX_CONCURRENT_LOCAL_ACTIVITIES',
+    'max_concurrent_workflow_task_polls': 'WORKER_MAX_CONCURRENT_WORKFLOW_TASK_POLLS',
+    'max_concurrent_activity_task_polls': 'WORKER_MAX_CONCURRENT_ACTIVITY_TASK_POLLS',
+    'max_cached_workflows': 'WORKER_MAX_CACHED_WORKFLOWS',
+    'max_activities_per_second': 'WORKER_MAX_ACTIVITIES_PER_SECOND',
+    'max_task_queue_activities_per_second': (
+        'WORKER_MAX_TASK_QUEUE_ACTIVITIES_PER_SECOND'
+    ),
+}
 
 
 class TemporalConfig:
@@ -17,15 +47,231 @@ class TemporalConfig:
         'test-task-queue'
     )
 
+    # Queue classes workflows and activities can be routed to by name
+    TASK_QUEUE_CLASSES: Dict[str, str] = {
+        'interactive': os.environ.get(
+            'TEMPORAL_TASK_QUEUE_INTERACTIVE',
+            f'{DEFAULT_TASK_QUEUE}-interactive',
+        ),
+        'io': os.environ.get(
+            'TEMPORAL_TASK_QUEUE_IO',
+            f'{DEFAULT_TASK_QUEUE}-io',
+        ),
+        'cpu': os.environ.get(
+            'TEMPORAL_TASK_QUEUE_CPU',
+            f'{DEFAULT_TASK_QUEUE}-cpu',
+        ),
+    }
+
     # Worker configuration
-    # Note: These are kept for future use if needed
-    # The Worker class handles concurrency automatically
+    # Unset values fall back to the temporalio Worker defaults
+    WORKER_MAX_CONCURRENT_ACTIVITIES: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CONCURRENT_ACTIVITIES'
+    )
+    WORKER_MAX_CONCURRENT_WORKFLOW_TASKS: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CONCURRENT_WORKFLOW_TASKS'
+    )
+    WORKER_MAX_CONCURRENT_LOCAL_ACTIVITIES: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CONCURRENT_LOCAL_ACTIVITIES'
+    )
+    WORKER_MAX_CONCURRENT_WORKFLOW_TASK_POLLS: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CONCURRENT_WORKFLOW_TASK_POLLS'
+    )
+    WORKER_MAX_CONCURRENT_ACTIVITY_TASK_POLLS: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CONCURRENT_ACTIVITY_TASK_POLLS'
+    )
+    # Sticky workflow cache size
+    WORKER_MAX_CACHED_WORKFLOWS: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_MAX_CACHED_WORKFLOWS'
+    )
+    # Activity rate limits, per worker and across the whole task queue
+    WORKER_MAX_ACTIVITIES_PER_SECOND: Optional[float] = _env_float(
+        'TEMPORAL_WORKER_MAX_ACTIVITIES_PER_SECOND'
+    )
+    WORKER_MAX_TASK_QUEUE_ACTIVITIES_PER_SECOND: Optional[float] = _env_float(
+        'TEMPORAL_WORKER_MAX_TASK_QUEUE_ACTIVITIES_PER_SECOND'
+    )
+
+    # Executor sizes for sync activities (thread pool defaults to the
+    # queue's max_concurrent_activities, process pool to the CPU count)
+    WORKER_ACTIVITY_THREADS: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_ACTIVITY_THREADS'
+    )
+    WORKER_ACTIVITY_PROCESSES: Optional[int] = _env_int(
+        'TEMPORAL_WORKER_ACTIVITY_PROCESSES'
+    )
+
+    # Seconds running activities get to finish when a worker shuts down
+    WORKER_GRACEFUL_SHUTDOWN_SECONDS: float = _env_float(
+        'TEMPORAL_WORKER_GRACEFUL_SHUTDOWN_SECONDS', 10.0
+    )
+
+    # Prometheus exporter of the temporalio runtime (schedule-to-start
+    # latency, slot usage, sticky cache hits); disabled when no port is set.
+    # Supervised worker processes listen on consecutive ports.
+    WORKER_METRICS_PORT: Optional[int] = _env_int('TEMPORAL_WORKER_METRICS_PORT')
+    WORKER_METRICS_HOST: str = os.environ.get(
+        'TEMPORAL_WORKER_METRICS_HOST', '0.0.0.0'
+    )
+
+    # Activity and workflow step profiling (temporal.shared.profiling)
+    WORKER_PROFILE: bool = (
+        os.environ.get('TEMPORAL_WORKER_PROFILE', 'false').lower() == 'true'
+    )
+    WORKER_PROFILE_BUFFER: int = _env_int('TEMPORAL_WORKER_PROFILE_BUFFER', 1000)
+    WORKER_PROFILE_TOP: int = _env_int('TEMPORAL_WORKER_PROFILE_TOP', 20)
+    # Fraction of activities whose argument and result sizes are measured;
+    # each measurement serializes them again
+    WORKER_PROFILE_PAYLOAD_SAMPLE: float = _env_float(
+        'TEMPORAL_WORKER_PROFILE_PAYLOAD_SAMPLE', 0.01
+    )
+    WORKER_PROFILE_DIR: str = os.environ.get(
+        'TEMPORAL_WORKER_PROFILE_DIR',
+        os.path.join(tempfile.gettempdir(), 'temporal-profiles'),
+    )
+    # Comma separated activity names to run under cProfile
+    WORKER_CPROFILE_ACTIVITIES: List[str] = [
+        name.strip()
+        for name in os.environ.get('TEMPORAL_WORKER_CPROFILE_ACTIVITIES', '').split(',')
+        if name.strip()
+    ]
+
+    # OpenTelemetry tracing of API requests, workflows and activities:
+    # 'none', 'otlp' (OTLP/HTTP to TRACING_OTLP_ENDPOINT) or 'file' (JSON
+    # lines appended to TRACING_FILE)
+    TRACING_EXPORTER: str = os.environ.get(
+        'TEMPORAL_TRACING_EXPORTER', 'none'
+    ).lower()
+    TRACING_OTLP_ENDPOINT: str = os.environ.get(
+        'TEMPORAL_TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces'
+    )
+    TRACING_FILE: str = os.environ.get(
+        'TEMPORAL_TRACING_FILE',
+        os.path.join(tempfile.gettempdir(), 'temporal-traces.jsonl'),
+    )
+
+    # Payload converter (temporal.shared.payload_converter): 'fast' (orjson
+    # when installed, raw bytes for binary values) or 'default' (temporalio)
+    PAYLOAD_CONVERTER: str = os.environ.get(
+        'TEMPORAL_PAYLOAD_CONVERTER', 'fast'
+    ).lower()
+
+    # Payload compression (temporal.shared.compression): 'zlib', 'zstd'
+    # (needs the zstandard package in every process) or 'none'. Payloads
+    # smaller than the threshold in bytes stay as they are.
+    PAYLOAD_COMPRESSION: str = os.environ.get(
+        'TEMPORAL_PAYLOAD_COMPRESSION', 'zlib'
+    ).lower()
+    PAYLOAD_COMPRESSION_THRESHOLD: int = _env_int(
+        'TEMPORAL_PAYLOAD_COMPRESSION_THRESHOLD', 4096
+    )
+    PAYLOAD_COMPRESSION_LEVEL: Optional[int] = _env_int(
+        'TEMPORAL_PAYLOAD_COMPRESSION_LEVEL'
+    )
+
+    # Claim checks (temporal.shared.claim_check): payloads of at least
+    # CLAIM_CHECK_THRESHOLD bytes (after compression) are kept in a blob
+    # store and only referenced from history. Store: 'none', 'local' (the
+    # CLAIM_CHECK_DIR directory, which every API and worker process must be
+    # able to read) or 's3'.
+    CLAIM_CHECK_STORE: str = os.environ.get(
+        'TEMPORAL_CLAIM_CHECK_STORE', 'none'
+    ).lower()
+    CLAIM_CHECK_THRESHOLD: int = _env_int(
+        'TEMPORAL_CLAIM_CHECK_THRESHOLD', 512 * 1024
+    )
+    CLAIM_CHECK_DIR: Optional[str] = os.environ.get('TEMPORAL_CLAIM_CHECK_DIR')
+    CLAIM_CHECK_S3_BUCKET: Optional[str] = os.environ.get(
+        'TEMPORAL_CLAIM_CHECK_S3_BUCKET'
+    )
+    CLAIM_CHECK_S3_PREFIX: str = os.environ.get(
+        'TEMPORAL_CLAIM_CHECK_S3_PREFIX', 'temporal-payloads/'
+    )
+    # Endpoint of an S3-compatible service such as MinIO
+    CLAIM_CHECK_S3_ENDPOINT: Optional[str] = os.environ.get(
+        'TEMPORAL_CLAIM_CHECK_S3_ENDPOINT'
+    )
+    # Blobs not referenced for this long are deleted by the worker; must
+    # exceed the longest workflow run plus the namespace history retention
+    CLAIM_CHECK_RETENTION_SECONDS: float = _env_float(
+        'TEMPORAL_CLAIM_CHECK_RETENTION_SECONDS', 30 * 24 * 3600.0
+    )
+    # Seconds between garbage collections (0 disables them)
+    CLAIM_CHECK_GC_INTERVAL_SECONDS: float = _env_float(
+        'TEMPORAL_CLAIM_CHECK_GC_INTERVAL_SECONDS', 3600.0
+    )
+
+    # Per task queue overrides as JSON, e.g.
+    # {"test-task-queue": {"max_concurrent_activities": 50}}
+    WORKER_QUEUE_OVERRIDES: Dict[str, Dict[str, Any]] = json.loads(
+        os.environ.get('TEMPORAL_WORKER_QUEUE_OVERRIDES') or '{}'
+    )
 
     # Retry configuration
     DEFAULT_RETRY_MAX_ATTEMPTS: int = 3
     DEFAULT_ACTIVITY_TIMEOUT_SECONDS: int = 30
     DEFAULT_WORKFLOW_TIMEOUT_SECONDS: int = 300
 
+    # Local activities (registered with local=True) are short and retried
+    # within the workflow task, so they get a tight timeout and backoff
+    DEFAULT_LOCAL_ACTIVITY_TIMEOUT_SECONDS: int = 5
+    DEFAULT_LOCAL_RETRY_MAX_INTERVAL_SECONDS: int = 5
+
+    # Directory of the on-disk activity result caches shared by the worker
+    # processes of a host; private to the user the workers run as
+    ACTIVITY_CACHE_DIR: str = os.environ.get(
+        'TEMPORAL_ACTIVITY_CACHE_DIR',
+        os.path.join(
+            os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+            'temporal-activity-cache',
+        ),
+    )
+
+    def resolve_task_queue(self, task_queue: Optional[str] = None) -> str:
+        """Resolve a task queue name or queue class to a task queue.
+
+        Args:
+            task_queue: Task queue name, a key of ``TASK_QUEUE_CLASSES``
+                (``interactive``, ``io``, ``cpu``) or None for the default
+
+        Returns:
+            Task queue name
+        """
+        if not task_queue:
+            return self.DEFAULT_TASK_QUEUE
+        return self.TASK_QUEUE_CLASSES.get(task_queue, task_queue)
+
+    def get_worker_options(self, task_queue: str) -> Dict[str, Any]:
+        """Get tuning keyword arguments for a ``Worker`` on a task queue.
+
+        Args:
+            task_queue: Task queue the worker polls
+
+        Returns:
+            Worker keyword arguments that are set, overrides applied
+
+        Raises:
+            ValueError: If an override names an unknown option
+        """
+        options = {
+            option: getattr(self, attr)
+            for option, attr in WORKER_OPTIONS.items()
+            if getattr(self, attr) is not None
+        }
+
+        overrides = self.WORKER_QUEUE_OVERRIDES.get(task_queue, {})
+        unknown = set(overrides) - set(WORKER_OPTIONS)
+        if unknown:
+            raise ValueError(
+                f'Unknown worker options for task queue {task_queue}: '
+                f'{", ".join(sorted(unknown))}'
+            )
+        options.update(
+            (option, value) for option, value in overrides.items()
+            if value is not None
+        )
+        return options
+
 
 # Global config instance
 config = TemporalConfig()
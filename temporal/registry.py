@@ -1,6 +1,25 @@
 """Workflow and activity registry for auto-discovery."""
 
-from typing import List, Type, Any
+import inspect
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Any
+
+
+# Activity name -> task queue, for activities pinned to a queue. Activities
+# not listed here run on the task queue of the workflow that calls them.
+ACTIVITY_TASK_QUEUES: Dict[str, str] = {}
+
+# How activities are executed by the worker
+ACTIVITY_EXECUTOR_ASYNC = 'async'
+ACTIVITY_EXECUTOR_THREAD = 'thread'
+ACTIVITY_EXECUTOR_PROCESS = 'process'
+
+# Activity name -> executor kind, for activities declared explicitly.
+# Others are "async" for ``async def`` functions and "thread" otherwise.
+ACTIVITY_EXECUTORS: Dict[str, str] = {}
+
+# Names of short activities run as local activities: in the worker that
+# runs the calling workflow, without a task queue round trip
+LOCAL_ACTIVITIES: Set[str] = set()
 
 
 def get_all_workflows() -> List[Type]:
@@ -34,13 +53,159 @@ def register_workflow(workflow_class: Type) -> None:
         WORKFLOWS.append(workflow_class)
 
 
-def register_activity(activity_func) -> None:
+def register_activity(
+    activity_func,
+    task_queue: Optional[str] = None,
+    executor: Optional[str] = None,
+    local: bool = False,
+) -> None:
     """Register an activity function.
 
     Args:
         activity_func: Activity function to register
+        task_queue: Task queue or queue class (``interactive``, ``io``,
+            ``cpu``) to pin the activity to; by default it runs on the
+            task queue of the calling workflow
+        executor: ``"async"``, ``"thread"`` for blocking sync functions or
+            ``"process"`` for CPU-bound sync functions (default: detected
+            from the function). Process activities are pinned to the
+            ``cpu`` queue class unless ``task_queue`` is given.
+        local: Run as a local activity in the worker of the calling
+            workflow (for short activities; see
+            ``temporal.shared.execute_activity``)
+
+    Raises:
+        ValueError: If the executor does not match the function, or a
+            local activity is pinned to a task queue or process executor
     """
     from temporal.activities import ACTIVITIES
+    from temporal.config import config
+
+    name = get_activity_name(activity_func)
+    if local and (task_queue or executor == ACTIVITY_EXECUTOR_PROCESS):
+        raise ValueError(
+            f'Local activity {name} runs on the worker of the calling '
+            f'workflow and cannot be pinned to a task queue or the '
+            f'"process" executor'
+        )
+    if executor is not None:
+        is_async = inspect.iscoroutinefunction(activity_func)
+        if executor not in (
+            ACTIVITY_EXECUTOR_ASYNC,
+            ACTIVITY_EXECUTOR_THREAD,
+            ACTIVITY_EXECUTOR_PROCESS,
+        ):
+            raise ValueError(f'Unknown activity executor "{executor}"')
+        if is_async != (executor == ACTIVITY_EXECUTOR_ASYNC):
+            raise ValueError(
+                f'Activity {name} is {"async" if is_async else "sync"} and '
+                f'cannot use the "{executor}" executor'
+            )
+        ACTIVITY_EXECUTORS[name] = executor
+        if executor == ACTIVITY_EXECUTOR_PROCESS and not task_queue:
+            task_queue = 'cpu'
+
     if activity_func not in ACTIVITIES:
         ACTIVITIES.append(activity_func)
+    if task_queue:
+        ACTIVITY_TASK_QUEUES[name] = config.resolve_task_queue(task_queue)
+    if local:
+        LOCAL_ACTIVITIES.add(name)
+
+
+def get_activity_executor(activity_func: Callable) -> str:
+    """Get how an activity is executed by the worker.
+
+    Args:
+        activity_func: Activity function
+
+    Returns:
+        ``"async"``, ``"thread"`` or ``"process"``
+    """
+    executor = ACTIVITY_EXECUTORS.get(get_activity_name(activity_func))
+    if executor:
+        return executor
+    if inspect.iscoroutinefunction(activity_func):
+        return ACTIVITY_EXECUTOR_ASYNC
+    return ACTIVITY_EXECUTOR_THREAD
+
+
+def get_activity_name(activity_func: Callable) -> str:
+    """Get the Temporal activity type name of an activity function.
+
+    Args:
+        activity_func: Function decorated with ``@activity.defn``
+
+    Returns:
+        Activity name
+    """
+    definition = getattr(activity_func, '__temporal_activity_definition', None)
+    return definition.name if definition else activity_func.__name__
+
+
+def get_activity_task_queue(activity_name: str) -> Optional[str]:
+    """Get the task queue an activity is pinned to.
+
+    Args:
+        activity_name: Activity type name
+
+    Returns:
+        Task queue name, or None to use the calling workflow's queue
+    """
+    return ACTIVITY_TASK_QUEUES.get(activity_name)
+
+
+def is_local_activity(activity_name: str) -> bool:
+    """Check whether an activity was registered to run locally.
+
+    Args:
+        activity_name: Activity type name
+
+    Returns:
+        True for local activities
+    """
+    return activity_name in LOCAL_ACTIVITIES
+
+
+def get_task_queue_registrations(
+    task_queues: Optional[Iterable[str]] = None,
+) -> Dict[str, Tuple[List[Type], List[Callable]]]:
+    """Group workflows and activities by the task queue that serves them.
+
+    Workflows go to the queue from their metadata (the default queue when
+    they have none). Pinned activities go to their queue only; the others
+    are registered on every workflow queue so they run next to the
+    workflows that call them.
+
+    Args:
+        task_queues: Only include these queues (names or queue classes)
+
+    Returns:
+        Mapping of task queue to ``(workflows, activities)``
+    """
+    from temporal.config import config
+    from temporal.workflow_metadata import get_all_workflow_metadata
+
+    workflow_queues = {
+        meta.workflow_class: meta.task_queue
+        for meta in get_all_workflow_metadata()
+    }
+
+    registrations: Dict[str, Tuple[List[Type], List[Callable]]] = {}
+    for workflow_class in get_all_workflows():
+        queue = workflow_queues.get(workflow_class, config.DEFAULT_TASK_QUEUE)
+        registrations.setdefault(queue, ([], []))[0].append(workflow_class)
+
+    workflow_queue_names = list(registrations)
+    for activity_func in get_all_activities():
+        pinned = get_activity_task_queue(get_activity_name(activity_func))
+        for queue in [pinned] if pinned else workflow_queue_names:
+            registrations.setdefault(queue, ([], []))[1].append(activity_func)
 
+    if task_queues is not None:
+        wanted = {config.resolve_task_queue(queue) for queue in task_queues}
+        registrations = {
+            queue: registered for queue, registered in registrations.items()
+            if queue in wanted
+        }
+    return registrations
@@ -3,7 +3,20 @@
 from datetime import timedelta
 from temporalio.common import RetryPolicy
 
-__all__ = ['get_default_retry_policy', 'get_default_activity_timeout']
+from temporal.shared.activity_cache import cached_activity, get_activity_cache_stats
+from temporal.shared.converter import create_data_converter
+from temporal.shared.execution import execute_activity
+
+__all__ = [
+    'get_default_retry_policy',
+    'get_default_activity_timeout',
+    'get_default_local_retry_policy',
+    'get_default_local_activity_timeout',
+    'execute_activity',
+    'cached_activity',
+    'get_activity_cache_stats',
+    'create_data_converter',
+]
 
 
 def get_default_retry_policy(max_attempts: int = None) -> RetryPolicy:
@@ -32,3 +45,32 @@ def get_default_activity_timeout() -> timedelta:
 
     return timedelta(seconds=config.DEFAULT_ACTIVITY_TIMEOUT_SECONDS)
 
+
+def get_default_local_retry_policy(max_attempts: int = None) -> RetryPolicy:
+    """Get default retry policy for local activities.
+
+    Args:
+        max_attempts: Maximum retry attempts (defaults to config)
+
+    Returns:
+        RetryPolicy instance with a short maximum backoff
+    """
+    from temporal.config import config
+
+    return RetryPolicy(
+        maximum_attempts=max_attempts or config.DEFAULT_RETRY_MAX_ATTEMPTS,
+        maximum_interval=timedelta(
+            seconds=config.DEFAULT_LOCAL_RETRY_MAX_INTERVAL_SECONDS
+        ),
+    )
+
+
+def get_default_local_activity_timeout() -> timedelta:
+    """Get default local activity timeout.
+
+    Returns:
+        timedelta for local activity timeout
+    """
+    from temporal.config import config
+
+    return timedelta(seconds=config.DEFAULT_LOCAL_ACTIVITY_TIMEOUT_SECONDS)
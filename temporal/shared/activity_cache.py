@@ -0,0 +1,393 @@
+"""Result caching for idempotent activities."""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from temporalio import activity
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import default as default_converter
+
+__all__ = [
+    'cached_activity',
+    'MemoryCache',
+    'DiskCache',
+    'ActivityCache',
+    'get_activity_cache_stats',
+]
+
+# Activity name -> cache, for reporting
+_CACHES: Dict[str, 'ActivityCache'] = {}
+
+
+def _dump_payload(value: Any) -> bytes:
+    """Serialize a value with the Temporal payload converter.
+
+    Results are stored the way the worker sends them to the server (JSON,
+    or raw bytes), so reading the cache never executes code.
+    """
+    payload = default_converter().payload_converter.to_payloads([value])[0]
+    return payload.SerializeToString()
+
+
+def _load_payload(data: bytes) -> Any:
+    """Deserialize a value written by ``_dump_payload``."""
+    payload = Payload.FromString(data)
+    return default_converter().payload_converter.from_payloads([payload])[0]
+
+
+def _private_directory(path: str) -> str:
+    """Create a directory only the current user can access.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        The path
+
+    Raises:
+        PermissionError: If the directory exists but belongs to another
+            user or is writable by others
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    shared = info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or shared):
+        raise PermissionError(
+            f'Cache directory {path} must be owned by the current user and '
+            f'not writable by others'
+        )
+    return path
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            ``(True, value)`` on a hit, ``(False, None)`` otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires < time.time():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """SQLite-backed cache shared by all worker processes on a host.
+
+    Values are serialized with the Temporal payload converter unless other
+    ``dumps``/``loads`` functions are given. Each thread and process opens
+    its own connection; WAL mode lets readers and a writer work
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 100_000,
+        dumps: Callable[[Any], bytes] = _dump_payload,
+        loads: Callable[[bytes], Any] = _load_payload,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (its directory is created with
+                mode 0700)
+            maxsize: Maximum number of entries before LRU eviction
+            dumps: Serializes a value to bytes
+            loads: Deserializes bytes written by ``dumps``
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.dumps = dumps
+        self.loads = loads
+        self._local = threading.local()
+        os.makedirs(
+            os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (once per thread and process) the database connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value BLOB, expires REAL, accessed REAL)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)'
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a key.
+
+        Returns:
+            ``(True, value)`` on a hit, ``(False, None)`` otherwise
+        """
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute(
+            'SELECT value, expires FROM cache WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        if row[1] < now:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            return False, None
+        try:
+            value = self.loads(row[0])
+        except Exception:
+            # Written in another format (e.g. by an older version)
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            return False, None
+        conn.execute('UPDATE cache SET accessed = ? WHERE key = ?', (now, key))
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds, evicting the least recently used."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires, accessed) '
+            'VALUES (?, ?, ?, ?)',
+            (key, self.dumps(value), now + ttl, now),
+        )
+        conn.execute(
+            'DELETE FROM cache WHERE key IN ('
+            'SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+            (self.maxsize,),
+        )
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._connection().execute('DELETE FROM cache')
+
+
+class ActivityCache:
+    """Two-tier (memory, then optional disk) cache for one activity.
+
+    Sync activities run in the worker's thread pool, so the counters are
+    updated under a lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        memory: MemoryCache,
+        disk: Optional[DiskCache] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            name: Activity name, used as key prefix
+            ttl: Seconds results stay valid
+            memory: In-process tier
+            disk: Optional host-wide tier shared by worker processes
+        """
+        self.name = name
+        self.ttl = ttl
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._converter = default_converter().payload_converter
+
+    def make_key(self, args: tuple, kwargs: dict) -> str:
+        """Build the cache key from the activity name and its arguments.
+
+        Arguments are serialized with the Temporal payload converter, the
+        same encoding they arrive in, so equal inputs give equal keys.
+        """
+        payloads = self._converter.to_payloads(
+            list(args) + [sorted(kwargs.items())]
+        )
+        digest = hashlib.sha256()
+        for payload in payloads:
+            digest.update(payload.SerializeToString(deterministic=True))
+        return f'{self.name}:{digest.hexdigest()}'
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a result in memory, then on disk."""
+        hit, value = self.memory.get(key)
+        if hit:
+            with self._stats_lock:
+                self.hits += 1
+            return True, value
+        if self.disk is not None:
+            hit, value = self.disk.get(key)
+            if hit:
+                with self._stats_lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                self.memory.set(key, value, self.ttl)
+                return True, value
+        with self._stats_lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result in every tier."""
+        self.memory.set(key, value, self.ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, self.ttl)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters of this process."""
+        with self._stats_lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
+
+
+def cached_activity(
+    ttl: float = 300.0,
+    maxsize: int = 1024,
+    disk: bool = False,
+    disk_path: Optional[str] = None,
+) -> Callable:
+    """Memoize an idempotent activity's results.
+
+    Apply it below or above ``@activity.defn``; sync and async functions
+    are supported. Only successful results are cached. The disk tier
+    stores results with the Temporal payload converter, so they must be
+    serializable like any activity result.
+
+        @activity.defn
+        @cached_activity(ttl=60, disk=True)
+        async def lookup_customer(customer_id: str) -> dict:
+            ...
+
+    Args:
+        ttl: Seconds a result stays valid
+        maxsize: Maximum entries in the in-process LRU
+        disk: Also use the host-wide on-disk tier
+        disk_path: SQLite file for the disk tier (default:
+            ``<ACTIVITY_CACHE_DIR>/<activity name>.sqlite3``, a directory
+            that must be private to the current user)
+
+    Returns:
+        Decorator
+    """
+    def decorator(fn: Callable) -> Callable:
+        definition = getattr(fn, '__temporal_activity_definition', None)
+        target = definition.fn if definition else fn
+        name = definition.name if definition else fn.__name__
+
+        disk_cache = None
+        if disk or disk_path:
+            from temporal.config import config
+
+            disk_cache = DiskCache(
+                disk_path
+                or os.path.join(
+                    _private_directory(config.ACTIVITY_CACHE_DIR),
+                    f'{name}.sqlite3',
+                )
+            )
+        cache = ActivityCache(name, ttl, MemoryCache(maxsize), disk_cache)
+        _CACHES[name] = cache
+
+        if inspect.iscoroutinefunction(target):
+            @functools.wraps(target)
+            async def wrapper(*args, **kwargs):
+                key = cache.make_key(args, kwargs)
+                # SQLite blocks; keep the disk tier off the event loop
+                if cache.disk is None:
+                    hit, value = cache.get(key)
+                else:
+                    hit, value = await asyncio.to_thread(cache.get, key)
+                if hit:
+                    return value
+                value = await target(*args, **kwargs)
+                if cache.disk is None:
+                    cache.set(key, value)
+                else:
+                    await asyncio.to_thread(cache.set, key, value)
+                return value
+        else:
+            @functools.wraps(target)
+            def wrapper(*args, **kwargs):
+                key = cache.make_key(args, kwargs)
+                hit, value = cache.get(key)
+                if hit:
+                    return value
+                value = target(*args, **kwargs)
+                cache.set(key, value)
+                return value
+
+        wrapper.cache = cache
+        if definition is not None:
+            # Re-define so the worker invokes the caching wrapper
+            wrapper.__dict__.pop('__temporal_activity_definition', None)
+            wrapper = activity.defn(name=name)(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def get_activity_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters of every cached activity in this process.
+
+    Returns:
+        Mapping of activity name to counters
+    """
+    return {name: cache.stats() for name, cache in _CACHES.items()}
@@ -0,0 +1,389 @@
+"""Claim-check codec keeping large payloads out of workflow history.
+
+Payloads at or above a size threshold are written to a blob store under
+the SHA-256 of their serialized bytes, and only that reference goes to
+the Temporal server. Identical payloads share one blob. Writing a
+reference to an existing blob refreshes its timestamp, and
+``BlobStore.collect_garbage`` deletes blobs that have not been referenced
+for longer than a retention period, which must exceed the longest running
+workflow plus the namespace's history retention.
+
+Stores:
+
+- ``LocalBlobStore``: a directory shared by the API and the workers of a
+  host (or a network file system), read through memory-mapped files
+- ``S3BlobStore``: any S3-compatible object store (needs ``boto3``)
+"""
+
+import abc
+import asyncio
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import time
+from typing import List, Optional, Sequence
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+__all__ = [
+    'CLAIM_CHECK_STORES',
+    'BlobStore',
+    'LocalBlobStore',
+    'S3BlobStore',
+    'ClaimCheckCodec',
+]
+
+CLAIM_CHECK_STORES = ('none', 'local', 's3')
+
+# Payload encoding of a reference; the data is the hex SHA-256 of the blob
+CLAIM_CHECK_ENCODING = b'binary/claim-check-sha256'
+
+_KEY_RE = re.compile(r'[0-9a-f]{64}')
+
+
+def check_key(key: str) -> str:
+    """Validate a blob key before it reaches a path or object name.
+
+    Keys come from payload data, so anything but a lowercase hex SHA-256
+    digest is rejected (e.g. ``../`` path traversal).
+
+    Args:
+        key: Blob key
+
+    Returns:
+        The key
+
+    Raises:
+        ValueError: If the key is not a hex SHA-256 digest
+    """
+    if not isinstance(key, str) or not _KEY_RE.fullmatch(key):
+        raise ValueError(f'Invalid claim-check blob key {key!r:.80}')
+    return key
+
+
+class BlobStore(abc.ABC):
+    """Content-addressed blob storage used by ``ClaimCheckCodec``.
+
+    Keys are hex SHA-256 digests of the content, so a blob never changes
+    once written.
+    """
+
+    @abc.abstractmethod
+    def put(self, key: str, data: bytes) -> bool:
+        """Store a blob, or refresh its timestamp if it already exists.
+
+        Args:
+            key: Hex SHA-256 of ``data``
+            data: Blob content
+
+        Returns:
+            True if the blob was written, False if it already existed
+        """
+
+    @abc.abstractmethod
+    def get(self, key: str):
+        """Read a blob.
+
+        Args:
+            key: Hex SHA-256 of the blob
+
+        Returns:
+            Bytes-like blob content
+
+        Raises:
+            KeyError: If the blob does not exist
+        """
+
+    @abc.abstractmethod
+    def collect_garbage(self, max_age: float) -> int:
+        """Delete blobs that were not referenced for ``max_age`` seconds.
+
+        Args:
+            max_age: Seconds since the last reference was written
+
+        Returns:
+            Number of deleted blobs
+        """
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files in a directory, fanned out by key prefix.
+
+    Files are written to a temporary name and renamed, so readers never
+    see partial blobs and several processes can share the directory.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the store.
+
+        Args:
+            directory: Blob directory (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __str__(self) -> str:
+        return self.directory
+
+    def _path(self, key: str) -> str:
+        """File of a blob."""
+        check_key(key)
+        return os.path.join(self.directory, key[:2], key)
+
+    def put(self, key: str, data: bytes) -> bool:
+        """Write the blob file unless it exists; touch it if it does."""
+        path = self._path(key)
+        try:
+            os.utime(path)
+            return False
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix='.tmp-'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return True
+
+    def get(self, key: str):
+        """Map the blob file into memory.
+
+        The returned memoryview keeps the mapping open until it is
+        released, so the payload is parsed without an extra copy.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise KeyError(key)
+        return memoryview(mapped)
+
+    def collect_garbage(self, max_age: float) -> int:
+        """Delete blob files whose timestamp is older than ``max_age``."""
+        cutoff = time.time() - max_age
+        deleted = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir():
+                continue
+            for blob in os.scandir(entry.path):
+                try:
+                    if blob.stat().st_mtime >= cutoff:
+                        continue
+                    if blob.name.startswith('.tmp-'):
+                        # Left behind by a writer that died
+                        os.unlink(blob.path)
+                        continue
+                    if self._delete_if_stale(blob.path, cutoff):
+                        deleted += 1
+                except FileNotFoundError:
+                    continue
+        return deleted
+
+    @staticmethod
+    def _delete_if_stale(path: str, cutoff: float) -> bool:
+        """Delete a blob unless a writer refreshed it meanwhile.
+
+        The file is moved aside before its timestamp is checked again; a
+        concurrent ``put`` then either touched it first (it is restored)
+        or finds it gone and writes it anew.
+        """
+        doomed = f'{path}.gc-{os.getpid()}'
+        os.rename(path, doomed)
+        if os.stat(doomed).st_mtime >= cutoff:
+            os.replace(doomed, path)
+            return False
+        os.unlink(doomed)
+        return True
+
+
+class S3BlobStore(BlobStore):
+    """Blobs as objects in an S3-compatible bucket.
+
+    A reference to an existing blob copies the object onto itself to
+    refresh ``LastModified``, which garbage collection compares against.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = '',
+        endpoint_url: Optional[str] = None,
+        client=None,
+    ):
+        """Initialize the store.
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix of the blobs, e.g. ``temporal/``
+            endpoint_url: Endpoint of an S3-compatible service (e.g. MinIO);
+                credentials come from the usual boto3 configuration
+            client: boto3 S3 client to use instead of creating one
+
+        Raises:
+            RuntimeError: If boto3 is not installed
+        """
+        if client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise RuntimeError(
+                    'The s3 claim-check store needs boto3 (pip install boto3)'
+                )
+            client = boto3.client('s3', endpoint_url=endpoint_url)
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client
+
+    def __str__(self) -> str:
+        return f's3://{self.bucket}/{self.prefix}'
+
+    def put(self, key: str, data: bytes) -> bool:
+        """Upload the blob unless it exists; refresh it if it does."""
+        from botocore.exceptions import ClientError
+
+        object_key = self.prefix + check_key(key)
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=object_key,
+                CopySource={'Bucket': self.bucket, 'Key': object_key},
+                MetadataDirective='REPLACE',
+            )
+            return False
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in (
+                'NoSuchKey', '404'
+            ):
+                raise
+        self.client.put_object(
+            Bucket=self.bucket, Key=object_key, Body=bytes(data)
+        )
+        return True
+
+    def get(self, key: str):
+        """Download the blob."""
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=self.prefix + check_key(key)
+            )
+        except self.client.exceptions.NoSuchKey:
+            raise KeyError(key)
+        return response['Body'].read()
+
+    def collect_garbage(self, max_age: float) -> int:
+        """Delete objects whose ``LastModified`` is older than ``max_age``."""
+        cutoff = time.time() - max_age
+        deleted = 0
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            stale = [
+                {'Key': item['Key']}
+                for item in page.get('Contents', ())
+                if item['LastModified'].timestamp() < cutoff
+            ]
+            # A page holds at most 1000 keys, the delete_objects limit
+            if stale:
+                self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': stale, 'Quiet': True},
+                )
+                deleted += len(stale)
+        return deleted
+
+
+class ClaimCheckCodec(PayloadCodec):
+    """Replace payloads above a size threshold with blob store references.
+
+    Other payloads, including those written before the codec was enabled,
+    pass through unchanged.
+    """
+
+    def __init__(self, store: BlobStore, threshold: int = 512 * 1024):
+        """Initialize the codec.
+
+        Args:
+            store: Blob store holding the payloads
+            threshold: Smallest serialized payload size, in bytes, that is
+                moved to the store
+        """
+        self.store = store
+        self.threshold = threshold
+
+    def __str__(self) -> str:
+        return f'claim check to {self.store} (>= {self.threshold} bytes)'
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Move large payloads to the store."""
+        if all(payload.ByteSize() < self.threshold for payload in payloads):
+            return list(payloads)
+        # Blob store I/O blocks; keep it off the event loop
+        return await asyncio.to_thread(
+            lambda: [self._encode(payload) for payload in payloads]
+        )
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Fetch referenced payloads from the store."""
+        if not any(_is_reference(payload) for payload in payloads):
+            return list(payloads)
+        return await asyncio.to_thread(
+            lambda: [self._decode(payload) for payload in payloads]
+        )
+
+    def _encode(self, payload: Payload) -> Payload:
+        """Store one payload if it is large enough."""
+        if payload.ByteSize() < self.threshold:
+            return payload
+        data = payload.SerializeToString()
+        key = hashlib.sha256(data).hexdigest()
+        self.store.put(key, data)
+        return Payload(
+            metadata={
+                'encoding': CLAIM_CHECK_ENCODING,
+                'size': str(len(data)).encode(),
+            },
+            data=key.encode(),
+        )
+
+    def _decode(self, payload: Payload) -> Payload:
+        """Load one referenced payload and verify it against its key."""
+        if not _is_reference(payload):
+            return payload
+        try:
+            key = check_key(payload.data.decode('ascii'))
+        except (UnicodeDecodeError, ValueError):
+            raise RuntimeError('Malformed claim-check reference')
+        try:
+            data = self.store.get(key)
+        except KeyError:
+            raise RuntimeError(
+                f'Claim-check blob {key} is missing from {self.store}; it '
+                f'may have been garbage-collected'
+            )
+        try:
+            if hashlib.sha256(data).hexdigest() != key:
+                raise RuntimeError(
+                    f'Claim-check blob {key} in {self.store} does not match '
+                    f'its digest; it is corrupt or was tampered with'
+                )
+            return Payload.FromString(data)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+
+
+def _is_reference(payload: Payload) -> bool:
+    """Check whether a payload is a claim-check reference."""
+    return payload.metadata.get('encoding') == CLAIM_CHECK_ENCODING
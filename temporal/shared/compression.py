@@ -0,0 +1,143 @@
+"""Payload codec compressing large workflow and activity payloads.
+
+Payloads at or above a size threshold are serialized and compressed with
+zlib, or with zstd when it is configured explicitly (it needs the
+``zstandard`` package on every client and worker), and stored as a new
+payload whose ``encoding`` metadata names the algorithm. Smaller
+payloads, and payloads that do not shrink, pass through unchanged, so the
+codec can be enabled on a running system: payloads written before it was
+enabled decode as they are.
+
+The codec runs in the client and worker processes, never in the workflow
+sandbox, so the Temporal server, its history database and the UI only see
+the compressed bytes.
+"""
+
+import zlib
+from typing import List, Optional, Sequence
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+__all__ = [
+    'COMPRESSION_ALGORITHMS',
+    'CompressionCodec',
+    'zstd_available',
+]
+
+COMPRESSION_ALGORITHMS = ('zlib', 'zstd', 'none')
+
+# Payload encodings written by the codec, by algorithm
+_ENCODINGS = {
+    'zstd': b'binary/zstd',
+    'zlib': b'binary/zlib',
+}
+_ALGORITHMS = {encoding: name for name, encoding in _ENCODINGS.items()}
+
+
+def zstd_available() -> bool:
+    """Check whether the optional ``zstandard`` package is installed."""
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _compress(algorithm: str, data: bytes, level: Optional[int]) -> bytes:
+    """Compress bytes with an algorithm."""
+    if algorithm == 'zstd':
+        import zstandard
+
+        # Compressors are not thread safe; they are cheap to create
+        return zstandard.ZstdCompressor(level=level or 3).compress(data)
+    return zlib.compress(data, 6 if level is None else level)
+
+
+def _decompress(algorithm: str, data: bytes) -> bytes:
+    """Decompress bytes written by ``_compress``."""
+    if algorithm == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                'Payload is zstd compressed but the zstandard package is '
+                'not installed (pip install zstandard)'
+            )
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class CompressionCodec(PayloadCodec):
+    """Compress payloads above a size threshold.
+
+    Decoding does not depend on the configuration: every payload written
+    by the codec carries its algorithm, and other payloads are returned
+    untouched. The algorithm never depends on the installed packages, so
+    every process writes payloads that the others can read.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = 'zlib',
+        threshold: int = 4096,
+        level: Optional[int] = None,
+    ):
+        """Initialize the codec.
+
+        Args:
+            algorithm: ``zlib`` or ``zstd``
+            threshold: Smallest serialized payload size, in bytes, that
+                is compressed
+            level: Compression level (default: 3 for zstd, 6 for zlib)
+
+        Raises:
+            ValueError: If the algorithm is unknown
+            RuntimeError: If zstd is requested but not installed
+        """
+        if algorithm not in _ENCODINGS:
+            raise ValueError(
+                f'Unknown compression algorithm {algorithm!r}, expected one '
+                f'of {", ".join(COMPRESSION_ALGORITHMS)}'
+            )
+        if algorithm == 'zstd' and not zstd_available():
+            raise RuntimeError(
+                'zstd payload compression needs the zstandard package '
+                '(pip install zstandard)'
+            )
+
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+        self._encoding = _ENCODINGS[algorithm]
+
+    def __str__(self) -> str:
+        return f'{self.algorithm} compression (>= {self.threshold} bytes)'
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Compress the payloads at or above the threshold."""
+        return [self._encode(payload) for payload in payloads]
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Restore compressed payloads; pass the others through."""
+        return [self._decode(payload) for payload in payloads]
+
+    def _encode(self, payload: Payload) -> Payload:
+        """Compress one payload if it is large enough and shrinks."""
+        if payload.ByteSize() < self.threshold:
+            return payload
+
+        data = _compress(
+            self.algorithm, payload.SerializeToString(), self.level
+        )
+        if len(data) >= payload.ByteSize():
+            return payload
+        return Payload(metadata={'encoding': self._encoding}, data=data)
+
+    @staticmethod
+    def _decode(payload: Payload) -> Payload:
+        """Decompress one payload written by the codec."""
+        algorithm = _ALGORITHMS.get(payload.metadata.get('encoding', b''))
+        if algorithm is None:
+            return payload
+        return Payload.FromString(_decompress(algorithm, payload.data))
@@ -0,0 +1,169 @@
+"""Data converter shared by the client, the worker and the API.
+
+Every process that connects to Temporal must use the same converter,
+otherwise payloads written by one cannot be read by another.
+"""
+
+import dataclasses
+from typing import List, Optional, Sequence
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    DataConverter,
+    DefaultPayloadConverter,
+    PayloadCodec,
+    PayloadConverter,
+)
+
+from temporal.shared.claim_check import (
+    BlobStore,
+    ClaimCheckCodec,
+    LocalBlobStore,
+    S3BlobStore,
+)
+from temporal.shared.compression import CompressionCodec
+from temporal.shared.payload_converter import FastPayloadConverter
+
+__all__ = [
+    'PayloadCodecChain',
+    'create_blob_store',
+    'create_payload_codec',
+    'payload_converter_class',
+    'create_payload_converter',
+    'create_data_converter',
+]
+
+
+class PayloadCodecChain(PayloadCodec):
+    """Apply several codecs in order when encoding, reversed when decoding."""
+
+    def __init__(self, codecs: Sequence[PayloadCodec]):
+        """Initialize the chain.
+
+        Args:
+            codecs: Codecs in encoding order
+        """
+        self.codecs = list(codecs)
+
+    def __str__(self) -> str:
+        return ', then '.join(str(codec) for codec in self.codecs)
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Encode with each codec in turn."""
+        for codec in self.codecs:
+            payloads = await codec.encode(payloads)
+        return list(payloads)
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        """Decode with each codec in reverse order."""
+        for codec in reversed(self.codecs):
+            payloads = await codec.decode(payloads)
+        return list(payloads)
+
+
+def create_blob_store() -> Optional[BlobStore]:
+    """Create the claim-check blob store configured in ``temporal.config``.
+
+    Returns:
+        BlobStore, or None when claim checks are disabled
+
+    Raises:
+        ValueError: If the store is unknown or misconfigured
+    """
+    from temporal.config import config
+
+    if config.CLAIM_CHECK_STORE == 'none':
+        return None
+    if config.CLAIM_CHECK_STORE == 'local':
+        if not config.CLAIM_CHECK_DIR:
+            raise ValueError(
+                'TEMPORAL_CLAIM_CHECK_DIR is required for the local '
+                'claim-check store; point it at a path shared by the API '
+                'and the workers'
+            )
+        return LocalBlobStore(config.CLAIM_CHECK_DIR)
+    if config.CLAIM_CHECK_STORE == 's3':
+        if not config.CLAIM_CHECK_S3_BUCKET:
+            raise ValueError(
+                'TEMPORAL_CLAIM_CHECK_S3_BUCKET is required for the s3 '
+                'claim-check store'
+            )
+        return S3BlobStore(
+            config.CLAIM_CHECK_S3_BUCKET,
+            prefix=config.CLAIM_CHECK_S3_PREFIX,
+            endpoint_url=config.CLAIM_CHECK_S3_ENDPOINT,
+        )
+    raise ValueError(
+        f'Unknown claim-check store {config.CLAIM_CHECK_STORE!r}'
+    )
+
+
+def create_payload_codec() -> Optional[PayloadCodec]:
+    """Create the payload codecs configured in ``temporal.config``.
+
+    Payloads are compressed first, so the claim-check threshold applies
+    to (and the blob store holds) compressed payloads.
+
+    Returns:
+        PayloadCodecChain, or None when no codec is enabled
+    """
+    from temporal.config import config
+
+    codecs: List[PayloadCodec] = []
+    if config.PAYLOAD_COMPRESSION != 'none':
+        codecs.append(CompressionCodec(
+            config.PAYLOAD_COMPRESSION,
+            threshold=config.PAYLOAD_COMPRESSION_THRESHOLD,
+            level=config.PAYLOAD_COMPRESSION_LEVEL,
+        ))
+    store = create_blob_store()
+    if store is not None:
+        codecs.append(
+            ClaimCheckCodec(store, threshold=config.CLAIM_CHECK_THRESHOLD)
+        )
+    return PayloadCodecChain(codecs) if codecs else None
+
+
+def payload_converter_class() -> type:
+    """Get the payload converter class configured in ``temporal.config``.
+
+    Returns:
+        FastPayloadConverter, or temporalio's DefaultPayloadConverter
+
+    Raises:
+        ValueError: If the converter is unknown
+    """
+    from temporal.config import config
+
+    if config.PAYLOAD_CONVERTER == 'fast':
+        return FastPayloadConverter
+    if config.PAYLOAD_CONVERTER == 'default':
+        return DefaultPayloadConverter
+    raise ValueError(
+        f'Unknown payload converter {config.PAYLOAD_CONVERTER!r}, expected '
+        f'fast or default'
+    )
+
+
+def create_payload_converter() -> PayloadConverter:
+    """Create the configured payload converter, without codecs.
+
+    Returns:
+        PayloadConverter instance
+    """
+    return payload_converter_class()()
+
+
+def create_data_converter() -> DataConverter:
+    """Create the data converter for ``Client.connect``.
+
+    Workers use the converter of the client they are created with.
+
+    Returns:
+        DataConverter with the configured payload converter and codecs
+    """
+    return dataclasses.replace(
+        DataConverter.default,
+        payload_converter_class=payload_converter_class(),
+        payload_codec=create_payload_codec(),
+    )
@@ -0,0 +1,57 @@
+"""Run activities as declared at registration, local or remote."""
+
+from typing import Any, Callable, Union
+
+from temporalio import workflow
+
+__all__ = ['execute_activity']
+
+
+async def execute_activity(
+    activity: Union[str, Callable], *args: Any, **options: Any
+) -> Any:
+    """Execute an activity from workflow code.
+
+    Activities registered with ``register_activity(..., local=True)`` run
+    as local activities in the worker of the calling workflow. Others are
+    scheduled on their pinned task queue, or the workflow's own. Timeouts
+    and the retry policy default to the matching ``temporal.shared``
+    defaults.
+
+    Args:
+        activity: Activity function or activity type name
+        *args: Activity arguments
+        **options: Keyword arguments for ``workflow.execute_activity`` or
+            ``workflow.execute_local_activity`` (e.g.
+            ``start_to_close_timeout``), overriding the defaults
+
+    Returns:
+        Activity result
+    """
+    from temporal.registry import (
+        get_activity_name,
+        get_activity_task_queue,
+        is_local_activity,
+    )
+    from temporal.shared import (
+        get_default_activity_timeout,
+        get_default_local_activity_timeout,
+        get_default_local_retry_policy,
+        get_default_retry_policy,
+    )
+
+    name = activity if isinstance(activity, str) else get_activity_name(activity)
+
+    if is_local_activity(name):
+        options.setdefault(
+            'start_to_close_timeout', get_default_local_activity_timeout()
+        )
+        options.setdefault('retry_policy', get_default_local_retry_policy())
+        return await workflow.execute_local_activity(
+            activity, args=args, **options
+        )
+
+    options.setdefault('task_queue', get_activity_task_queue(name))
+    options.setdefault('start_to_close_timeout', get_default_activity_timeout())
+    options.setdefault('retry_policy', get_default_retry_policy())
+    return await workflow.execute_activity(activity, args=args, **options)
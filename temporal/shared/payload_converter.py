@@ -0,0 +1,301 @@
+"""Payload converter with fast JSON and binary-aware encoding.
+
+``FastPayloadConverter`` replaces temporalio's default converter:
+
+- JSON is encoded and parsed with ``orjson`` when it is installed, and
+  with the stdlib ``json`` module otherwise. Both write the same document
+  (keys sorted, dataclasses as objects of their fields, datetimes as
+  ISO 8601 strings, enums as their values); only the spelling of float
+  exponents may differ. Values orjson would write differently, such as
+  NaN and infinities (orjson turns them into ``null``), integers beyond
+  64 bits or non-string dict keys, are encoded with the stdlib instead.
+  Plain JSON payloads keep the ``json/plain`` encoding and stay readable
+  by the default converter and other SDKs.
+- ``bytes``, ``bytearray`` and ``memoryview`` values are sent as raw
+  ``binary/plain`` payloads.
+- Values that contain binary data, such as a dataclass with a ``bytes``
+  field, become ``binary/json-blobs`` payloads: the JSON document with a
+  placeholder for each buffer, followed by the raw buffers. The default
+  converter would have sent every byte as a JSON number.
+"""
+
+import collections.abc
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import uuid
+from typing import Any, List, Optional, Type
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    BinaryNullPayloadConverter,
+    BinaryPlainPayloadConverter,
+    BinaryProtoPayloadConverter,
+    CompositePayloadConverter,
+    EncodingPayloadConverter,
+    JSONProtoPayloadConverter,
+    value_to_type,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+__all__ = [
+    'FastPayloadConverter',
+    'FastJSONPayloadConverter',
+    'orjson_available',
+]
+
+BLOBS_ENCODING = 'binary/json-blobs'
+
+# Placeholder key of a buffer inside a binary/json-blobs document
+_BLOB_KEY = '__temporal_blob__'
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+if orjson is not None:
+    # Dataclasses and datetimes go through the ``default`` hook, like with
+    # the stdlib, so both produce the same document
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def orjson_available() -> bool:
+    """Check whether the optional ``orjson`` package is installed."""
+    return orjson is not None
+
+
+def _json_default(blobs: List[Any], converted: Optional[List[Any]] = None):
+    """Build the ``default`` hook of the JSON encoders.
+
+    Buffers are collected into ``blobs`` and replaced by placeholders;
+    other values are handled like temporalio's ``AdvancedJSONEncoder``.
+    What the hook returns is also appended to ``converted``, if given.
+    """
+    def default(value):
+        result = _convert(value)
+        if converted is not None:
+            converted.append(result)
+        return result
+
+    def _convert(value):
+        if isinstance(value, _BUFFER_TYPES):
+            blobs.append(value)
+            return {_BLOB_KEY: len(blobs) - 1}
+        if dataclasses.is_dataclass(value):
+            # One level only: nested dataclasses come back through the hook,
+            # which avoids the deep copy of ``dataclasses.asdict``
+            return {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            }
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, enum.Enum):
+            return value.value
+        dict_fn = getattr(value, 'dict', None)
+        if callable(dict_fn):
+            return dict_fn()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, collections.abc.Iterable):
+            return list(value)
+        raise TypeError(
+            f'Object of type {type(value).__name__} is not JSON serializable'
+        )
+
+    return default
+
+
+def _lost_non_finite(value: Any, document: bytes, converted: List[Any]) -> bool:
+    """Check whether orjson wrote a NaN or an infinity of ``value`` as null.
+
+    Plain JSON values parse back equal to themselves unless such a float
+    turned into None, which the (C-level) comparison finds quickly. Other
+    values, such as dataclasses or tuples, are walked.
+    """
+    if orjson.loads(document) == value:
+        return False
+    return _has_non_finite([value, *converted])
+
+
+def _has_non_finite(values: List[Any]) -> bool:
+    """Check whether NaN or an infinity is nested in JSON-ready values."""
+    stack = list(values)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _dumps(value: Any, blobs: List[Any]) -> bytes:
+    """Serialize a value to compact JSON with sorted keys."""
+    if orjson is not None:
+        converted: List[Any] = []
+        try:
+            document = orjson.dumps(
+                value,
+                default=_json_default(blobs, converted),
+                option=_ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or non-string keys
+            document = None
+        # orjson writes NaN and infinities as null, so only a document
+        # with a null can have lost one
+        if document is not None and (
+            b'null' not in document
+            or not _lost_non_finite(value, document, converted)
+        ):
+            return document
+        blobs.clear()
+    return json.dumps(
+        value,
+        default=_json_default(blobs),
+        separators=(',', ':'),
+        sort_keys=True,
+    ).encode()
+
+
+def _loads(data) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(bytes(data))
+    except json.JSONDecodeError as err:
+        raise RuntimeError('Failed parsing') from err
+
+
+def _restore_blobs(obj: Any, blobs: List[bytes]) -> Any:
+    """Replace blob placeholders in a parsed document with the buffers."""
+    if isinstance(obj, dict):
+        if len(obj) == 1 and _BLOB_KEY in obj:
+            return blobs[obj[_BLOB_KEY]]
+        return {key: _restore_blobs(item, blobs) for key, item in obj.items()}
+    if isinstance(obj, list):
+        return [_restore_blobs(item, blobs) for item in obj]
+    return obj
+
+
+class BinaryBufferPayloadConverter(BinaryPlainPayloadConverter):
+    """``binary/plain`` converter for bytes, bytearray and memoryview."""
+
+    def to_payload(self, value: Any) -> Optional[Payload]:
+        """Send buffers as they are."""
+        if isinstance(value, _BUFFER_TYPES):
+            return Payload(
+                metadata={'encoding': self.encoding.encode()},
+                data=bytes(value),
+            )
+        return None
+
+    def from_payload(self, payload: Payload, type_hint: Optional[Type] = None) -> Any:
+        """Return bytes, or a bytearray when the type hint asks for one."""
+        if type_hint is bytearray:
+            return bytearray(payload.data)
+        return payload.data
+
+
+class FastJSONPayloadConverter(EncodingPayloadConverter):
+    """``json/plain`` converter backed by orjson when it is installed.
+
+    Values containing buffers are written as ``binary/json-blobs``
+    payloads, which ``JSONBlobsPayloadConverter`` reads back.
+    """
+
+    @property
+    def encoding(self) -> str:
+        """See base class."""
+        return 'json/plain'
+
+    def to_payload(self, value: Any) -> Optional[Payload]:
+        """Encode a value as JSON, moving buffers out of the document."""
+        blobs: List[Any] = []
+        document = _dumps(value, blobs)
+        if not blobs:
+            return Payload(
+                metadata={'encoding': b'json/plain'}, data=document
+            )
+
+        sizes = [len(document)] + [memoryview(blob).nbytes for blob in blobs]
+        return Payload(
+            metadata={
+                'encoding': BLOBS_ENCODING.encode(),
+                'sizes': ','.join(map(str, sizes)).encode(),
+            },
+            data=b''.join([document, *blobs]),
+        )
+
+    def from_payload(self, payload: Payload, type_hint: Optional[Type] = None) -> Any:
+        """Parse a ``json/plain`` payload."""
+        obj = _loads(payload.data)
+        if type_hint:
+            obj = value_to_type(type_hint, obj)
+        return obj
+
+
+class JSONBlobsPayloadConverter(EncodingPayloadConverter):
+    """Reader of ``binary/json-blobs`` payloads.
+
+    They are written by ``FastJSONPayloadConverter``, so this converter
+    never encodes.
+    """
+
+    @property
+    def encoding(self) -> str:
+        """See base class."""
+        return BLOBS_ENCODING
+
+    def to_payload(self, value: Any) -> Optional[Payload]:
+        """Leave encoding to ``FastJSONPayloadConverter``."""
+        return None
+
+    def from_payload(self, payload: Payload, type_hint: Optional[Type] = None) -> Any:
+        """Parse the document and put the buffers back in place."""
+        sizes = [int(size) for size in payload.metadata['sizes'].split(b',')]
+        data = memoryview(payload.data)
+        offset = sizes[0]
+        blobs = []
+        for size in sizes[1:]:
+            blobs.append(bytes(data[offset:offset + size]))
+            offset += size
+
+        obj = _restore_blobs(_loads(data[:sizes[0]]), blobs)
+        if type_hint:
+            obj = value_to_type(type_hint, obj)
+        return obj
+
+
+class FastPayloadConverter(CompositePayloadConverter):
+    """Drop-in replacement of temporalio's ``DefaultPayloadConverter``.
+
+    It reads every payload the default converter writes.
+    """
+
+    def __init__(self) -> None:
+        """Create the converter."""
+        super().__init__(
+            BinaryNullPayloadConverter(),
+            BinaryBufferPayloadConverter(),
+            JSONProtoPayloadConverter(),
+            BinaryProtoPayloadConverter(),
+            JSONBlobsPayloadConverter(),
+            FastJSONPayloadConverter(),
+        )
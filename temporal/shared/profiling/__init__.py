@@ -0,0 +1,17 @@
+"""Profiling of activity executions and workflow steps on a worker."""
+
+from temporal.shared.profiling.interceptor import ProfilingInterceptor
+from temporal.shared.profiling.recorder import (
+    KIND_ACTIVITY,
+    KIND_WORKFLOW_STEP,
+    ProfileRecord,
+    ProfileRecorder,
+)
+
+__all__ = [
+    'ProfilingInterceptor',
+    'ProfileRecorder',
+    'ProfileRecord',
+    'KIND_ACTIVITY',
+    'KIND_WORKFLOW_STEP',
+]
@@ -0,0 +1,293 @@
+"""Worker interceptor recording activity and workflow step timings."""
+
+import concurrent.futures
+import cProfile
+import dataclasses
+import inspect
+import os
+import random
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from temporalio import activity, workflow
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    ExecuteWorkflowInput,
+    Interceptor,
+    WorkflowInboundInterceptor,
+    WorkflowInterceptorClassInput,
+)
+
+from temporal.shared.converter import create_payload_converter
+from temporal.shared.profiling.recorder import (
+    KIND_ACTIVITY,
+    KIND_WORKFLOW_STEP,
+    ProfileRecord,
+    ProfileRecorder,
+)
+
+# Extern functions through which workflow code reaches the recorder; the
+# workflow sandbox only lets registered externs out
+_EXTERN_CLOCK = '__temporal_profiling_clock'
+_EXTERN_RECORD = '__temporal_profiling_record'
+
+
+def _clock() -> Tuple[float, float]:
+    """Current wall clock and CPU time of this thread."""
+    return time.perf_counter(), time.thread_time()
+
+
+class _StepTimer:
+    """Await a coroutine while timing every step it runs.
+
+    Only the time the coroutine actually executes is counted, not the time
+    it is suspended, so CPU time is attributed correctly even when other
+    coroutines share the event loop. An optional ``cProfile.Profile`` is
+    enabled around each step for the same reason.
+    """
+
+    def __init__(
+        self,
+        coro,
+        clock: Callable[[], Tuple[float, float]] = _clock,
+        on_step: Optional[Callable[[float, float], None]] = None,
+        profiler: Optional[cProfile.Profile] = None,
+    ):
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self._coro = coro
+        self._clock = clock
+        self._on_step = on_step
+        self._profiler = profiler
+
+    def _step(self, method, value):
+        """Run one step of the coroutine, timing it."""
+        wall, cpu = self._clock()
+        if self._profiler:
+            self._profiler.enable()
+        try:
+            return method(value)
+        finally:
+            if self._profiler:
+                self._profiler.disable()
+            end_wall, end_cpu = self._clock()
+            self.wall_time += end_wall - wall
+            self.cpu_time += end_cpu - cpu
+            if self._on_step:
+                self._on_step(end_wall - wall, end_cpu - cpu)
+
+    def __await__(self):
+        method, value = self._coro.send, None
+        while True:
+            try:
+                yielded = self._step(method, value)
+            except StopIteration as e:
+                return e.value
+            try:
+                value = yield yielded
+                method = self._coro.send
+            except GeneratorExit:
+                self._coro.close()
+                raise
+            except BaseException as e:
+                method, value = self._coro.throw, e
+
+
+class _ThreadTimedCall:
+    """Wrap a sync activity run in a thread pool to time it in that thread."""
+
+    def __init__(self, fn: Callable, profiler: Optional[cProfile.Profile] = None):
+        self.fn = fn
+        self.profiler = profiler
+        self.cpu_time: Optional[float] = None
+
+    def __call__(self, *args, **kwargs):
+        cpu = time.thread_time()
+        if self.profiler:
+            self.profiler.enable()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            if self.profiler:
+                self.profiler.disable()
+            self.cpu_time = time.thread_time() - cpu
+
+
+class ProfilingInterceptor(Interceptor):
+    """Record wall time, CPU time, attempt and payload size of activities.
+
+    Workflow code is recorded per workflow type as the time each step of
+    the workflow's main coroutine takes (``workflow_step`` records); steps
+    replayed from history are skipped. Payload sizes are measured by
+    serializing the arguments and result a second time, so only a sample
+    of activities gets them. Records go to a
+    ``ProfileRecorder`` ring buffer. Activities named in
+    ``cprofile_activities`` additionally run under ``cProfile``, writing one
+    ``.prof`` file per execution to ``cprofile_dir``.
+
+    CPU time and cProfile are not available for activities run in a process
+    pool; their wall time is still recorded.
+    """
+
+    def __init__(
+        self,
+        recorder: Optional[ProfileRecorder] = None,
+        cprofile_activities: Iterable[str] = (),
+        cprofile_dir: str = '.',
+        payload_sample_rate: float = 0.01,
+    ):
+        """Initialize the interceptor.
+
+        Args:
+            recorder: Recorder to write to (a new one by default)
+            cprofile_activities: Activity names to run under cProfile
+            cprofile_dir: Directory for the cProfile ``.prof`` files
+            payload_sample_rate: Fraction of activity executions whose
+                argument and result sizes are measured (0 disables it)
+        """
+        self.recorder = recorder or ProfileRecorder()
+        self.cprofile_activities = frozenset(cprofile_activities)
+        self.cprofile_dir = cprofile_dir
+        self.payload_sample_rate = payload_sample_rate
+        # Sizes as the client and worker converter writes them, before codecs
+        self._converter = create_payload_converter()
+
+    def intercept_activity(
+        self, next: ActivityInboundInterceptor
+    ) -> ActivityInboundInterceptor:
+        """Wrap activity executions."""
+        return _ProfilingActivityInbound(next, self)
+
+    def workflow_interceptor_class(self, input: WorkflowInterceptorClassInput):
+        """Wrap workflow executions, exposing the recorder as extern functions."""
+        input.unsafe_extern_functions[_EXTERN_CLOCK] = _clock
+        input.unsafe_extern_functions[_EXTERN_RECORD] = self._record_workflow_step
+        return _ProfilingWorkflowInbound
+
+    def sample_payloads(self) -> bool:
+        """Decide whether to measure the payload sizes of an execution."""
+        return (
+            self.payload_sample_rate > 0
+            and random.random() < self.payload_sample_rate
+        )
+
+    def payload_size(self, values) -> Optional[int]:
+        """Encoded size in bytes of values, before payload codecs."""
+        try:
+            return sum(
+                payload.ByteSize()
+                for payload in self._converter.to_payloads(list(values))
+            )
+        except Exception:
+            return None
+
+    def _record_workflow_step(
+        self, workflow_type: str, workflow_id: str, wall_time: float, cpu_time: float
+    ) -> None:
+        """Record one workflow step (called from workflow code)."""
+        self.recorder.record(ProfileRecord(
+            kind=KIND_WORKFLOW_STEP,
+            name=workflow_type,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            started_at=time.time() - wall_time,
+            workflow_id=workflow_id,
+        ))
+
+    def _dump_cprofile(self, profiler: cProfile.Profile, info) -> None:
+        """Write the cProfile stats of one activity execution."""
+        os.makedirs(self.cprofile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(
+            self.cprofile_dir,
+            f'{info.activity_type}-{info.workflow_id}-{info.activity_id}-'
+            f'{info.attempt}.prof',
+        ))
+
+
+class _ProfilingActivityInbound(ActivityInboundInterceptor):
+    """Time one activity execution and record it."""
+
+    def __init__(self, next: ActivityInboundInterceptor, owner: ProfilingInterceptor):
+        super().__init__(next)
+        self._owner = owner
+
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        info = activity.info()
+        owner = self._owner
+        profiler = None
+        if info.activity_type in owner.cprofile_activities:
+            profiler = cProfile.Profile()
+
+        is_async = inspect.iscoroutinefunction(input.fn) or (
+            inspect.iscoroutinefunction(getattr(input.fn, '__call__', None))
+        )
+        started_at = time.time()
+        start = time.perf_counter()
+        cpu_time = None
+        result = None
+        error = None
+        try:
+            if is_async:
+                timer = _StepTimer(self.next.execute_activity(input), profiler=profiler)
+                try:
+                    result = await timer
+                finally:
+                    cpu_time = timer.cpu_time
+            elif isinstance(input.executor, concurrent.futures.ThreadPoolExecutor):
+                timed = _ThreadTimedCall(input.fn, profiler)
+                try:
+                    result = await self.next.execute_activity(
+                        dataclasses.replace(input, fn=timed)
+                    )
+                finally:
+                    cpu_time = timed.cpu_time
+            else:
+                profiler = None
+                result = await self.next.execute_activity(input)
+            return result
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            sampled = owner.sample_payloads()
+            owner.recorder.record(ProfileRecord(
+                kind=KIND_ACTIVITY,
+                name=info.activity_type,
+                wall_time=time.perf_counter() - start,
+                cpu_time=cpu_time,
+                started_at=started_at,
+                workflow_id=info.workflow_id,
+                attempt=info.attempt,
+                payload_bytes=(
+                    owner.payload_size(input.args) if sampled else None
+                ),
+                result_bytes=(
+                    owner.payload_size([result])
+                    if sampled and error is None else None
+                ),
+                error=error,
+            ))
+            if profiler is not None:
+                owner._dump_cprofile(profiler, info)
+
+
+class _ProfilingWorkflowInbound(WorkflowInboundInterceptor):
+    """Time each step of a workflow's main coroutine, except on replay."""
+
+    async def execute_workflow(self, input: ExecuteWorkflowInput) -> Any:
+        externs = workflow.extern_functions()
+        record = externs[_EXTERN_RECORD]
+        info = workflow.info()
+
+        def _on_step(wall_time: float, cpu_time: float) -> None:
+            # Replayed steps re-run code whose time was already recorded
+            if workflow.unsafe.is_replaying():
+                return
+            record(info.workflow_type, info.workflow_id, wall_time, cpu_time)
+
+        return await _StepTimer(
+            super().execute_workflow(input),
+            clock=externs[_EXTERN_CLOCK],
+            on_step=_on_step,
+        )
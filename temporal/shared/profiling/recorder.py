@@ -0,0 +1,160 @@
+"""Ring buffer of profiled activity executions and workflow steps."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+KIND_ACTIVITY = 'activity'
+# One step of a workflow's main coroutine: the code it runs between two
+# awaits within a workflow task, not the whole task
+KIND_WORKFLOW_STEP = 'workflow_step'
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    """One profiled execution."""
+
+    kind: str
+    name: str
+    wall_time: float
+    cpu_time: Optional[float]
+    started_at: float
+    workflow_id: str = ''
+    attempt: int = 1
+    payload_bytes: Optional[int] = None
+    result_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ProfileRecorder:
+    """Keep the latest profile records and per-name totals.
+
+    One ring buffer per kind holds the most recent ``capacity`` records for
+    the slowest-calls report, so frequent workflow steps don't push out
+    activity calls. Totals per (kind, name) cover everything recorded since
+    the worker started.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize the recorder.
+
+        Args:
+            capacity: Number of records kept per kind
+        """
+        self.capacity = capacity
+        self._records: Dict[str, Deque[ProfileRecord]] = {}
+        self._totals: Dict[tuple, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: ProfileRecord) -> None:
+        """Add a record to the ring buffer and the totals."""
+        with self._lock:
+            self._records.setdefault(
+                record.kind, deque(maxlen=self.capacity)
+            ).append(record)
+            totals = self._totals.setdefault(
+                (record.kind, record.name),
+                {'count': 0, 'errors': 0, 'wall_time': 0.0, 'max_wall_time': 0.0},
+            )
+            totals['count'] += 1
+            totals['errors'] += record.error is not None
+            totals['wall_time'] += record.wall_time
+            totals['max_wall_time'] = max(totals['max_wall_time'], record.wall_time)
+
+    def records(self, kind: Optional[str] = None) -> List[ProfileRecord]:
+        """Snapshot of the ring buffers, oldest first per kind."""
+        with self._lock:
+            return [
+                record
+                for records_kind, records in self._records.items()
+                if kind is None or records_kind == kind
+                for record in records
+            ]
+
+    def slowest(self, n: int = 20, kind: Optional[str] = None) -> List[ProfileRecord]:
+        """Return the ``n`` slowest records in the ring buffer.
+
+        Args:
+            n: Number of records
+            kind: Only consider ``activity`` or ``workflow_step`` records
+
+        Returns:
+            Records sorted by wall time, slowest first
+        """
+        records = self.records(kind)
+        return sorted(records, key=lambda r: r.wall_time, reverse=True)[:n]
+
+    def totals(self) -> List[Dict[str, Any]]:
+        """Per (kind, name) totals, by total wall time descending."""
+        with self._lock:
+            rows = [
+                {
+                    'kind': kind,
+                    'name': name,
+                    **totals,
+                    'mean_wall_time': totals['wall_time'] / totals['count'],
+                }
+                for (kind, name), totals in self._totals.items()
+            ]
+        return sorted(rows, key=lambda row: row['wall_time'], reverse=True)
+
+    def to_dict(self, top: int = 20) -> Dict[str, Any]:
+        """JSON-serializable report of the totals and slowest records."""
+        return {
+            'pid': os.getpid(),
+            'generated_at': time.time(),
+            'capacity': self.capacity,
+            'totals': self.totals(),
+            'slowest': [asdict(record) for record in self.slowest(top)],
+        }
+
+    def dump(self, directory: str, top: int = 20) -> str:
+        """Write the report as JSON.
+
+        Args:
+            directory: Directory to write to (created if missing)
+            top: Number of slowest records to include
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(
+            directory, f'profile-{os.getpid()}-{int(time.time())}.json'
+        )
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(top), f, indent=2)
+        return path
+
+    def format_report(self, top: int = 20) -> str:
+        """Human readable top-N slowest report."""
+        lines = [
+            f"📊 Slowest {top} executions "
+            f"(of the last {self.capacity} per kind):"
+        ]
+        for record in self.slowest(top):
+            cpu = '-' if record.cpu_time is None else f'{record.cpu_time * 1000:.1f}'
+            size = '-' if record.payload_bytes is None else record.payload_bytes
+            line = (
+                f"   {record.wall_time * 1000:9.1f} ms wall, {cpu} ms cpu  "
+                f"{record.kind} {record.name} (attempt {record.attempt}, "
+                f"{size} B in) {record.workflow_id}"
+            )
+            if record.error:
+                line += f"  ❌ {record.error}"
+            lines.append(line)
+
+        lines.append("📊 Totals:")
+        for row in self.totals():
+            lines.append(
+                f"   {row['wall_time']:9.3f} s  {row['kind']} {row['name']}: "
+                f"{row['count']} calls, "
+                f"mean {row['mean_wall_time'] * 1000:.1f} ms, "
+                f"max {row['max_wall_time'] * 1000:.1f} ms, "
+                f"{row['errors']} errors"
+            )
+        return '\n'.join(lines)
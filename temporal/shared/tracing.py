@@ -0,0 +1,151 @@
+"""OpenTelemetry tracing shared by the API and the worker.
+
+Tracing is off unless ``TEMPORAL_TRACING_EXPORTER`` is ``otlp`` or
+``file``; the OpenTelemetry packages are only imported then. The returned
+temporalio ``TracingInterceptor`` carries the trace context in workflow
+and activity headers, so a run's spans join the trace of the HTTP request
+that started it.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import List
+
+__all__ = [
+    'TRACING_EXPORTERS',
+    'JsonFileSpanExporter',
+    'configure_tracing',
+    'tracing_enabled',
+    'span',
+]
+
+TRACING_EXPORTERS = ('none', 'otlp', 'file')
+
+_configured = False
+
+
+class JsonFileSpanExporter:
+    """Span exporter appending one JSON object per span to a file.
+
+    Several processes may share the file; each batch is written with a
+    single append.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the exporter.
+
+        Args:
+            path: JSON lines file to append to (its directory is created)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def export(self, spans):
+        """Append finished spans to the file."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = ''.join(span.to_json(indent=None) + '\n' for span in spans)
+        try:
+            with self._lock, open(self.path, 'a') as f:
+                f.write(lines)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Nothing is buffered."""
+        return True
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+
+def _create_exporter(exporter: str):
+    """Build the span exporter named by ``TEMPORAL_TRACING_EXPORTER``."""
+    from temporal.config import config
+
+    if exporter == 'otlp':
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=config.TRACING_OTLP_ENDPOINT)
+    return JsonFileSpanExporter(config.TRACING_FILE)
+
+
+def configure_tracing(service_name: str) -> List:
+    """Install the global tracer provider and build the client interceptors.
+
+    Args:
+        service_name: ``service.name`` of the spans (e.g. ``temporal-api``)
+
+    Returns:
+        Interceptors to pass to ``Client.connect`` (empty when tracing is
+        off); workers connected with that client use them too
+
+    Raises:
+        ValueError: If the exporter name is unknown
+        RuntimeError: If tracing is on but OpenTelemetry is not installed
+    """
+    global _configured
+    from temporal.config import config
+
+    exporter = config.TRACING_EXPORTER
+    if exporter not in TRACING_EXPORTERS:
+        raise ValueError(
+            f"Unknown TEMPORAL_TRACING_EXPORTER {exporter!r}, expected one of "
+            f"{', '.join(TRACING_EXPORTERS)}"
+        )
+    if exporter == 'none':
+        return []
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from temporalio.contrib.opentelemetry import TracingInterceptor
+    except ImportError as e:
+        raise RuntimeError(
+            f'TEMPORAL_TRACING_EXPORTER={exporter} requires the '
+            f'opentelemetry-sdk package ({e})'
+        ) from e
+
+    if not _configured:
+        provider = TracerProvider(
+            resource=Resource.create({'service.name': service_name})
+        )
+        provider.add_span_processor(BatchSpanProcessor(_create_exporter(exporter)))
+        trace.set_tracer_provider(provider)
+        _configured = True
+
+    return [TracingInterceptor()]
+
+
+def tracing_enabled() -> bool:
+    """Whether ``configure_tracing`` installed a tracer provider."""
+    return _configured
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Record a span around a block when tracing is on.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+
+    Yields:
+        The span, or None when tracing is off
+    """
+    if not _configured:
+        yield None
+        return
+
+    from opentelemetry import trace
+
+    tracer = trace.get_tracer('temporal')
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
@@ -0,0 +1,198 @@
+"""Supervisor that runs a worker entry point in several processes."""
+
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional
+
+
+class WorkerSupervisor:
+    """Run N copies of a worker process and keep them alive.
+
+    Crashed children are restarted with exponential backoff when they die
+    shortly after starting. SIGINT/SIGTERM are forwarded to every child as
+    SIGTERM so they can shut their workers down gracefully; children still
+    running after ``shutdown_timeout`` are killed.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        processes: int,
+        shutdown_timeout: float = 30.0,
+        report_interval: float = 60.0,
+        min_uptime: float = 10.0,
+        max_restart_delay: float = 30.0,
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            target: Importable function run in each child process, called
+                with the child's slot number (0 to ``processes - 1``)
+            processes: Number of child processes
+            shutdown_timeout: Seconds to wait for children on shutdown
+            report_interval: Seconds between "workers alive" reports
+            min_uptime: Children dying sooner than this count as crash-looping
+            max_restart_delay: Upper bound for the restart backoff in seconds
+        """
+        self.target = target
+        self.processes = processes
+        self.shutdown_timeout = shutdown_timeout
+        self.report_interval = report_interval
+        self.min_uptime = min_uptime
+        self.max_restart_delay = max_restart_delay
+
+        # spawn gives each child a fresh interpreter and Temporal runtime
+        self._context = multiprocessing.get_context('spawn')
+        self._children: Dict[int, multiprocessing.Process] = {}
+        self._started_at: Dict[int, float] = {}
+        self._crashes: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    @property
+    def alive(self) -> int:
+        """Number of child processes currently running."""
+        return sum(1 for child in self._children.values() if child.is_alive())
+
+    def run(self) -> int:
+        """Start the children and supervise them until a shutdown signal.
+
+        Returns:
+            Process exit code (0 on a clean shutdown)
+        """
+        previous_handlers = {
+            sig: signal.signal(sig, self._handle_signal)
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for slot in range(self.processes):
+                self._start(slot)
+            self._report()
+            self._supervise()
+        finally:
+            self._shutdown()
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+        return 0
+
+    def _handle_signal(self, signum, frame) -> None:
+        """Begin a coordinated shutdown."""
+        if not self._stopping:
+            print(f"\n🛑 Received {signal.Signals(signum).name}, stopping workers...")
+        self._stopping = True
+
+    def _start(self, slot: int) -> None:
+        """Start (or restart) the child process for a slot."""
+        child = self._context.Process(
+            target=self.target,
+            args=(slot,),
+            name=f'temporal-worker-{slot}',
+            daemon=False,
+        )
+        child.start()
+        self._children[slot] = child
+        self._started_at[slot] = time.monotonic()
+        self._restart_at.pop(slot, None)
+        print(f"   Worker process {slot} started (pid {child.pid})", flush=True)
+
+    def _supervise(self) -> None:
+        """Wait on child exits, restart crashed children and report."""
+        last_report = time.monotonic()
+        last_alive = self.alive
+
+        while not self._stopping:
+            sentinels = [
+                child.sentinel for child in self._children.values()
+                if child.is_alive()
+            ]
+            wait(sentinels, timeout=1.0)
+            if self._stopping:
+                break
+
+            now = time.monotonic()
+            for slot, child in list(self._children.items()):
+                if child.is_alive():
+                    continue
+                if slot not in self._restart_at:
+                    self._schedule_restart(slot, child, now)
+                elif now >= self._restart_at[slot]:
+                    self._start(slot)
+
+            alive = self.alive
+            if alive != last_alive or now - last_report >= self.report_interval:
+                self._report()
+                last_report, last_alive = now, alive
+
+    def _schedule_restart(
+        self, slot: int, child: multiprocessing.Process, now: float
+    ) -> None:
+        """Record a child exit and compute when to restart it."""
+        uptime = now - self._started_at[slot]
+        if uptime < self.min_uptime:
+            self._crashes[slot] = self._crashes.get(slot, 0) + 1
+        else:
+            self._crashes[slot] = 0
+
+        delay = 0.0
+        if self._crashes[slot]:
+            delay = min(2 ** (self._crashes[slot] - 1), self.max_restart_delay)
+        self._restart_at[slot] = now + delay
+        print(
+            f"⚠️  Worker process {slot} (pid {child.pid}) exited with code "
+            f"{child.exitcode}, restarting in {delay:.0f}s",
+            flush=True,
+        )
+
+    def _report(self) -> None:
+        """Print how many worker processes are alive."""
+        print(f"📊 Worker processes alive: {self.alive}/{self.processes}", flush=True)
+
+    def _shutdown(self) -> None:
+        """Forward SIGTERM to children and wait for them to exit."""
+        children: List[multiprocessing.Process] = [
+            child for child in self._children.values() if child.is_alive()
+        ]
+        for child in children:
+            try:
+                os.kill(child.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for child in children:
+            child.join(max(deadline - time.monotonic(), 0))
+
+        for child in children:
+            if child.is_alive():
+                print(f"⚠️  Killing worker process pid {child.pid}", flush=True)
+                child.kill()
+                child.join()
+
+        print("✅ All worker processes stopped.", flush=True)
+
+
+def default_process_count() -> int:
+    """Number of worker processes to use when none is given.
+
+    Returns:
+        CPUs available to this process
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_process_count(value: Optional[str]) -> int:
+    """Parse a ``--processes`` value, 0 or empty meaning all CPUs.
+
+    Args:
+        value: Command line value
+
+    Returns:
+        Number of processes
+    """
+    count = int(value) if value else 0
+    return count if count > 0 else default_process_count()
@@ -1,10 +1,279 @@
 """Workflow metadata for UI display and execution."""
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import hashlib
+import inspect
+import json
+import re
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
+from temporal.config import config
 from temporal.registry import get_all_workflows
 
 
+class ParameterError(ValueError):
+    """Raised when request data does not satisfy a workflow's parameters."""
+
+
+# Sentinel for "no default value"
+_MISSING = object()
+
+_TRUE_STRINGS = {'true', '1', 'yes', 'on'}
+_FALSE_STRINGS = {'false', '0', 'no', 'off'}
+_INTEGER_RE = re.compile(r'^[+-]?\d+$')
+
+
+def _coerce_string(name: str, value: Any) -> str:
+    """Coerce a scalar to ``str``."""
+    if isinstance(value, (dict, list)):
+        raise ParameterError(f'Parameter "{name}" must be a string')
+    return str(value)
+
+
+def _coerce_email(name: str, value: Any) -> str:
+    """Coerce to ``str`` and require an email-like value."""
+    value = _coerce_string(name, value)
+    if '@' not in value:
+        raise ParameterError(f'Parameter "{name}" must be an email address')
+    return value
+
+
+def _coerce_url(name: str, value: Any) -> str:
+    """Coerce to ``str`` and require a URL-like value."""
+    value = _coerce_string(name, value)
+    if '://' not in value:
+        raise ParameterError(f'Parameter "{name}" must be a URL')
+    return value
+
+
+def _coerce_integer(name: str, value: Any) -> int:
+    """Coerce ints, integral floats and digit strings to ``int``."""
+    if isinstance(value, bool):
+        raise ParameterError(f'Parameter "{name}" must be an integer')
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INTEGER_RE.match(value.strip()):
+        return int(value)
+    raise ParameterError(f'Parameter "{name}" must be an integer')
+
+
+def _coerce_number(name: str, value: Any):
+    """Coerce to ``int`` when integral, otherwise ``float``."""
+    if isinstance(value, bool):
+        raise ParameterError(f'Parameter "{name}" must be a number')
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if _INTEGER_RE.match(value):
+            return int(value)
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise ParameterError(f'Parameter "{name}" must be a number')
+
+
+def _coerce_boolean(name: str, value: Any) -> bool:
+    """Coerce booleans, 0/1 and true/false strings to ``bool``."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ParameterError(f'Parameter "{name}" must be a boolean')
+
+
+def _coerce_any(name: str, value: Any) -> Any:
+    """Pass values of untyped parameters through unchanged."""
+    return value
+
+
+# Coercers by parameter "type"; unknown types pass values through
+PARAMETER_COERCERS: Dict[str, Callable[[str, Any], Any]] = {
+    'string': _coerce_string,
+    'email': _coerce_email,
+    'url': _coerce_url,
+    'number': _coerce_number,
+    'integer': _coerce_integer,
+    'boolean': _coerce_boolean,
+}
+
+
+@dataclass(frozen=True)
+class ParameterBinding:
+    """How one positional argument of ``run()`` is filled from a request."""
+
+    name: str
+    coerce: Callable[[str, Any], Any]
+    required: bool = False
+    default: Any = _MISSING
+    choices: Optional[Tuple[Any, ...]] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    settable: bool = True
+
+    def convert(self, value: Any) -> Any:
+        """Coerce and validate a value for this parameter.
+
+        Args:
+            value: Raw value from the request
+
+        Returns:
+            Typed value
+
+        Raises:
+            ParameterError: If the value is invalid
+        """
+        value = self.coerce(self.name, value)
+        if self.choices is not None and value not in self.choices:
+            raise ParameterError(
+                f'Parameter "{self.name}" must be one of '
+                f'{", ".join(map(str, self.choices))}'
+            )
+        if self.minimum is None and self.maximum is None:
+            return value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ParameterError(f'Parameter "{self.name}" must be a number')
+        if self.minimum is not None and value < self.minimum:
+            raise ParameterError(
+                f'Parameter "{self.name}" must be at least {self.minimum}'
+            )
+        if self.maximum is not None and value > self.maximum:
+            raise ParameterError(
+                f'Parameter "{self.name}" must be at most {self.maximum}'
+            )
+        return value
+
+
+@dataclass(frozen=True)
+class BindingPlan:
+    """Precompiled mapping from request data to ``run()`` arguments."""
+
+    bindings: Tuple[ParameterBinding, ...] = ()
+
+    def bind(self, data: Dict[str, Any]) -> List[Any]:
+        """Build positional workflow arguments from request data.
+
+        Args:
+            data: Parameter values from the request body
+
+        Returns:
+            Arguments in ``run()`` signature order
+
+        Raises:
+            ParameterError: If a value is missing or invalid
+        """
+        args = []
+        for binding in self.bindings:
+            value = data.get(binding.name) if binding.settable else None
+            if value is None or value == '':
+                if binding.default is _MISSING:
+                    raise ParameterError(
+                        f'Required parameter "{binding.name}" is missing'
+                    )
+                args.append(binding.default)
+            else:
+                args.append(binding.convert(value))
+        return args
+
+
+def compile_binding_plan(
+    workflow_class: type, parameters: List[Dict[str, Any]]
+) -> BindingPlan:
+    """Compile the binding plan for a workflow's parameter definitions.
+
+    Argument order follows the ``run()`` signature. Undeclared arguments
+    that sit between declared ones are filled with their signature
+    default; declared defaults are coerced once here.
+
+    Args:
+        workflow_class: The workflow class
+        parameters: List of parameter definitions
+
+    Returns:
+        Compiled BindingPlan
+
+    Raises:
+        ValueError: If the definitions do not match the ``run()`` signature
+    """
+    declared = {param['name']: param for param in parameters}
+    signature = inspect.signature(workflow_class.run)
+    # Drop "self"
+    run_params = list(signature.parameters.values())[1:]
+    positional = [
+        p for p in run_params
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    positional_names = [p.name for p in positional]
+
+    unknown = [name for name in declared if name not in positional_names]
+    if unknown:
+        raise ValueError(
+            f'Parameters {", ".join(unknown)} are not positional arguments '
+            f'of {workflow_class.__name__}.run'
+        )
+
+    # Only pass arguments up to the last declared one
+    last = max(
+        (positional_names.index(name) for name in declared), default=-1
+    )
+
+    bindings = []
+    for run_param in positional[:last + 1]:
+        sig_default = (
+            _MISSING if run_param.default is inspect.Parameter.empty
+            else run_param.default
+        )
+        param = declared.get(run_param.name)
+
+        if param is None:
+            if sig_default is _MISSING:
+                raise ValueError(
+                    f'Argument "{run_param.name}" of '
+                    f'{workflow_class.__name__}.run has no default and no '
+                    f'parameter definition'
+                )
+            bindings.append(ParameterBinding(
+                name=run_param.name,
+                coerce=_coerce_any,
+                default=sig_default,
+                settable=False,
+            ))
+            continue
+
+        coerce = PARAMETER_COERCERS.get(param.get('type'), _coerce_any)
+        required = param.get('required', False)
+        default = param.get('default')
+        if required:
+            default = _MISSING
+        elif default is None or default == '':
+            default = sig_default
+        else:
+            default = coerce(run_param.name, default)
+
+        choices = param.get('choices')
+        bindings.append(ParameterBinding(
+            name=run_param.name,
+            coerce=coerce,
+            required=required or default is _MISSING,
+            default=default,
+            choices=tuple(choices) if choices is not None else None,
+            minimum=param.get('min'),
+            maximum=param.get('max'),
+        ))
+
+    return BindingPlan(tuple(bindings))
+
+
 @dataclass
 class WorkflowMetadata:
     """Metadata for a workflow."""
@@ -15,11 +284,103 @@ class WorkflowMetadata:
     workflow_class: type
     parameters: List[Dict[str, Any]]
     category: str = "general"
+    task_queue: str = ""
+    workflow_type: str = ""
+    binding: BindingPlan = field(
+        default_factory=BindingPlan, repr=False, compare=False
+    )
+
+    def bind_arguments(self, data: Dict[str, Any]) -> List[Any]:
+        """Build positional ``run()`` arguments from request data.
+
+        Args:
+            data: Parameter values from the request body
+
+        Returns:
+            List of positional arguments
+
+        Raises:
+            ParameterError: If a value is missing or invalid
+        """
+        return self.binding.bind(data)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the registered workflows.
+
+    Built once per registry change and shared by every request: ``body`` is
+    the pre-serialized ``GET /api/workflows`` response and ``etag`` its
+    strong validator.
+    """
+
+    workflows: Tuple[WorkflowMetadata, ...]
+    by_category: Mapping[str, Tuple[WorkflowMetadata, ...]]
+    body: bytes
+    etag: str
 
 
 # Registry of workflow metadata
 WORKFLOW_METADATA: Dict[str, WorkflowMetadata] = {}
 
+# Catalog built from WORKFLOW_METADATA, reset on every registration
+_catalog: Optional[CatalogSnapshot] = None
+_catalog_lock = threading.Lock()
+
+
+def _build_catalog() -> CatalogSnapshot:
+    """Build a catalog snapshot from the current registry."""
+    workflows = tuple(WORKFLOW_METADATA.values())
+
+    by_category: Dict[str, List[WorkflowMetadata]] = {}
+    for workflow in workflows:
+        by_category.setdefault(workflow.category or "general", []).append(workflow)
+
+    body = json.dumps(
+        {
+            'success': True,
+            'workflows': [
+                {
+                    'id': workflow.id,
+                    'name': workflow.name,
+                    'description': workflow.description,
+                    'category': workflow.category,
+                    'parameters': workflow.parameters,
+                    'task_queue': workflow.task_queue,
+                }
+                for workflow in workflows
+            ],
+        },
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str,
+    ).encode('utf-8')
+
+    return CatalogSnapshot(
+        workflows=workflows,
+        by_category=MappingProxyType({
+            category: tuple(items) for category, items in by_category.items()
+        }),
+        body=body,
+        etag=hashlib.sha256(body).hexdigest()[:32],
+    )
+
+
+def get_catalog() -> CatalogSnapshot:
+    """Get the catalog snapshot, rebuilding it after registrations.
+
+    Returns:
+        Current CatalogSnapshot
+    """
+    global _catalog
+    catalog = _catalog
+    if catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = _build_catalog()
+            catalog = _catalog
+    return catalog
+
 
 def register_workflow_metadata(
     workflow_id: str,
@@ -28,9 +389,14 @@ def register_workflow_metadata(
     workflow_class: type,
     parameters: Optional[List[Dict[str, Any]]] = None,
     category: str = "general",
+    task_queue: Optional[str] = None,
+    workflow_type: Optional[str] = None,
 ) -> None:
     """Register metadata for a workflow.
 
+    The argument binding plan is compiled here once, so requests only pay
+    for a single coercion pass.
+
     Args:
         workflow_id: Unique identifier for the workflow
         name: Display name
@@ -38,16 +404,32 @@ def register_workflow_metadata(
         workflow_class: The workflow class
         parameters: List of parameter definitions
         category: Category/domain of the workflow
+        task_queue: Task queue or queue class (``interactive``, ``io``,
+            ``cpu``) the workflow runs on (default: ``DEFAULT_TASK_QUEUE``)
+        workflow_type: Temporal workflow type name; pass it when
+            ``@workflow.defn(name=...)`` renames the workflow (default:
+            the class name)
+
+    Raises:
+        ValueError: If the parameters do not match ``workflow_class.run``
     """
+    parameters = parameters or []
     WORKFLOW_METADATA[workflow_id] = WorkflowMetadata(
         id=workflow_id,
         name=name,
         description=description,
         workflow_class=workflow_class,
-        parameters=parameters or [],
+        parameters=parameters,
         category=category,
+        task_queue=config.resolve_task_queue(task_queue),
+        workflow_type=workflow_type or workflow_class.__name__,
+        binding=compile_binding_plan(workflow_class, parameters),
     )
 
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+
 
 def get_all_workflow_metadata() -> List[WorkflowMetadata]:
     """Get metadata for all registered workflows.
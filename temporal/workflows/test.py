@@ -1,8 +1,7 @@
 """Test workflow for Temporal."""
 
-from datetime import timedelta
 from temporalio import workflow
-from temporal.shared import get_default_retry_policy, get_default_activity_timeout
+from temporal.shared import execute_activity
 from temporal.workflow_metadata import register_workflow_metadata
 
 
@@ -20,13 +19,9 @@ class TestWorkflow:
         Returns:
             A greeting message
         """
-        # Execute activity using string reference to avoid sandbox restrictions
-        result = await workflow.execute_activity(
-            "test_activity",
-            name,
-            start_to_close_timeout=get_default_activity_timeout(),
-            retry_policy=get_default_retry_policy(),
-        )
+        # Execute activity using string reference to avoid sandbox restrictions;
+        # local or remote execution follows its registration
+        result = await execute_activity("test_activity", name)
 
         return result
 
@@ -1,10 +1,12 @@
 """Temporal client for starting workflows."""
 
 import asyncio
+import secrets
 import time
 from temporalio.client import Client
 from temporalio.service import RPCError
 from temporal.config import config
+from temporal.shared.converter import create_data_converter
 from temporal.workflows.test import TestWorkflow
 
 
@@ -21,11 +23,14 @@ async def start_test_workflow(name: str = "World") -> str:
         # Connect to Temporal server
         client = await Client.connect(
             config.ADDRESS,
-            namespace=config.NAMESPACE
+            namespace=config.NAMESPACE,
+            data_converter=create_data_converter(),
         )
 
         # Generate unique workflow ID
-        workflow_id = f"test-workflow-{int(time.time() * 1000)}"
+        workflow_id = (
+            f"test-workflow-{int(time.time() * 1000)}-{secrets.token_hex(4)}"
+        )
 
         # Start the workflow
         handle = await client.start_workflow(
@@ -1,43 +1,401 @@
-"""Temporal worker that executes workflows and activities."""
+"""Temporal worker that executes workflows and activities.
 
+Usage:
+    python3 temporal_worker.py                  # one worker process
+    python3 temporal_worker.py --processes      # one process per CPU
+    python3 temporal_worker.py --processes 4    # four supervised processes
+    python3 temporal_worker.py --task-queue cpu # dedicated pool for one queue
+    python3 temporal_worker.py --profile        # report the slowest calls
+"""
+
+import argparse
 import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import os
+import signal
+import sys
+from datetime import timedelta
 from temporalio.client import Client
-from temporalio.worker import Worker
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
+from temporalio.worker import SharedStateManager, Worker
 from temporal.config import config
-from temporal.registry import get_all_workflows, get_all_activities
+from temporal.shared.converter import create_blob_store, create_data_converter
+from temporal.shared.profiling import ProfileRecorder, ProfilingInterceptor
+from temporal.shared.tracing import configure_tracing
+from temporal.registry import (
+    ACTIVITY_EXECUTOR_ASYNC,
+    ACTIVITY_EXECUTOR_PROCESS,
+    ACTIVITY_EXECUTOR_THREAD,
+    get_activity_executor,
+    get_task_queue_registrations,
+)
+from temporal.supervisor import (
+    WorkerSupervisor,
+    default_process_count,
+    parse_process_count,
+)
 
+# temporalio's default for max_concurrent_activities
+DEFAULT_MAX_CONCURRENT_ACTIVITIES = 100
 
-async def main():
-    """Start the Temporal worker."""
-    # Connect to Temporal server
-    client = await Client.connect(
-        config.ADDRESS,
-        namespace=config.NAMESPACE
-    )
 
-    # Get all registered workflows and activities
-    workflows = get_all_workflows()
-    activities = get_all_activities()
+def create_activity_executor(task_queue: str, activities, worker_options):
+    """Build the executor the sync activities of a task queue need.
+
+    Thread activities get a thread pool sized to the queue's activity slots.
+    Process activities get a spawn-based process pool plus the shared state
+    manager temporalio uses to carry heartbeats and cancellation across the
+    process boundary.
+
+    Args:
+        task_queue: Task queue the activities are served on
+        activities: Activity functions served on this queue
+        worker_options: Tuning options of the queue's worker
+
+    Returns:
+        Tuple of extra Worker keyword arguments, the executor kind and a
+        list of callables that release the executor
+
+    Raises:
+        ValueError: If thread and process activities share the queue
+    """
+    kinds = {get_activity_executor(activity) for activity in activities}
+    if {ACTIVITY_EXECUTOR_THREAD, ACTIVITY_EXECUTOR_PROCESS} <= kinds:
+        raise ValueError(
+            f'Task queue {task_queue} mixes thread and process activities; '
+            f'a worker supports one executor, pin one kind to another queue'
+        )
 
-    # Create a worker that listens on the configured task queue
+    if ACTIVITY_EXECUTOR_PROCESS in kinds:
+        context = multiprocessing.get_context('spawn')
+        manager = context.Manager()
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=config.WORKER_ACTIVITY_PROCESSES or default_process_count(),
+            mp_context=context,
+        )
+        return {
+            'activity_executor': executor,
+            'shared_state_manager': SharedStateManager.create_from_multiprocessing(
+                manager
+            ),
+        }, ACTIVITY_EXECUTOR_PROCESS, [executor.shutdown, manager.shutdown]
+
+    if ACTIVITY_EXECUTOR_THREAD in kinds:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=(
+                config.WORKER_ACTIVITY_THREADS
+                or worker_options.get('max_concurrent_activities')
+                or DEFAULT_MAX_CONCURRENT_ACTIVITIES
+            ),
+            thread_name_prefix=f'activity-{task_queue}',
+        )
+        return (
+            {'activity_executor': executor},
+            ACTIVITY_EXECUTOR_THREAD,
+            [executor.shutdown],
+        )
+
+    return {}, ACTIVITY_EXECUTOR_ASYNC, []
+
+
+def create_worker(
+    client: Client, task_queue: str, workflows, activities, interceptors=()
+):
+    """Create a worker for one task queue with its configured limits.
+
+    Args:
+        client: Connected Temporal client
+        task_queue: Task queue to poll
+        workflows: Workflow classes served on this queue
+        activities: Activity functions served on this queue
+        interceptors: Worker interceptors
+
+    Returns:
+        Tuple of the Worker, the tuning options applied to it, the activity
+        executor kind and a list of cleanup callables
+    """
+    worker_options = config.get_worker_options(task_queue)
+    executor_options, executor_kind, cleanups = create_activity_executor(
+        task_queue, activities, worker_options
+    )
     worker = Worker(
         client,
-        task_queue=config.DEFAULT_TASK_QUEUE,
+        task_queue=task_queue,
         workflows=workflows,
         activities=activities,
+        interceptors=list(interceptors),
+        graceful_shutdown_timeout=timedelta(
+            seconds=config.WORKER_GRACEFUL_SHUTDOWN_SECONDS
+        ),
+        **executor_options,
+        **worker_options,
     )
+    return worker, worker_options, executor_kind, cleanups
+
+
+def create_runtime(slot: int = 0):
+    """Create a temporalio runtime exporting SDK metrics to Prometheus.
+
+    Args:
+        slot: Worker process slot; each process listens on
+            ``WORKER_METRICS_PORT + slot``
+
+    Returns:
+        Tuple of the Runtime (None when metrics are disabled) and the
+        exporter address
+    """
+    if config.WORKER_METRICS_PORT is None:
+        return None, None
+
+    port = config.WORKER_METRICS_PORT + slot
+    bind_address = f'{config.WORKER_METRICS_HOST}:{port}'
+    runtime = Runtime(telemetry=TelemetryConfig(
+        metrics=PrometheusConfig(
+            bind_address=bind_address,
+            durations_as_seconds=True,
+        ),
+    ))
+    return runtime, bind_address
+
+
+def create_profiler(cprofile_activities=()):
+    """Create the profiling interceptor configured for this worker.
+
+    Args:
+        cprofile_activities: Activity names to run under cProfile
+
+    Returns:
+        ProfilingInterceptor writing to a new ring buffer
+    """
+    return ProfilingInterceptor(
+        ProfileRecorder(config.WORKER_PROFILE_BUFFER),
+        cprofile_activities=cprofile_activities,
+        cprofile_dir=config.WORKER_PROFILE_DIR,
+        payload_sample_rate=config.WORKER_PROFILE_PAYLOAD_SAMPLE,
+    )
+
+
+def dump_profile(profiler: ProfilingInterceptor) -> None:
+    """Write the profiling report as JSON (SIGUSR1 handler)."""
+    path = profiler.recorder.dump(
+        config.WORKER_PROFILE_DIR, config.WORKER_PROFILE_TOP
+    )
+    print(f"📊 Profile written to {path}", flush=True)
+
+
+async def collect_blobs(store, interval: float, max_age: float) -> None:
+    """Delete unreferenced claim-check blobs every ``interval`` seconds.
+
+    Args:
+        store: Claim-check BlobStore
+        interval: Seconds between collections
+        max_age: Seconds after the last reference a blob is deleted
+    """
+    while True:
+        try:
+            deleted = await asyncio.to_thread(store.collect_garbage, max_age)
+        except Exception as e:
+            print(f"⚠️  Claim-check garbage collection failed: {e}", flush=True)
+        else:
+            if deleted:
+                print(f"🧹 Deleted {deleted} unreferenced claim-check blobs "
+                      f"from {store}", flush=True)
+        await asyncio.sleep(interval)
+
+
+async def main(
+    task_queues=None, slot: int = 0, profile=None, cprofile_activities=None
+):
+    """Start one worker per task queue and run them until SIGINT/SIGTERM.
+
+    Args:
+        task_queues: Task queues or queue classes to serve (default: every
+            queue that has registered workflows or activities)
+        slot: Worker process slot assigned by the supervisor
+        profile: Record activity and workflow step timings (default:
+            ``WORKER_PROFILE``)
+        cprofile_activities: Activity names to run under cProfile (default:
+            ``WORKER_CPROFILE_ACTIVITIES``)
+    """
+    if profile is None:
+        profile = config.WORKER_PROFILE
+    if cprofile_activities is None:
+        cprofile_activities = config.WORKER_CPROFILE_ACTIVITIES
+    profiler = None
+    if profile or cprofile_activities:
+        profiler = create_profiler(cprofile_activities)
+
+    runtime, metrics_address = create_runtime(slot)
+    data_converter = create_data_converter()
+
+    # Connect to Temporal server; the data converter and the tracing
+    # interceptors also apply to the workers created with this client
+    client = await Client.connect(
+        config.ADDRESS,
+        namespace=config.NAMESPACE,
+        runtime=runtime,
+        data_converter=data_converter,
+        interceptors=configure_tracing('temporal-worker'),
+    )
+
+    # Group registered workflows and activities by task queue
+    registrations = get_task_queue_registrations(task_queues)
+    if not registrations:
+        raise SystemExit(f"❌ Nothing is registered on task queues {task_queues}")
 
     print("🚀 Temporal worker started. Listening for workflows...")
-    print(f"   Task Queue: {config.DEFAULT_TASK_QUEUE}")
     print(f"   Server: {config.ADDRESS}")
     print(f"   Namespace: {config.NAMESPACE}")
-    print(f"   Workflows registered: {len(workflows)}")
-    print(f"   Activities registered: {len(activities)}")
-    print("\nPress Ctrl+C to stop the worker.\n")
+    if metrics_address:
+        print(f"   Metrics: http://{metrics_address}/metrics")
+    if config.TRACING_EXPORTER != 'none':
+        print(f"   Tracing: {config.TRACING_EXPORTER}")
+    if data_converter.payload_codec is not None:
+        print(f"   Payload codecs: {data_converter.payload_codec}")
+    if profiler:
+        print(f"   Profiling: on (kill -USR1 {os.getpid()} writes a report "
+              f"to {config.WORKER_PROFILE_DIR})")
+
+    workers = []
+    cleanups = []
+    for task_queue, (workflows, activities) in registrations.items():
+        worker, worker_options, executor_kind, worker_cleanups = create_worker(
+            client, task_queue, workflows, activities,
+            interceptors=[profiler] if profiler else (),
+        )
+        workers.append(worker)
+        cleanups.extend(worker_cleanups)
+
+        print(f"   Task Queue: {task_queue}")
+        print(f"     Workflows registered: {len(workflows)}")
+        print(f"     Activities registered: {len(activities)}")
+        print(f"     Activity executor: {executor_kind}")
+        print("     Worker options:")
+        if worker_options:
+            for option, value in sorted(worker_options.items()):
+                print(f"       {option}: {value}")
+        else:
+            print("       (temporalio defaults)")
+    print("\nPress Ctrl+C to stop the worker.\n", flush=True)
+
+    # Shut down gracefully on Ctrl+C or a SIGTERM from the supervisor
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    if profiler:
+        loop.add_signal_handler(signal.SIGUSR1, dump_profile, profiler)
 
-    # Run the worker
-    await worker.run()
+    # One process per host collects unreferenced claim-check blobs
+    gc_task = None
+    store = create_blob_store()
+    if store is not None and slot == 0 and config.CLAIM_CHECK_GC_INTERVAL_SECONDS:
+        gc_task = asyncio.create_task(collect_blobs(
+            store,
+            config.CLAIM_CHECK_GC_INTERVAL_SECONDS,
+            config.CLAIM_CHECK_RETENTION_SECONDS,
+        ))
+
+    # Run the workers; any of them failing stops the process
+    run_tasks = [asyncio.create_task(worker.run()) for worker in workers]
+    stop_task = asyncio.create_task(stop.wait())
+    await asyncio.wait(
+        {*run_tasks, stop_task}, return_when=asyncio.FIRST_COMPLETED
+    )
+    stop_task.cancel()
+    if gc_task:
+        gc_task.cancel()
+
+    print("🛑 Shutting down worker...", flush=True)
+    await asyncio.gather(
+        *(worker.shutdown() for worker, task in zip(workers, run_tasks)
+          if not task.done())
+    )
+    try:
+        await asyncio.gather(*run_tasks)
+    finally:
+        for cleanup in cleanups:
+            cleanup()
+        if profiler:
+            print(profiler.recorder.format_report(config.WORKER_PROFILE_TOP))
+
+
+def run_worker_process(
+    task_queues=None, slot: int = 0, profile=None, cprofile_activities=None
+):
+    """Entry point of a single worker process.
+
+    Args:
+        task_queues: Task queues or queue classes to serve
+        slot: Worker process slot assigned by the supervisor
+        profile: Record activity and workflow step timings
+        cprofile_activities: Activity names to run under cProfile
+    """
+    asyncio.run(main(task_queues, slot, profile, cprofile_activities))
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--processes',
+        nargs='?',
+        const='0',
+        default=None,
+        metavar='N',
+        help='Supervise N worker processes (default without N: CPU count)',
+    )
+    parser.add_argument(
+        '--task-queue',
+        action='append',
+        dest='task_queues',
+        metavar='QUEUE',
+        help=(
+            'Only serve this task queue or queue class (interactive, io, '
+            'cpu); repeatable (default: every registered queue)'
+        ),
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        default=None,
+        help=(
+            'Record activity and workflow step timings; print the slowest '
+            'on shutdown and write a JSON report on SIGUSR1'
+        ),
+    )
+    parser.add_argument(
+        '--cprofile',
+        action='append',
+        dest='cprofile_activities',
+        metavar='ACTIVITY',
+        help='Run this activity under cProfile (implies --profile); repeatable',
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+
+    if args.processes is None:
+        run_worker_process(
+            args.task_queues,
+            profile=args.profile,
+            cprofile_activities=args.cprofile_activities,
+        )
+    else:
+        processes = parse_process_count(args.processes)
+        print(f"🚀 Starting {processes} Temporal worker processes...")
+        supervisor = WorkerSupervisor(
+            functools.partial(
+                run_worker_process,
+                args.task_queues,
+                profile=args.profile,
+                cprofile_activities=args.cprofile_activities,
+            ),
+            processes,
+            shutdown_timeout=config.WORKER_GRACEFUL_SHUTDOWN_SECONDS + 10,
+        )
+        sys.exit(supervisor.run())
@@ -0,0 +1,104 @@
+"""Shared fixtures: a Flask app wired to an in-memory fake Temporal client."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from temporalio.client import WorkflowExecutionStatus
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+from app import create_app
+from app.config import TestingConfig
+
+
+class FakeHandle:
+    """Workflow handle returned by ``FakeClient``."""
+
+    def __init__(self, client, workflow_id, run_id=None):
+        self.client = client
+        self.id = workflow_id
+        self.run_id = run_id
+        self.first_execution_run_id = run_id
+
+    async def result(self):
+        return self.client.results.get(self.id, f'Hello, {self.id}!')
+
+    async def describe(self):
+        return self.client.descriptions[self.id]
+
+
+class FakeDescription:
+    """Description of a run started through ``FakeClient``."""
+
+    def __init__(self, run_id, memo):
+        self.run_id = run_id
+        self.status = WorkflowExecutionStatus.RUNNING
+        self._memo = memo or {}
+
+    async def memo(self):
+        return self._memo
+
+
+class FakeClient:
+    """Records starts instead of talking to a Temporal server.
+
+    Starting an ID that was already started fails like a server rejecting
+    the duplicate.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.results = {}
+        self.descriptions = {}
+
+    async def start_workflow(self, run, *args, id, **kwargs):
+        existing = self.descriptions.get(id)
+        if existing is not None:
+            raise WorkflowAlreadyStartedError(
+                id, run.__qualname__, run_id=existing.run_id
+            )
+        self.starts.append(SimpleNamespace(args=args, id=id, **kwargs))
+        run_id = str(uuid.uuid4())
+        self.descriptions[id] = FakeDescription(run_id, kwargs.get('memo'))
+        return FakeHandle(self, id, run_id)
+
+    def get_workflow_handle(self, workflow_id, run_id=None):
+        return FakeHandle(self, workflow_id, run_id)
+
+
+class FakeClientManager:
+    """Stand-in for ``ClientManager`` handing out one ``FakeClient``."""
+
+    default_namespace = 'default'
+
+    def __init__(self, client):
+        self.client = client
+        self.errors = []
+
+    async def get_client(self, namespace=None):
+        return self.client
+
+    def report_error(self, error, namespace=None):
+        self.errors.append(error)
+
+
+class _Config(TestingConfig):
+    TEMPORAL_WARM_CLIENT = False
+    METRICS_ENABLED = False
+    RUN_SEARCH_ATTRIBUTES = False
+    READY_ENABLED = False
+    READY_CHECK_INTERVAL = 3600
+
+
+@pytest.fixture
+def make_app():
+    """Create an app with config overrides and a fake Temporal client."""
+
+    def _make_app(**overrides):
+        config_class = type('Config', (_Config,), overrides)
+        app = create_app(config_class)
+        client = FakeClient()
+        app.extensions['temporal_clients'] = FakeClientManager(client)
+        return app, client
+
+    return _make_app
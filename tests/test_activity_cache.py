@@ -0,0 +1,60 @@
+"""Activity result cache."""
+
+import asyncio
+import os
+import sqlite3
+
+import pytest
+
+from temporal.shared.activity_cache import (
+    DiskCache,
+    _private_directory,
+    cached_activity,
+)
+
+
+def test_disk_cache_stores_payloads_not_pickles(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache' / 'lookup.sqlite3'))
+    cache.set('k', {'id': 7, 'tags': ['a']}, ttl=60)
+
+    assert cache.get('k') == (True, {'id': 7, 'tags': ['a']})
+    with sqlite3.connect(cache.path) as conn:
+        (raw,) = conn.execute('SELECT value FROM cache').fetchone()
+    assert b'json/plain' in raw
+    assert os.stat(tmp_path / 'cache').st_mode & 0o777 == 0o700
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path / 'lookup.sqlite3'))
+    cache.set('k', 'value', ttl=60)
+    with sqlite3.connect(cache.path) as conn:
+        conn.execute("UPDATE cache SET value = x'80049500'")
+
+    assert cache.get('k') == (False, None)
+
+
+def test_async_activity_uses_disk_tier(tmp_path):
+    calls = []
+
+    @cached_activity(ttl=60, disk_path=str(tmp_path / 'lookup.sqlite3'))
+    async def lookup(customer_id: str) -> dict:
+        calls.append(customer_id)
+        return {'id': customer_id}
+
+    assert asyncio.run(lookup('c1')) == {'id': 'c1'}
+    lookup.cache.memory.clear()
+    assert asyncio.run(lookup('c1')) == {'id': 'c1'}
+
+    assert calls == ['c1']
+    assert lookup.cache.stats() == {'hits': 1, 'disk_hits': 1, 'misses': 1}
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='POSIX permissions')
+def test_shared_cache_directory_is_refused(tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        _private_directory(str(shared))
+    assert _private_directory(str(tmp_path / 'own')) == str(tmp_path / 'own')
@@ -0,0 +1,151 @@
+"""Admission control: token buckets, wait cap and the 429 response."""
+
+import pytest
+
+from app.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    BacklogMonitor,
+    BatchTooLargeError,
+    TokenBucket,
+)
+
+
+def test_bucket_refills_at_its_rate_up_to_the_burst():
+    bucket = TokenBucket(rate=2.0, burst=4.0, now=0.0)
+    bucket.tokens = 0.0
+
+    bucket.refill(1.0)
+    assert bucket.tokens == 2.0
+    assert bucket.wait_time(3.0) == 0.5
+
+    bucket.refill(10.0)
+    assert bucket.tokens == 4.0
+    assert bucket.wait_time(3.0) == 0.0
+
+
+def test_scale_slows_the_refill():
+    bucket = TokenBucket(rate=2.0, burst=4.0, now=0.0)
+    bucket.tokens = 0.0
+
+    bucket.refill(1.0, scale=0.5)
+
+    assert bucket.tokens == 1.0
+    assert bucket.wait_time(2.0, scale=0.5) == 1.0
+
+
+def test_burst_is_admitted_then_rejected_with_retry_after(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('app.admission.time.monotonic', lambda: now[0])
+    controller = AdmissionController(workflow_rate=1.0, workflow_burst=2.0)
+
+    controller.admit('report', 'alice')
+    controller.admit('report', 'alice')
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        controller.admit('report', 'alice')
+    assert rejected.value.retry_after == pytest.approx(1.0)
+    assert rejected.value.retry_after_header == '1'
+
+    # Other workflow IDs have their own bucket
+    controller.admit('invoice', 'alice')
+
+    now[0] += 1.0
+    controller.admit('report', 'alice')
+
+
+def test_rejected_launch_takes_no_tokens(monkeypatch):
+    monkeypatch.setattr('app.admission.time.monotonic', lambda: 0.0)
+    controller = AdmissionController(
+        workflow_rate=1.0, workflow_burst=5.0,
+        caller_rate=1.0, caller_burst=1.0,
+    )
+
+    controller.admit('report', 'alice')
+    with pytest.raises(AdmissionRejectedError):
+        controller.admit('report', 'alice')
+
+    assert controller._buckets[('workflow', 'report')].tokens == 4.0
+
+
+def test_batch_pays_one_token_per_run(monkeypatch):
+    monkeypatch.setattr('app.admission.time.monotonic', lambda: 0.0)
+    controller = AdmissionController(workflow_rate=1.0, workflow_burst=3.0)
+
+    controller.admit('report', 'alice', cost=2)
+    assert controller._buckets[('workflow', 'report')].tokens == 1.0
+    with pytest.raises(AdmissionRejectedError):
+        controller.admit('report', 'alice', cost=2)
+
+
+def test_batch_larger_than_the_burst_is_refused(monkeypatch):
+    monkeypatch.setattr('app.admission.time.monotonic', lambda: 0.0)
+    controller = AdmissionController(workflow_rate=1.0, workflow_burst=3.0)
+
+    with pytest.raises(BatchTooLargeError):
+        controller.admit('report', 'alice', cost=50)
+    assert controller._buckets[('workflow', 'report')].tokens == 3.0
+
+
+def test_wait_slots_are_capped_and_released():
+    controller = AdmissionController(max_waits=1)
+
+    with controller.admit('report', 'alice', wait=True):
+        assert controller.waits_in_flight == 1
+        with pytest.raises(AdmissionRejectedError):
+            controller.admit('report', 'bob', wait=True)
+        # Launches that do not wait need no slot
+        controller.admit('report', 'bob')
+
+    assert controller.waits_in_flight == 0
+
+
+def test_backlog_factor_shrinks_above_the_threshold():
+    monitor = BacklogMonitor('default', threshold=100, min_factor=0.2)
+    monitor._refresh_at['queue'] = float('inf')
+
+    monitor._backlogs['queue'] = 50
+    assert monitor.factor(None, 'queue') == 1.0
+    monitor._backlogs['queue'] = 200
+    assert monitor.factor(None, 'queue') == 0.5
+    monitor._backlogs['queue'] = 10_000
+    assert monitor.factor(None, 'queue') == 0.2
+
+
+def test_api_answers_429_with_retry_after(make_app):
+    app, client = make_app(ADMISSION_WORKFLOW_RATE=0.001)
+    http = app.test_client()
+
+    first = http.post('/api/workflows/test/run?wait=false', json={})
+    second = http.post('/api/workflows/test/run?wait=false', json={})
+
+    assert first.status_code == 202
+    assert second.status_code == 429
+    assert int(second.headers['Retry-After']) >= 1
+    assert len(client.starts) == 1
+
+
+def test_api_refuses_batches_over_the_burst(make_app):
+    app, client = make_app(ADMISSION_WORKFLOW_RATE=1, ADMISSION_WORKFLOW_BURST=1)
+
+    response = app.test_client().post(
+        '/api/workflows/test/run-batch', json=[{}] * 500
+    )
+
+    assert response.status_code == 413
+    assert client.starts == []
+
+
+def test_callers_are_keyed_by_address_by_default(make_app):
+    app, client = make_app(ADMISSION_CALLER_RATE=0.001)
+    http = app.test_client()
+
+    statuses = [
+        http.post(
+            '/api/workflows/test/run?wait=false',
+            json={},
+            headers={'X-Caller-ID': f'caller-{i}'},
+        ).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [202, 429, 429]
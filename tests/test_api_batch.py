@@ -0,0 +1,117 @@
+"""POST /api/workflows/<id>/run-batch streaming."""
+
+import asyncio
+import json
+
+from temporalio.common import SearchAttributeIndexedValueType
+
+
+def _lines(response):
+    return sorted(
+        (json.loads(line) for line in response.data.decode().splitlines()),
+        key=lambda line: line['index'],
+    )
+
+
+def test_batch_streams_one_line_per_item(make_app):
+    app, client = make_app()
+
+    response = app.test_client().post(
+        '/api/workflows/test/run-batch',
+        json=[{'name': 'a'}, {'name': 'b'}, 'not an object'],
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = _lines(response)
+    assert [line['success'] for line in lines] == [True, True, False]
+    assert sorted(start.args for start in client.starts) == [('a',), ('b',)]
+
+
+def test_batch_with_search_attributes_outside_app_context(make_app):
+    # Starts run while the body streams, after the app context is popped
+    app, client = make_app(RUN_SEARCH_ATTRIBUTES=True)
+    registry = app.extensions['run_visibility'].search_attributes
+
+    async def available(_client):
+        return {'CatalogWorkflowId': SearchAttributeIndexedValueType.KEYWORD}
+
+    registry.available = available
+
+    response = app.test_client().post(
+        '/api/workflows/test/run-batch', json=[{'name': 'a'}, {'name': 'b'}]
+    )
+
+    lines = _lines(response)
+    assert all(line['success'] for line in lines), lines
+    assert len(client.starts) == 2
+    assert all(start.search_attributes for start in client.starts)
+
+
+def test_batch_idempotency_keys_per_item(make_app):
+    app, client = make_app()
+
+    app.test_client().post(
+        '/api/workflows/test/run-batch',
+        json=[{'name': 'a'}, {'name': 'b'}],
+        headers={'Idempotency-Key': 'key'},
+    )
+
+    ids = sorted(start.id for start in client.starts)
+    assert len(set(ids)) == 2
+    assert all(start.memo for start in client.starts)
+
+
+def test_batch_retry_attaches_to_started_runs(make_app):
+    app, client = make_app()
+    http = app.test_client()
+    items = [{'name': 'a'}, {'name': 'b'}]
+    headers = {'Idempotency-Key': 'import-7'}
+
+    first = _lines(http.post(
+        '/api/workflows/test/run-batch', json=items, headers=headers
+    ))
+    retry = _lines(http.post(
+        '/api/workflows/test/run-batch', json=items, headers=headers
+    ))
+
+    assert [line['deduplicated'] for line in retry] == [True, True]
+    assert [line['workflow_id'] for line in retry] == [
+        line['workflow_id'] for line in first
+    ]
+    assert len(client.starts) == 2
+
+
+def test_batch_concurrency_is_capped(make_app):
+    app, client = make_app()
+    in_flight = []
+    peak = []
+    start_workflow = client.start_workflow
+
+    async def slow_start(*args, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return await start_workflow(*args, **kwargs)
+
+    client.start_workflow = slow_start
+
+    response = app.test_client().post(
+        '/api/workflows/test/run-batch?concurrency=2',
+        json=[{'name': str(i)} for i in range(6)],
+    )
+
+    assert all(line['success'] for line in _lines(response))
+    assert max(peak) == 2
+
+
+def test_oversized_batch_is_rejected(make_app):
+    app, client = make_app(BATCH_MAX_ITEMS=2)
+
+    response = app.test_client().post(
+        '/api/workflows/test/run-batch', json=[{}, {}, {}]
+    )
+
+    assert response.status_code == 413
+    assert client.starts == []
@@ -0,0 +1,56 @@
+"""Idempotent starts via Idempotency-Key or parameter-derived workflow IDs."""
+
+
+def _start(http, name, key=None):
+    headers = {'Idempotency-Key': key} if key else {}
+    return http.post(
+        '/api/workflows/test/run?wait=false',
+        json={'name': name},
+        headers=headers,
+    )
+
+
+def test_repeated_key_attaches_to_the_first_run(make_app):
+    app, client = make_app()
+    http = app.test_client()
+
+    first = _start(http, 'a', key='order-42')
+    second = _start(http, 'a', key='order-42')
+
+    assert first.status_code == second.status_code == 202
+    assert first.json['deduplicated'] is False
+    assert second.json['deduplicated'] is True
+    assert second.json['workflow_id'] == first.json['workflow_id']
+    assert len(client.starts) == 1
+
+
+def test_repeated_key_with_other_parameters_is_rejected(make_app):
+    app, client = make_app()
+    http = app.test_client()
+
+    _start(http, 'a', key='order-42')
+    response = _start(http, 'b', key='order-42')
+
+    assert response.status_code == 422
+    assert len(client.starts) == 1
+
+
+def test_requests_without_key_get_unique_ids(make_app):
+    app, client = make_app()
+    http = app.test_client()
+
+    _start(http, 'a')
+    _start(http, 'a')
+
+    assert len({start.id for start in client.starts}) == 2
+    assert all(start.memo is None for start in client.starts)
+
+
+def test_params_mode_derives_the_id_from_the_parameters(make_app):
+    app, client = make_app(WORKFLOW_ID_MODE='params')
+    http = app.test_client()
+
+    ids = [_start(http, name).json['workflow_id'] for name in 'aab']
+
+    assert ids[0] == ids[1] != ids[2]
+    assert len(client.starts) == 2
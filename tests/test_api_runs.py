@@ -0,0 +1,58 @@
+"""GET /api/runs/<run_id>/result."""
+
+from types import SimpleNamespace
+
+from temporalio.client import WorkflowExecutionStatus, WorkflowFailureError
+from temporalio.exceptions import ApplicationError
+
+
+def _describe(status, run_id='run-a'):
+    return SimpleNamespace(status=status, run_id=run_id)
+
+
+def test_completed_run_returns_result(make_app):
+    app, client = make_app(RESULT_CACHE_ENABLED=False)
+    client.descriptions['run-1'] = _describe(WorkflowExecutionStatus.COMPLETED)
+    client.results['run-1'] = 'done'
+
+    response = app.test_client().get('/api/runs/run-1/result')
+
+    assert response.status_code == 200
+    assert response.json['result'] == 'done'
+
+
+def test_running_run_is_accepted(make_app):
+    app, client = make_app(RESULT_CACHE_ENABLED=False)
+    client.descriptions['run-1'] = _describe(WorkflowExecutionStatus.RUNNING)
+
+    response = app.test_client().get('/api/runs/run-1/result')
+
+    assert response.status_code == 202
+    assert response.json['status'] == 'RUNNING'
+
+
+def test_failed_run_reports_its_status(make_app, monkeypatch):
+    app, client = make_app(RESULT_CACHE_ENABLED=False)
+    for status in (
+        WorkflowExecutionStatus.FAILED,
+        WorkflowExecutionStatus.TERMINATED,
+        WorkflowExecutionStatus.TIMED_OUT,
+    ):
+        client.descriptions['run-1'] = _describe(status)
+        monkeypatch.setattr(client, 'results', _FailedResults())
+
+        for wait in (0, 1):
+            response = app.test_client().get(
+                f'/api/runs/run-1/result?wait={wait}'
+            )
+            assert response.status_code == 200
+            assert response.json['status'] == status.name
+            assert response.json['error'] == 'disk full'
+            assert 'result' not in response.json
+
+
+class _FailedResults(dict):
+    """Results whose lookups fail like ``handle.result()`` of a failed run."""
+
+    def get(self, key, default=None):
+        raise WorkflowFailureError(cause=ApplicationError('disk full'))
@@ -0,0 +1,40 @@
+"""GET /api/workflows served from the catalog snapshot."""
+
+from temporal.workflow_metadata import get_catalog, register_workflow_metadata
+
+
+def test_catalog_is_served_with_an_etag(make_app):
+    app, _ = make_app()
+    http = app.test_client()
+
+    response = http.get('/api/workflows')
+    assert response.status_code == 200
+    assert response.headers['ETag'] == f'"{get_catalog().etag}"'
+    assert any(item['id'] == 'test' for item in response.json['workflows'])
+
+    cached = http.get(
+        '/api/workflows', headers={'If-None-Match': response.headers['ETag']}
+    )
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+
+def test_registration_rebuilds_the_catalog(make_app, monkeypatch):
+    from temporal import workflow_metadata
+    from temporal.workflows.test import TestWorkflow
+
+    monkeypatch.setattr(
+        workflow_metadata, 'WORKFLOW_METADATA',
+        dict(workflow_metadata.WORKFLOW_METADATA),
+    )
+    # Restored on teardown, so later tests see the original catalog
+    monkeypatch.setattr(workflow_metadata, '_catalog', None)
+    before = get_catalog()
+
+    register_workflow_metadata(
+        'test-copy', 'Test Copy', 'Same workflow again', TestWorkflow
+    )
+    after = get_catalog()
+
+    assert after.etag != before.etag
+    assert 'test-copy' in {workflow.id for workflow in after.workflows}
@@ -0,0 +1,111 @@
+"""Claim-check codec and local blob store."""
+
+import asyncio
+import hashlib
+import os
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from temporal.config import config
+from temporal.shared.claim_check import (
+    CLAIM_CHECK_ENCODING,
+    BlobStore,
+    ClaimCheckCodec,
+    LocalBlobStore,
+)
+from temporal.shared.converter import create_blob_store
+
+
+def _payload(size):
+    return Payload(metadata={'encoding': b'binary/plain'}, data=os.urandom(size))
+
+
+def _reference(key):
+    return Payload(metadata={'encoding': CLAIM_CHECK_ENCODING}, data=key)
+
+
+@pytest.fixture
+def codec(tmp_path):
+    return ClaimCheckCodec(LocalBlobStore(str(tmp_path / 'blobs')), threshold=1024)
+
+
+def test_round_trip_moves_only_large_payloads(codec):
+    small, large = _payload(10), _payload(4096)
+
+    encoded = asyncio.run(codec.encode([small, large]))
+
+    assert encoded[0] == small
+    assert encoded[1].metadata['encoding'] == CLAIM_CHECK_ENCODING
+    assert encoded[1].ByteSize() < 200
+    assert asyncio.run(codec.decode(encoded)) == [small, large]
+
+
+def test_identical_payloads_share_one_blob(codec, tmp_path):
+    payload = _payload(4096)
+
+    first, second = asyncio.run(codec.encode([payload, payload]))
+
+    assert first.data == second.data
+    blobs = [name for _, _, names in os.walk(tmp_path / 'blobs') for name in names]
+    assert len(blobs) == 1
+
+
+@pytest.mark.parametrize('key', [
+    b'../../../etc/passwd',
+    b'/etc/passwd',
+    b'AB' * 32,
+    b'a' * 63,
+])
+def test_malformed_reference_is_rejected(codec, key):
+    with pytest.raises(RuntimeError, match='Malformed'):
+        asyncio.run(codec.decode([_reference(key)]))
+
+
+def test_store_rejects_keys_that_are_not_digests(codec):
+    with pytest.raises(ValueError):
+        codec.store.get('../../../etc/passwd')
+    with pytest.raises(ValueError):
+        codec.store.put('../x', b'data')
+
+
+def test_tampered_blob_is_detected(codec):
+    encoded = asyncio.run(codec.encode([_payload(4096)]))
+    key = encoded[0].data.decode()
+    with open(codec.store._path(key), 'wb') as f:
+        f.write(_payload(4096).SerializeToString())
+
+    with pytest.raises(RuntimeError, match='does not match'):
+        asyncio.run(codec.decode(encoded))
+
+
+def test_missing_blob_is_reported(codec):
+    key = hashlib.sha256(b'gone').hexdigest().encode()
+    with pytest.raises(RuntimeError, match='missing'):
+        asyncio.run(codec.decode([_reference(key)]))
+
+
+def test_garbage_collection_keeps_fresh_blobs(codec):
+    encoded = asyncio.run(codec.encode([_payload(4096)]))
+
+    assert codec.store.collect_garbage(max_age=3600) == 0
+    assert codec.store.collect_garbage(max_age=-1) == 1
+    with pytest.raises(RuntimeError, match='missing'):
+        asyncio.run(codec.decode(encoded))
+
+
+def test_blob_store_is_abstract():
+    with pytest.raises(TypeError):
+        BlobStore()
+
+
+def test_claim_checks_are_off_by_default():
+    assert config.CLAIM_CHECK_STORE == 'none'
+    assert create_blob_store() is None
+
+
+def test_local_store_needs_a_directory(monkeypatch):
+    monkeypatch.setattr(config, 'CLAIM_CHECK_STORE', 'local')
+    monkeypatch.setattr(config, 'CLAIM_CHECK_DIR', None)
+    with pytest.raises(ValueError, match='TEMPORAL_CLAIM_CHECK_DIR'):
+        create_blob_store()
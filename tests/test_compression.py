@@ -0,0 +1,67 @@
+"""Compression codec and the configured codec chain."""
+
+import asyncio
+import os
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from temporal.config import config
+from temporal.shared.claim_check import CLAIM_CHECK_ENCODING
+from temporal.shared.compression import CompressionCodec, zstd_available
+from temporal.shared.converter import create_payload_codec
+
+
+def _json_payload(size):
+    return Payload(
+        metadata={'encoding': b'json/plain'},
+        data=b'{"items":[' + b'"same",' * (size // 7) + b'"end"]}',
+    )
+
+
+def test_defaults_to_zlib():
+    assert CompressionCodec().algorithm == 'zlib'
+    assert config.PAYLOAD_COMPRESSION == 'zlib'
+
+
+def test_auto_is_not_an_algorithm():
+    with pytest.raises(ValueError):
+        CompressionCodec('auto')
+
+
+@pytest.mark.skipif(zstd_available(), reason='zstandard is installed')
+def test_zstd_must_be_installed():
+    with pytest.raises(RuntimeError):
+        CompressionCodec('zstd')
+
+
+def test_round_trip_compresses_only_large_payloads():
+    codec = CompressionCodec(threshold=1024)
+    small = _json_payload(100)
+    large = _json_payload(64 * 1024)
+    noise = Payload(metadata={'encoding': b'binary/plain'}, data=os.urandom(4096))
+
+    encoded = asyncio.run(codec.encode([small, large, noise]))
+
+    assert encoded[0] == small
+    assert encoded[1].metadata['encoding'] == b'binary/zlib'
+    assert encoded[1].ByteSize() < large.ByteSize() // 10
+    assert encoded[2] == noise  # does not shrink
+    assert asyncio.run(codec.decode(encoded)) == [small, large, noise]
+
+
+def test_chain_compresses_before_claim_checking(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, 'CLAIM_CHECK_STORE', 'local')
+    monkeypatch.setattr(config, 'CLAIM_CHECK_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'CLAIM_CHECK_THRESHOLD', 1024)
+    codec = create_payload_codec()
+    compressible = _json_payload(64 * 1024)
+    noise = Payload(
+        metadata={'encoding': b'binary/plain'}, data=os.urandom(8192)
+    )
+
+    encoded = asyncio.run(codec.encode([compressible, noise]))
+
+    assert encoded[0].metadata['encoding'] == b'binary/zlib'
+    assert encoded[1].metadata['encoding'] == CLAIM_CHECK_ENCODING
+    assert asyncio.run(codec.decode(encoded)) == [compressible, noise]
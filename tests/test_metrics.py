@@ -0,0 +1,26 @@
+"""Prometheus request metrics."""
+
+from app.metrics import REQUESTS
+
+
+def _workflow_labels():
+    return {
+        sample.labels['workflow']
+        for metric in REQUESTS.collect()
+        for sample in metric.samples
+    }
+
+
+def test_unknown_workflow_ids_share_one_label(make_app):
+    app, _ = make_app(METRICS_ENABLED=True)
+    http = app.test_client()
+
+    for i in range(5):
+        response = http.post(f'/api/workflows/bogus{i}/run', json={})
+        assert response.status_code == 404
+    http.post('/api/workflows/test/run?wait=false', json={})
+
+    labels = _workflow_labels()
+    assert 'unknown' in labels
+    assert 'test' in labels
+    assert not any(label.startswith('bogus') for label in labels)
@@ -0,0 +1,124 @@
+"""FastPayloadConverter round trips, with and without orjson."""
+
+import dataclasses
+import datetime
+import enum
+import math
+from typing import Optional
+
+import pytest
+from temporalio.converter import DefaultPayloadConverter
+
+from temporal.shared import payload_converter
+from temporal.shared.payload_converter import FastPayloadConverter
+
+
+class Color(enum.Enum):
+    RED = 'red'
+
+
+@dataclasses.dataclass
+class Order:
+    zone: str
+    amount: float
+    created: datetime.datetime
+
+
+@dataclasses.dataclass
+class Attachment:
+    name: str
+    content: bytes
+
+
+VALUES = [
+    {'b': 1, 'a': [1.5, None, True]},
+    {1: 'one', 2: 'two'},
+    Order('eu', 9.5, datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)),
+    {'color': Color.RED, 'day': datetime.date(2024, 5, 1)},
+    2 ** 70,
+]
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        if payload_converter.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(payload_converter, 'orjson', None)
+    return request.param
+
+
+def _encode(value):
+    return FastPayloadConverter().to_payloads([value])[0]
+
+
+@pytest.mark.parametrize('value', VALUES)
+def test_wire_format_does_not_depend_on_orjson(value, monkeypatch):
+    with_orjson = _encode(value)
+    monkeypatch.setattr(payload_converter, 'orjson', None)
+
+    assert _encode(value) == with_orjson
+
+
+def test_dicts_match_the_default_converter(backend):
+    value = {'b': 1, 'a': {'d': [1, 2], 'c': None}}
+    expected = DefaultPayloadConverter().to_payloads([value])[0]
+
+    assert _encode(value) == expected
+
+
+@pytest.mark.parametrize('number', [math.nan, math.inf, -math.inf])
+def test_non_finite_floats_survive(backend, number):
+    converter = FastPayloadConverter()
+    payloads = converter.to_payloads([{'x': number, 'y': None}])
+
+    decoded = converter.from_payloads(payloads)[0]
+
+    assert decoded['y'] is None
+    if math.isnan(number):
+        assert math.isnan(decoded['x'])
+    else:
+        assert decoded['x'] == number
+
+
+def test_binary_fields_round_trip(backend):
+    converter = FastPayloadConverter()
+    attachment = Attachment('scan.png', b'\x00\xff' * 512)
+
+    payload = converter.to_payloads([attachment])[0]
+
+    assert payload.metadata['encoding'] == b'binary/json-blobs'
+    assert converter.from_payloads([payload], [Attachment])[0] == attachment
+
+
+@dataclasses.dataclass
+class Note:
+    text: str
+    reply_to: Optional[str] = None
+
+
+def test_none_round_trips_without_a_stdlib_pass(backend, monkeypatch):
+    value = {'cursor': None, 'notes': [Note('null and void')]}
+    if backend == 'orjson':
+        def no_stdlib(*args, **kwargs):
+            raise AssertionError('encoded twice')
+
+        monkeypatch.setattr(payload_converter.json, 'dumps', no_stdlib)
+    converter = FastPayloadConverter()
+
+    payloads = converter.to_payloads([value])
+
+    assert converter.from_payloads(payloads)[0] == {
+        'cursor': None,
+        'notes': [{'reply_to': None, 'text': 'null and void'}],
+    }
+
+
+def test_non_finite_float_in_a_dataclass_survives(backend):
+    converter = FastPayloadConverter()
+    order = Order('eu', math.inf, datetime.datetime(2024, 5, 1))
+
+    decoded = converter.from_payloads(converter.to_payloads([order]))[0]
+
+    assert decoded['amount'] == math.inf
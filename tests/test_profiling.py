@@ -0,0 +1,32 @@
+"""Profiling interceptor helpers."""
+
+import asyncio
+
+from temporal.shared.profiling import ProfilingInterceptor
+from temporal.shared.profiling.interceptor import _StepTimer
+
+
+def test_step_timer_counts_only_running_steps():
+    clock = iter(range(100))
+    steps = []
+
+    async def work():
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return 'done'
+
+    async def main():
+        return await _StepTimer(
+            work(),
+            clock=lambda: (next(clock), 0.0),
+            on_step=lambda wall, cpu: steps.append(wall),
+        )
+
+    assert asyncio.run(main()) == 'done'
+    assert steps == [1, 1, 1]
+
+
+def test_payload_sizes_are_sampled():
+    assert not ProfilingInterceptor(payload_sample_rate=0).sample_payloads()
+    assert ProfilingInterceptor(payload_sample_rate=1).sample_payloads()
+    assert ProfilingInterceptor().payload_size([{'a': 1}]) > 0
@@ -0,0 +1,170 @@
+"""Readiness probe and GET /api/ready."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from google.protobuf.timestamp_pb2 import Timestamp
+from temporalio.api.taskqueue.v1 import PollerInfo
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueResponse
+
+from app.asgi import AsgiApp
+from app.async_bridge import AsyncBridge
+from app.readiness import ReadinessProbe
+from conftest import FakeClientManager
+from temporal.config import config
+from temporal.workflow_metadata import get_catalog
+
+
+def test_asgi_lifespan_starts_and_stops_the_probe(make_app):
+    app, _ = make_app()
+    app.config['READY_ENABLED'] = True
+    asgi = AsgiApp(app, AsyncBridge('test'))
+    probe = app.extensions['readiness']
+
+    async def main():
+        messages = asyncio.Queue()
+        sent = []
+
+        async def send(message):
+            sent.append(message['type'])
+
+        lifespan = asyncio.ensure_future(
+            asgi({'type': 'lifespan'}, messages.get, send)
+        )
+        await messages.put({'type': 'lifespan.startup'})
+        await asyncio.sleep(0)
+        task = probe._task
+        assert task is not None and not task.done()
+
+        await messages.put({'type': 'lifespan.shutdown'})
+        await lifespan
+        assert task.cancelled()
+        assert probe._task is None
+        return sent
+
+    assert asyncio.run(main()) == [
+        'lifespan.startup.complete', 'lifespan.shutdown.complete'
+    ]
+
+
+class FakeWorkflowService:
+    """Answers DescribeTaskQueue with the pollers set per task queue."""
+
+    def __init__(self, pollers):
+        self.pollers = pollers
+
+    async def describe_task_queue(self, request, timeout=None):
+        return DescribeTaskQueueResponse(
+            pollers=self.pollers.get(request.task_queue.name, [])
+        )
+
+
+class FakeServiceClient:
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+
+    async def check_health(self, timeout=None):
+        if isinstance(self.healthy, Exception):
+            raise self.healthy
+        return self.healthy
+
+
+def _poller(age):
+    last_access_time = Timestamp()
+    last_access_time.FromDatetime(
+        datetime.now(timezone.utc) - timedelta(seconds=age)
+    )
+    return PollerInfo(identity='worker', last_access_time=last_access_time)
+
+
+def _clients(healthy=True, pollers=None):
+    client = SimpleNamespace(
+        service_client=FakeServiceClient(healthy),
+        workflow_service=FakeWorkflowService(pollers or {}),
+    )
+    return FakeClientManager(client)
+
+
+def test_ready_when_every_task_queue_has_a_recent_poller():
+    probe = ReadinessProbe('default', ['a', 'b'], poller_max_age=60)
+    clients = _clients(pollers={
+        'a': [_poller(5)],
+        'b': [_poller(5), _poller(600)],
+    })
+
+    result = asyncio.run(probe.check(clients))
+
+    assert result['ready'] is True
+    assert result['checks']['task_queues'] == {
+        'a': {'ok': True, 'pollers': 1},
+        'b': {'ok': True, 'pollers': 1},
+    }
+
+
+def test_not_ready_without_recent_pollers():
+    probe = ReadinessProbe('default', ['a', 'b'], poller_max_age=60)
+    clients = _clients(pollers={'a': [_poller(5)], 'b': [_poller(600)]})
+
+    result = asyncio.run(probe.check(clients))
+
+    assert result['ready'] is False
+    assert result['checks']['task_queues']['b'] == {'ok': False, 'pollers': 0}
+
+
+def test_unreachable_server_skips_the_task_queues():
+    probe = ReadinessProbe('default', ['a'])
+    clients = _clients(healthy=RuntimeError('connection refused'))
+
+    result = asyncio.run(probe.check(clients))
+
+    assert result['ready'] is False
+    assert result['checks'] == {
+        'server': {'ok': False, 'error': 'connection refused'},
+        'task_queues': {},
+    }
+    assert len(clients.errors) == 1
+
+
+def test_status_goes_stale_after_three_intervals(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('app.readiness.time.monotonic', lambda: now[0])
+    probe = ReadinessProbe('default', ['a'], interval=5)
+
+    assert probe.status()['ready'] is False
+    asyncio.run(probe.check(_clients(pollers={'a': [_poller(5)]})))
+    assert probe.status()['ready'] is True
+
+    now[0] += 16
+    status = probe.status()
+    assert status['ready'] is False
+    assert 'old' in status['reason']
+
+
+def test_default_task_queues_come_from_the_catalog(make_app):
+    app, _ = make_app()
+    queues = {workflow.task_queue for workflow in get_catalog().workflows}
+
+    assert app.extensions['readiness'].task_queues == sorted(queues)
+
+    app, _ = make_app(READY_TASK_QUEUES='cpu, custom')
+    assert app.extensions['readiness'].task_queues == [
+        config.resolve_task_queue('cpu'), 'custom'
+    ]
+
+
+def test_api_ready_serves_the_last_result(make_app):
+    app, _ = make_app()
+    http = app.test_client()
+    probe = app.extensions['readiness']
+
+    response = http.get('/api/ready')
+    assert response.status_code == 503
+    assert response.json['status'] == 'not_ready'
+
+    queues = {queue: [_poller(5)] for queue in probe.task_queues}
+    asyncio.run(probe.check(_clients(pollers=queues)))
+    response = http.get('/api/ready')
+    assert response.status_code == 200
+    assert response.json['status'] == 'ready'
+    assert probe._task is None
@@ -0,0 +1,78 @@
+"""Completed-result cache and its use by the result endpoint."""
+
+import asyncio
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+from temporalio.client import WorkflowExecutionStatus
+
+from app.result_cache import create_result_cache
+
+
+def _completed(run_id):
+    return SimpleNamespace(
+        status=WorkflowExecutionStatus.COMPLETED, run_id=run_id
+    )
+
+
+@pytest.mark.parametrize(
+    'policy', ['ALLOW_DUPLICATE', 'TERMINATE_IF_RUNNING', 'REJECT_DUPLICATE']
+)
+def test_reused_workflow_id_is_not_served_a_stale_result(make_app, policy):
+    app, client = make_app(WORKFLOW_ID_REUSE_POLICY=policy)
+    http = app.test_client()
+    client.descriptions['order-1'] = _completed('run-a')
+    client.results['order-1'] = 'first'
+
+    assert http.get('/api/runs/order-1/result').headers['X-Cache'] == 'MISS'
+    response = http.get('/api/runs/order-1/result')
+    assert response.headers['X-Cache'] == 'HIT'
+    assert response.json['result'] == 'first'
+
+    # Same workflow ID, new run
+    client.descriptions['order-1'] = _completed('run-b')
+    client.results['order-1'] = 'second'
+    response = http.get('/api/runs/order-1/result')
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.json['result'] == 'second'
+
+
+def test_running_run_is_not_cached(make_app):
+    app, client = make_app()
+    client.descriptions['order-1'] = SimpleNamespace(
+        status=WorkflowExecutionStatus.RUNNING, run_id='run-a'
+    )
+
+    response = app.test_client().get('/api/runs/order-1/result')
+
+    assert response.status_code == 202
+    assert app.extensions['result_cache'].size == 0
+
+
+def _disk_cache(make_app, tmp_path):
+    app, _ = make_app(RESULT_CACHE_DISK_PATH=str(tmp_path / 'results.sqlite3'))
+    return create_result_cache(app.config)
+
+
+def test_disk_tier_stores_json(make_app, tmp_path):
+    cache = _disk_cache(make_app, tmp_path)
+    asyncio.run(cache.set('default/order-1/run-a', {'total': 3}))
+    cache.clear()
+
+    assert asyncio.run(cache.get('default/order-1/run-a')) == (
+        True, {'total': 3}
+    )
+    with sqlite3.connect(cache.disk.path) as conn:
+        (raw,) = conn.execute('SELECT value FROM cache').fetchone()
+    assert json.loads(raw) == {'total': 3}
+
+
+def test_non_json_result_is_kept_in_memory_only(make_app, tmp_path):
+    cache = _disk_cache(make_app, tmp_path)
+    asyncio.run(cache.set('default/order-1/run-a', b'\x00raw'))
+
+    assert asyncio.run(cache.get('default/order-1/run-a')) == (True, b'\x00raw')
+    cache.clear()
+    assert asyncio.run(cache.get('default/order-1/run-a')) == (False, None)
@@ -0,0 +1,44 @@
+"""Request spans of the API."""
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from app.tracing import init_tracing
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(trace, 'get_tracer', provider.get_tracer)
+    return exporter
+
+
+def test_streamed_batch_keeps_the_request_span_open(make_app, exporter):
+    app, client = make_app()
+    init_tracing(app)
+    start_workflow = client.start_workflow
+    parents = []
+
+    async def traced_start_workflow(*args, **kwargs):
+        parents.append(trace.get_current_span().get_span_context().span_id)
+        return await start_workflow(*args, **kwargs)
+
+    client.start_workflow = traced_start_workflow
+
+    with app.test_client().post(
+        '/api/workflows/test/run-batch', json=[{}, {}]
+    ) as response:
+        assert exporter.get_finished_spans() == ()
+        assert len(response.get_data().splitlines()) == 2
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == 'POST /api/workflows/<workflow_id>/run-batch'
+    assert span.attributes['http.status_code'] == 200
+    assert parents == [span.context.span_id] * 2
@@ -0,0 +1,114 @@
+"""Search attributes and queries of GET /api/runs."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from temporalio import workflow
+from temporalio.common import SearchAttributeIndexedValueType as ValueType
+
+from app.visibility import (
+    MAX_KEYWORD_BYTES,
+    SearchAttributeRegistry,
+    build_query,
+    start_search_attributes,
+)
+from temporal.workflow_metadata import WorkflowMetadata, compile_binding_plan
+
+
+@workflow.defn(name='Signup', sandboxed=False)
+class SignupWorkflow:
+    @workflow.run
+    async def run(self, plan: str, seats: int, email: str) -> None:
+        pass
+
+
+PARAMETERS = [
+    {'name': 'plan', 'type': 'string', 'searchable': True},
+    {'name': 'seats', 'type': 'integer', 'searchable': True},
+    {'name': 'email', 'type': 'email'},
+]
+
+META = WorkflowMetadata(
+    id='signup',
+    name='Signup',
+    description='',
+    workflow_class=SignupWorkflow,
+    parameters=PARAMETERS,
+    workflow_type='Signup',
+    binding=compile_binding_plan(SignupWorkflow, PARAMETERS),
+)
+
+AVAILABLE = {
+    'CatalogWorkflowId': ValueType.KEYWORD,
+    'Param_plan': ValueType.KEYWORD,
+    'Param_seats': ValueType.INT,
+}
+
+
+def _attributes(args, available=AVAILABLE):
+    attributes = start_search_attributes(META, args, available)
+    return {pair.key.name: pair.value for pair in attributes or ()}
+
+
+def test_only_opted_in_parameters_are_indexed():
+    assert _attributes(['pro', 3, 'a@example.com']) == {
+        'CatalogWorkflowId': 'signup',
+        'Param_plan': 'pro',
+        'Param_seats': 3,
+    }
+
+
+def test_oversized_keyword_is_skipped():
+    attributes = _attributes(['x' * (MAX_KEYWORD_BYTES + 1), 3, ''])
+    assert 'Param_plan' not in attributes
+    assert attributes['Param_seats'] == 3
+
+
+def test_attribute_with_another_server_type_is_skipped():
+    available = {**AVAILABLE, 'Param_seats': ValueType.KEYWORD}
+    assert 'Param_seats' not in _attributes(['pro', 3, ''], available)
+
+
+def test_query_falls_back_to_workflow_type():
+    assert build_query({}, META) == "WorkflowType = 'Signup'"
+    assert build_query(AVAILABLE, META, parameters={'seats': '3'}) == (
+        "CatalogWorkflowId = 'signup' AND Param_seats = 3"
+    )
+    with pytest.raises(ValueError):
+        build_query(AVAILABLE, META, parameters={'email': 'a@example.com'})
+
+
+class _OperatorService:
+    def __init__(self, known):
+        self.known = dict(known)
+        self.added = []
+
+    async def list_search_attributes(self, request):
+        return SimpleNamespace(
+            system_attributes={}, custom_attributes=dict(self.known)
+        )
+
+    async def add_search_attributes(self, request):
+        self.added.extend(request.search_attributes)
+        self.known.update(request.search_attributes)
+
+
+def test_available_never_registers_attributes():
+    service = _OperatorService({})
+    client = SimpleNamespace(operator_service=service)
+    registry = SearchAttributeRegistry('default')
+
+    assert asyncio.run(registry.available(client)) == {}
+    assert service.added == []
+
+
+def test_register_adds_missing_attributes():
+    service = _OperatorService({'CatalogWorkflowId': int(ValueType.KEYWORD)})
+    client = SimpleNamespace(operator_service=service)
+    registry = SearchAttributeRegistry('default')
+
+    available = asyncio.run(registry.register(client))
+
+    assert 'CatalogWorkflowId' not in service.added
+    assert available['CatalogWorkflowId'] == ValueType.KEYWORD
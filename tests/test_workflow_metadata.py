@@ -0,0 +1,81 @@
+"""Parameter binding plans compiled at workflow registration."""
+
+import pytest
+
+from temporal.workflow_metadata import ParameterError, compile_binding_plan
+
+
+class OrderWorkflow:
+    async def run(
+        self,
+        customer: str,
+        quantity: int = 1,
+        gift: bool = False,
+        priority: str = 'normal',
+    ) -> str:
+        ...
+
+
+PARAMETERS = [
+    {'name': 'customer', 'type': 'email', 'required': True},
+    {'name': 'gift', 'type': 'boolean', 'default': 'yes'},
+    {'name': 'quantity', 'type': 'integer', 'min': 1, 'max': 10},
+]
+
+
+@pytest.fixture
+def plan():
+    return compile_binding_plan(OrderWorkflow, PARAMETERS)
+
+
+def test_arguments_follow_the_run_signature(plan):
+    assert [binding.name for binding in plan.bindings] == [
+        'customer', 'quantity', 'gift'
+    ]
+    assert plan.bind({'customer': 'a@example.com', 'quantity': '3'}) == [
+        'a@example.com', 3, True
+    ]
+
+
+def test_declared_defaults_are_coerced_once(plan):
+    gift = plan.bindings[2]
+    assert gift.default is True
+
+
+@pytest.mark.parametrize('data, message', [
+    ({}, 'Required parameter "customer" is missing'),
+    ({'customer': 'nobody'}, 'must be an email address'),
+    ({'customer': 'a@example.com', 'quantity': 11}, 'at most 10'),
+    ({'customer': 'a@example.com', 'quantity': 1.5}, 'must be an integer'),
+    ({'customer': 'a@example.com', 'gift': 'maybe'}, 'must be a boolean'),
+])
+def test_invalid_requests_are_rejected(plan, data, message):
+    with pytest.raises(ParameterError, match=message):
+        plan.bind(data)
+
+
+def test_undeclared_argument_between_declared_ones_keeps_its_default():
+    plan = compile_binding_plan(OrderWorkflow, [
+        {'name': 'customer', 'required': True},
+        {'name': 'gift', 'type': 'boolean'},
+    ])
+
+    assert plan.bind({'customer': 'c', 'quantity': 5, 'gift': 1}) == [
+        'c', 1, True
+    ]
+
+
+@pytest.mark.parametrize('value', ['5', True, [1]])
+def test_bounds_reject_values_that_are_not_numbers(value):
+    plan = compile_binding_plan(OrderWorkflow, [
+        {'name': 'customer', 'required': True},
+        {'name': 'quantity', 'min': 1},
+    ])
+
+    with pytest.raises(ParameterError, match='must be a number'):
+        plan.bind({'customer': 'c', 'quantity': value})
+
+
+def test_parameters_must_match_the_signature():
+    with pytest.raises(ValueError, match='not positional arguments'):
+        compile_binding_plan(OrderWorkflow, [{'name': 'coupon'}])